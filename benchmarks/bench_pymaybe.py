@@ -0,0 +1,813 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+bench_pymaybe
+----------------------------------
+
+Micro benchmarks for the `pymaybe` hot paths, measured against hand-written
+``try/except`` and ``dict.get`` baselines on a synthetic nested-JSON corpus.
+
+    python benchmarks/bench_pymaybe.py --output results.json
+    python benchmarks/bench_pymaybe.py --baseline results.json --threshold 10
+
+Results are written as JSON (nanoseconds per record). When ``--baseline`` is
+given, every tracked (non ``baseline.``) benchmark that got slower by more than
+``--threshold`` percent is reported and the script exits with status 1.
+"""
+
+from __future__ import print_function
+
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import timeit
+from collections import OrderedDict
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import pymaybe  # noqa: E402
+from pymaybe import maybe  # noqa: E402
+
+BENCHMARKS = OrderedDict()
+
+
+def benchmark(name):
+    """Registers a benchmark. The decorated function receives the Corpus and
+    returns a zero-argument callable that processes every record once."""
+    def decorator(fn):
+        BENCHMARKS[name] = fn
+        return fn
+
+    return decorator
+
+
+# region Corpus
+
+class Node(object):
+    def __init__(self, **attrs):
+        self.__dict__.update(attrs)
+
+
+class Corpus(object):
+    """Nested records where each key path is ``k0.k1...k{depth-1}``.
+
+    ``hits`` contain the full path, ``misses`` are cut at a random level and
+    ``mixed`` contains misses at the configured missing-key rate.
+    """
+
+    def __init__(self, records=1000, depth=6, missing_rate=0.4, seed=0):
+        rnd = random.Random(seed)
+        self.depth = depth
+        self.keys = ['k%d' % i for i in range(depth)]
+        self.hits = [self._build(i, depth) for i in range(records)]
+        self.misses = [self._build(i, rnd.randrange(depth)) for i in range(records)]
+        self.mixed = [self._build(i, rnd.randrange(depth) if rnd.random() < missing_rate else depth)
+                      for i in range(records)]
+        self.obj_hits = [self._build_obj(i, depth) for i in range(records)]
+        self.obj_misses = [self._build_obj(i, rnd.randrange(depth)) for i in range(records)]
+        self.values = [rnd.randrange(1, 1000) for _ in range(records)]
+        self.optionals = [v if rnd.random() >= missing_rate else None for v in self.values]
+
+    def _build(self, value, levels):
+        """Builds a record whose key path stops after `levels` levels."""
+        record = {'payload': 'x' * 16, 'id': value}
+        for key in reversed(self.keys[:levels]):
+            record = {key: record, 'other': value}
+        return record
+
+    def _build_obj(self, value, levels):
+        node = Node(payload='x' * 16, id=value)
+        for key in reversed(self.keys[:levels]):
+            node = Node(**{key: node, 'other': value})
+        return node
+
+# endregion
+
+
+# region Construction
+
+@benchmark('construct.maybe_value')
+def bench_construct_value(corpus):
+    values = corpus.values
+
+    def run():
+        for v in values:
+            maybe(v)
+
+    return run
+
+
+@benchmark('construct.maybe_none')
+def bench_construct_none(corpus):
+    values = [None] * len(corpus.values)
+
+    def run():
+        for v in values:
+            maybe(v)
+
+    return run
+
+
+@benchmark('construct.maybe_value.interned')
+def bench_construct_value_interned(corpus):
+    from pymaybe import disable_interning, enable_interning
+    values = corpus.values
+
+    def run():
+        # Results are kept alive, as in a dedup pass, so repeated values hit the table.
+        enable_interning()
+        try:
+            return [maybe(v) for v in values]
+        finally:
+            disable_interning()
+
+    return run
+
+
+@benchmark('construct.dedup_set')
+def bench_construct_dedup_set(corpus):
+    wrapped = [maybe(v) for v in corpus.optionals]
+
+    def run():
+        set(wrapped)
+
+    return run
+
+# endregion
+
+
+# region Item chains
+
+def _getitem_chain(records, keys):
+    def run():
+        for rec in records:
+            m = maybe(rec)
+            for k in keys:
+                m = m[k]
+            m.or_none()
+
+    return run
+
+
+def _getitem_try_except(records, keys):
+    def run():
+        for rec in records:
+            try:
+                v = rec
+                for k in keys:
+                    v = v[k]
+            except (KeyError, TypeError, IndexError):
+                v = None
+
+    return run
+
+
+def _getitem_dict_get(records, keys):
+    def run():
+        for rec in records:
+            v = rec
+            for k in keys:
+                v = v.get(k)
+                if v is None:
+                    break
+
+    return run
+
+
+@benchmark('getitem.hit')
+def bench_getitem_hit(corpus):
+    return _getitem_chain(corpus.hits, corpus.keys)
+
+
+@benchmark('getitem.miss')
+def bench_getitem_miss(corpus):
+    return _getitem_chain(corpus.misses, corpus.keys)
+
+
+@benchmark('getitem.mixed')
+def bench_getitem_mixed(corpus):
+    return _getitem_chain(corpus.mixed, corpus.keys)
+
+
+@benchmark('baseline.getitem.try_except.hit')
+def bench_baseline_try_hit(corpus):
+    return _getitem_try_except(corpus.hits, corpus.keys)
+
+
+@benchmark('baseline.getitem.try_except.miss')
+def bench_baseline_try_miss(corpus):
+    return _getitem_try_except(corpus.misses, corpus.keys)
+
+
+@benchmark('baseline.getitem.dict_get.hit')
+def bench_baseline_get_hit(corpus):
+    return _getitem_dict_get(corpus.hits, corpus.keys)
+
+
+@benchmark('baseline.getitem.dict_get.miss')
+def bench_baseline_get_miss(corpus):
+    return _getitem_dict_get(corpus.misses, corpus.keys)
+
+
+def _slice_frames(payload, frames, frame_size):
+    for i in range(frames):
+        frame = payload[i * frame_size:(i + 1) * frame_size]
+        frame[0:16].or_none()
+
+
+@benchmark('getitem.slice.bytes')
+def bench_getitem_slice_bytes(corpus):
+    # One 16KiB frame per record, cut out of a single large payload.
+    frame_size = 1 << 14
+    payload = maybe(b'x' * (frame_size * len(corpus.values)))
+    frames = len(corpus.values)
+
+    def run():
+        _slice_frames(payload, frames, frame_size)
+
+    return run
+
+
+@benchmark('getitem.slice.view')
+def bench_getitem_slice_view(corpus):
+    from pymaybe import maybe_view
+    frame_size = 1 << 14
+    payload = maybe_view(b'x' * (frame_size * len(corpus.values)))
+    frames = len(corpus.values)
+
+    def run():
+        _slice_frames(payload, frames, frame_size)
+
+    return run
+
+
+@benchmark('getitem.index.hit')
+def bench_getitem_index_hit(corpus):
+    wrapped = [maybe([v, v]) for v in corpus.values]
+
+    def run():
+        for m in wrapped:
+            m[1]
+
+    return run
+
+
+@benchmark('getitem.index.miss')
+def bench_getitem_index_miss(corpus):
+    wrapped = [maybe([v, v]) for v in corpus.values]
+
+    def run():
+        for m in wrapped:
+            m[5]
+
+    return run
+
+# endregion
+
+
+# region Compiled paths
+
+def _path_lookup(records, keys):
+    from pymaybe import maybe_path
+    get = maybe_path('.'.join(keys))
+
+    def run():
+        for rec in records:
+            get(rec)
+
+    return run
+
+
+@benchmark('paths.hit')
+def bench_paths_hit(corpus):
+    return _path_lookup(corpus.hits, corpus.keys)
+
+
+@benchmark('paths.miss')
+def bench_paths_miss(corpus):
+    return _path_lookup(corpus.misses, corpus.keys)
+
+
+@benchmark('index.mixed')
+def bench_index_mixed(corpus):
+    from pymaybe import MaybeIndex
+    doc = {'records': corpus.mixed}
+    index = MaybeIndex(doc)
+    paths = [('records', i) + tuple(corpus.keys) for i in range(len(corpus.mixed))]
+
+    def run():
+        for path in paths:
+            index.get(path)
+
+    return run
+
+
+def _schema_fields(corpus):
+    # Several fields share the k0..k{depth-2} prefix, as in a typical record schema.
+    prefix = tuple(corpus.keys)
+    return [
+        ('id', prefix + ('id',), 0),
+        ('payload', prefix + ('payload',), ''),
+        ('other', prefix[:-1] + ('other',), 0),
+        ('missing', prefix + ('missing',), None),
+    ]
+
+
+@benchmark('schema.compiled')
+def bench_schema_compiled(corpus):
+    from pymaybe import compile_schema
+    extract = compile_schema(_schema_fields(corpus))
+    records = corpus.mixed
+
+    def run():
+        for record in records:
+            extract(record)
+
+    return run
+
+
+@benchmark('schema.per_field_chains')
+def bench_schema_per_field_chains(corpus):
+    fields = _schema_fields(corpus)
+    records = corpus.mixed
+
+    def run():
+        for record in records:
+            row = []
+            for _, path, default in fields:
+                value = maybe(record)
+                for key in path:
+                    value = value[key]
+                row.append(value.or_else(default))
+
+    return run
+
+
+def _three_hop_chain(record, k0, k1, k2):
+    return maybe(record)[k0][k1][k2].or_none()
+
+
+@benchmark('chains.dynamic.mixed')
+def bench_chains_dynamic(corpus):
+    records = corpus.mixed
+    keys = (corpus.keys * 3)[:3]
+
+    def run():
+        for record in records:
+            _three_hop_chain(record, *keys)
+
+    return run
+
+
+@benchmark('chains.rewritten.mixed')
+def bench_chains_rewritten(corpus):
+    from pymaybe import maybe_chains
+    lookup = maybe_chains(_three_hop_chain)
+    records = corpus.mixed
+    keys = (corpus.keys * 3)[:3]
+
+    def run():
+        for record in records:
+            lookup(record, *keys)
+
+    return run
+
+
+@benchmark('metrics.paths.mixed.enabled')
+def bench_paths_metrics_enabled(corpus):
+    from pymaybe import disable_metrics, enable_metrics
+    run = _path_lookup(corpus.mixed, corpus.keys)
+
+    def run_with_metrics():
+        enable_metrics()
+        try:
+            run()
+        finally:
+            disable_metrics()
+
+    return run_with_metrics
+
+
+@benchmark('metrics.paths.mixed.disabled')
+def bench_paths_metrics_disabled(corpus):
+    return _path_lookup(corpus.mixed, corpus.keys)
+
+# endregion
+
+
+# region Attribute chains
+
+def _getattr_chain(records, keys):
+    def run():
+        for rec in records:
+            m = maybe(rec)
+            for k in keys:
+                m = getattr(m, k)
+            m.or_none()
+
+    return run
+
+
+def _getattr_try_except(records, keys):
+    def run():
+        for rec in records:
+            try:
+                v = rec
+                for k in keys:
+                    v = getattr(v, k)
+            except AttributeError:
+                v = None
+
+    return run
+
+
+def _getattr_default(records, keys):
+    def run():
+        for rec in records:
+            v = rec
+            for k in keys:
+                v = getattr(v, k, None)
+                if v is None:
+                    break
+
+    return run
+
+
+@benchmark('getattr.hit')
+def bench_getattr_hit(corpus):
+    return _getattr_chain(corpus.obj_hits, corpus.keys)
+
+
+@benchmark('getattr.miss')
+def bench_getattr_miss(corpus):
+    return _getattr_chain(corpus.obj_misses, corpus.keys)
+
+
+@benchmark('getattr.repeated_names')
+def bench_getattr_repeated_names(corpus):
+    names = ['payload', 'id', 'missing'] * 4
+    wrapped = [maybe(node) for node in corpus.obj_hits]
+
+    def run():
+        for m in wrapped:
+            inner = m.k0.k1
+            for name in names:
+                getattr(inner, name)
+
+    return run
+
+
+class Invoice(object):
+    def __init__(self, lines):
+        self.lines = lines
+
+    @property
+    def total(self):
+        return sum(self.lines)
+
+
+def _read_totals(wrapped, reads):
+    # A template touching the same derived field several times per record.
+    for m in wrapped:
+        for _ in range(reads):
+            m.total.or_else(0)
+
+
+@benchmark('getattr.property.repeated')
+def bench_getattr_property_repeated(corpus):
+    wrapped = [maybe(Invoice(corpus.values[:32])) for _ in corpus.values]
+
+    def run():
+        _read_totals(wrapped, 4)
+
+    return run
+
+
+@benchmark('getattr.property.memoized')
+def bench_getattr_property_memoized(corpus):
+    wrapped = [maybe(Invoice(corpus.values[:32]), memoize=True) for _ in corpus.values]
+
+    def run():
+        _read_totals(wrapped, 4)
+
+    return run
+
+
+@benchmark('baseline.getattr.try_except.hit')
+def bench_baseline_getattr_try_hit(corpus):
+    return _getattr_try_except(corpus.obj_hits, corpus.keys)
+
+
+@benchmark('baseline.getattr.try_except.miss')
+def bench_baseline_getattr_try_miss(corpus):
+    return _getattr_try_except(corpus.obj_misses, corpus.keys)
+
+
+@benchmark('baseline.getattr.default.miss')
+def bench_baseline_getattr_default_miss(corpus):
+    return _getattr_default(corpus.obj_misses, corpus.keys)
+
+# endregion
+
+
+# region or_else
+
+@benchmark('or_else.value')
+def bench_or_else_value(corpus):
+    wrapped = [maybe(v) for v in corpus.optionals]
+
+    def run():
+        for m in wrapped:
+            m.or_else(0)
+
+    return run
+
+
+@benchmark('or_else.callable')
+def bench_or_else_callable(corpus):
+    wrapped = [maybe(v) for v in corpus.optionals]
+    default = lambda: 0  # noqa: E731
+
+    def run():
+        for m in wrapped:
+            m.or_else(default)
+
+    return run
+
+
+@benchmark('baseline.or_else.conditional')
+def bench_baseline_or_else(corpus):
+    values = corpus.optionals
+
+    def run():
+        for v in values:
+            v if v is not None else 0
+
+    return run
+
+
+@benchmark('or_else.comprehension.mapped')
+def bench_or_else_comprehension_mapped(corpus):
+    values = corpus.optionals
+    fn = lambda v: None if v is None else v + 1  # noqa: E731
+
+    def run():
+        [maybe(fn(v)).or_else(0) for v in values]
+
+    return run
+
+
+@benchmark('or_else.stream.mapped')
+def bench_or_else_stream_mapped(corpus):
+    from pymaybe import MaybeStream
+    values = corpus.optionals
+    fn = lambda v: v + 1  # noqa: E731
+
+    def run():
+        for _ in MaybeStream(values).map(fn).or_else(0):
+            pass
+
+    return run
+
+
+@benchmark('or_else.maybe_list')
+def bench_or_else_maybe_list(corpus):
+    from pymaybe import MaybeList
+    column = MaybeList(corpus.optionals, typecode='q')
+
+    def run():
+        # The whole column is filled in one call; run() processes every record once.
+        column.or_else(0)
+
+    return run
+
+# endregion
+
+
+# region Arithmetic & comparisons
+
+@benchmark('arithmetic.add')
+def bench_add(corpus):
+    wrapped = [maybe(v) for v in corpus.values]
+
+    def run():
+        for m in wrapped:
+            m + 1
+
+    return run
+
+
+@benchmark('arithmetic.mul')
+def bench_mul(corpus):
+    wrapped = [maybe(v) for v in corpus.values]
+
+    def run():
+        for m in wrapped:
+            m * 2
+
+    return run
+
+
+@benchmark('arithmetic.radd')
+def bench_radd(corpus):
+    wrapped = [maybe(v) for v in corpus.values]
+
+    def run():
+        for m in wrapped:
+            1 + m
+
+    return run
+
+
+@benchmark('compare.lt_value')
+def bench_lt(corpus):
+    wrapped = [maybe(v) for v in corpus.values]
+
+    def run():
+        for m in wrapped:
+            m < 500
+
+    return run
+
+
+@benchmark('compare.eq_maybe')
+def bench_eq(corpus):
+    wrapped = [maybe(v) for v in corpus.optionals]
+    other = maybe(500)
+
+    def run():
+        for m in wrapped:
+            m == other
+
+    return run
+
+
+@benchmark('sort.maybes.dunder')
+def bench_sort_dunder(corpus):
+    wrapped = [maybe(v) for v in corpus.optionals]
+
+    def run():
+        sorted(wrapped)
+
+    return run
+
+
+@benchmark('sort.maybes.key')
+def bench_sort_key(corpus):
+    from pymaybe import sort_maybes
+    wrapped = [maybe(v) for v in corpus.optionals]
+
+    def run():
+        sort_maybes(wrapped)
+
+    return run
+
+
+@benchmark('baseline.arithmetic.add')
+def bench_baseline_add(corpus):
+    values = corpus.values
+
+    def run():
+        for v in values:
+            v + 1
+
+    return run
+
+# endregion
+
+
+# region Serialization
+
+@benchmark('pickle.roundtrip')
+def bench_pickle_roundtrip(corpus):
+    import pickle
+    wrapped = [maybe(v) for v in corpus.optionals]
+
+    def run():
+        pickle.loads(pickle.dumps(wrapped, pickle.HIGHEST_PROTOCOL))
+
+    return run
+
+
+@benchmark('copy.deepcopy')
+def bench_deepcopy(corpus):
+    import copy
+    wrapped = [maybe(v) for v in corpus.optionals]
+
+    def run():
+        copy.deepcopy(wrapped)
+
+    return run
+
+
+def _json_document(corpus):
+    # A small header followed by every record, as in a typical API response.
+    return json.dumps({'meta': {'count': len(corpus.mixed), 'source': 'bench'}, 'records': corpus.mixed})
+
+
+@benchmark('json.loads.header')
+def bench_json_loads_header(corpus):
+    document = _json_document(corpus)
+
+    def run():
+        maybe(json.loads(document))['meta']['count'].or_else(0)
+
+    return run
+
+
+@benchmark('json.lazy.header')
+def bench_json_lazy_header(corpus):
+    from pymaybe import lazy_json
+    document = _json_document(corpus)
+
+    def run():
+        maybe(lazy_json(document))['meta']['count'].or_else(0)
+
+    return run
+
+# endregion
+
+
+def run_benchmarks(corpus, names, number=5, repeat=5):
+    results = OrderedDict()
+    records = len(corpus.values)
+    for name in names:
+        fn = BENCHMARKS[name](corpus)
+        best = min(timeit.repeat(fn, number=number, repeat=repeat))
+        results[name] = {'ns_per_op': best / (number * records) * 1e9}
+
+    return results
+
+
+def find_regressions(results, baseline, threshold):
+    """Returns (name, old, new, percent) for tracked benchmarks slower than threshold percent."""
+    regressions = []
+    for name, result in results.items():
+        if name.startswith('baseline.') or name not in baseline:
+            continue
+
+        old = baseline[name]['ns_per_op']
+        new = result['ns_per_op']
+        percent = (new - old) / old * 100.0
+        if percent > threshold:
+            regressions.append((name, old, new, percent))
+
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark pymaybe hot paths.')
+    parser.add_argument('--records', type=int, default=2000)
+    parser.add_argument('--depth', type=int, default=6)
+    parser.add_argument('--missing-rate', type=float, default=0.4)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--number', type=int, default=5, help='corpus passes per timing')
+    parser.add_argument('--repeat', type=int, default=5, help='timings per benchmark (best is kept)')
+    parser.add_argument('--filter', default='', help='only run benchmarks whose name contains this')
+    parser.add_argument('--output', help='write JSON results to this file')
+    parser.add_argument('--baseline', help='JSON results to compare against')
+    parser.add_argument('--threshold', type=float, default=10.0, help='allowed slowdown in percent')
+    args = parser.parse_args(argv)
+
+    corpus = Corpus(records=args.records, depth=args.depth, missing_rate=args.missing_rate, seed=args.seed)
+    names = [name for name in BENCHMARKS if args.filter in name]
+    results = run_benchmarks(corpus, names, number=args.number, repeat=args.repeat)
+
+    report = OrderedDict([
+        ('python', platform.python_version()),
+        ('implementation', platform.python_implementation()),
+        ('pymaybe', pymaybe.__version__),
+        ('params', OrderedDict([
+            ('records', args.records), ('depth', args.depth), ('missing_rate', args.missing_rate),
+            ('seed', args.seed), ('number', args.number), ('repeat', args.repeat),
+        ])),
+        ('results', results),
+    ])
+
+    for name, result in results.items():
+        print('%-40s %10.1f ns' % (name, result['ns_per_op']))
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)['results']
+
+        regressions = find_regressions(results, baseline, args.threshold)
+        for name, old, new, percent in regressions:
+            print('REGRESSION %s: %.1f ns -> %.1f ns (+%.1f%%)' % (name, old, new, percent), file=sys.stderr)
+
+        if regressions:
+            return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
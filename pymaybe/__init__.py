@@ -4,23 +4,51 @@ __author__ = 'Eran Kampf'
 __email__ = 'eran@ekampf.com'
 __version__ = '0.2.0'
 
-from sys import getsizeof
+from copy import copy as _shallow_copy, deepcopy
+from operator import iadd, iand, ifloordiv, ilshift, imod, imul, ior, ipow, irshift, isub, ixor
+from sys import getsizeof, version_info
+
+try:
+    from pickle import PickleBuffer
+except ImportError:  # pragma: no cover
+    PickleBuffer = None
+
+_SEQUENCE_TYPES = frozenset([list, tuple, str, bytes])
+
 
 class NothingValueError(ValueError):
     pass
 
 class Maybe(object):
-    pass
+    __slots__ = ()
 
 
 class Nothing(Maybe):
+    """The empty Maybe. Nothing() always returns the process-wide NOTHING
+    instance, so ``value is NOTHING`` is the fastest way to test for it
+    unless provenance tracking (see ``pymaybe.tracing``) is enabled."""
+
+    __slots__ = ()
+
+    def __new__(cls):
+        return NOTHING
+
+    def __reduce__(self):
+        return Nothing, ()
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
     def is_some(self):
         return False
 
     def is_none(self):
         return True
 
-    def get(self):
+    def get(self, copy=False):
         raise NothingValueError('No such element')
 
     def or_else(self, els=None):
@@ -36,18 +64,18 @@ class Nothing(Maybe):
         return self.or_else([])
 
     def __call__(self, *args, **kwargs):
-        return Nothing()
+        return self
 
     # region Comparison
 
     def __cmp__(self, other):
-        if other.__class__ == Nothing:
+        if isinstance(other, Nothing):
             return 0
 
         return -1
 
     def __eq__(self, other):
-        if other.__class__ == Nothing:
+        if isinstance(other, Nothing):
             return True
 
         if other is None:
@@ -58,11 +86,15 @@ class Nothing(Maybe):
     def __ne__(self, other):
         return not self.__eq__(other)
 
+    def __hash__(self):
+        # Nothing == None, so they must hash alike.
+        return _NONE_HASH
+
     def __lt__(self, other):
-        if other.__class__ == Nothing:
+        if isinstance(other, Nothing):
             return False
 
-        if other.__class__ == Something:
+        if other.__class__ is Something:
             return True
 
         return True if other else False
@@ -74,7 +106,7 @@ class Nothing(Maybe):
         return True
 
     def __ge__(self, other):
-        if other.__class__ == Nothing:
+        if isinstance(other, Nothing):
             return True
 
         if other is None:
@@ -85,14 +117,19 @@ class Nothing(Maybe):
     # endregion
 
     def __getattr__(self, name):
-        return Nothing()
+        # Protocol lookups such as __wrapped__ (inspect.unwrap) must miss, or
+        # they would see Nothing wrapping itself.
+        if name.startswith('__') and name.endswith('__'):
+            raise AttributeError(name)
+
+        return self
 
     # region Dict
     def __len__(self):
         return 0
 
     def __getitem__(self, key):
-        return Nothing()
+        return self
 
     def __setitem__(self, key, value):
         pass
@@ -118,28 +155,55 @@ class Nothing(Maybe):
     # endregion
 
 
+NOTHING = object.__new__(Nothing)
+
+
 class Something(Maybe):
+    __slots__ = ('__value', '__hash', '__weakref__')
+
     def __init__(self, value):
-        self.__value = value
+        _set_value(self, value)
+
+    def __reduce__(self):
+        return Something, (self.__value,)
+
+    def __reduce_ex__(self, protocol):
+        # Defined explicitly so pickle never reaches __getattr__, and so that
+        # bytes-like values can travel as protocol 5 out-of-band buffers.
+        value = self.__value
+        if protocol >= 5 and value.__class__ in _BUFFER_TYPES and PickleBuffer is not None:
+            if value.__class__ is not memoryview:
+                return _rebuild_buffer, (PickleBuffer(value), value.__class__)
+
+            if value.c_contiguous:
+                return _rebuild_buffer, (PickleBuffer(value), memoryview, value.format, value.shape)
+
+        return Something, (value,)
+
+    def __copy__(self):
+        return Something(self.__value)
+
+    def __deepcopy__(self, memo):
+        return Something(deepcopy(self.__value, memo))
 
     def __call__(self, *args, **kwargs):
         return maybe(self.__value(*args, **kwargs))
 
     # region Comparison
     def __cmp__(self, other):
-        if other.__class__ == Nothing:
+        if isinstance(other, Nothing):
             return 1
 
-        if other.__class__ == Something:
+        if other.__class__ is Something:
             return cmp(self.get(), other.get())
         else:
             return cmp(self.get(), other)
 
     def __eq__(self, other):
-        if other.__class__ == Nothing:
+        if isinstance(other, Nothing):
             return False
 
-        if other.__class__ == Something:
+        if other.__class__ is Something:
             return self.get() == other.get()
 
         return self.get() == other
@@ -147,38 +211,47 @@ class Something(Maybe):
     def __ne__(self, other):
         return not self.__eq__(other)
 
+    def __hash__(self):
+        # Something(x) == x, so the hash is the value's, computed once.
+        try:
+            return _get_hash(self)
+        except AttributeError:
+            value_hash = hash(self.__value)
+            _set_hash(self, value_hash)
+            return value_hash
+
     def __lt__(self, other):
-        if other.__class__ == Nothing:
+        if isinstance(other, Nothing):
             return False
 
-        if other.__class__ == Something:
+        if other.__class__ is Something:
             return self.get() < other.get()
 
         return self.get() < other
 
     def __gt__(self, other):
-        if other.__class__ == Nothing:
+        if isinstance(other, Nothing):
             return True
 
-        if other.__class__ == Something:
+        if other.__class__ is Something:
             return self.get() > other.get()
 
         return self.get() > other
 
     def __le__(self, other):
-        if other.__class__ == Nothing:
+        if isinstance(other, Nothing):
             return False
 
-        if other.__class__ == Something:
+        if other.__class__ is Something:
             return self.get() <= other.get()
 
         return self.get() <= other
 
     def __ge__(self, other):
-        if other.__class__ == Nothing:
+        if isinstance(other, Nothing):
             return True
 
-        if other.__class__ == Something:
+        if other.__class__ is Something:
             return self.get() >= other.get()
 
         return self.get() >= other
@@ -190,7 +263,13 @@ class Something(Maybe):
     def is_none(self):
         return False
 
-    def get(self):
+    def get(self, copy=False):
+        """Returns the wrapped value. With copy=True a memoryview is
+        materialized as bytes and any other value is shallow-copied."""
+        if copy:
+            value = self.__value
+            return value.tobytes() if value.__class__ is memoryview else _shallow_copy(value)
+
         return self.__value
 
     # pylint: disable=W0613
@@ -204,15 +283,26 @@ class Something(Maybe):
         return self.or_else([])
 
     def __getattr__(self, name):
+        # getattr with a default resolves plain misses without raising, and
+        # CPython's per-type attribute cache (invalidated whenever a class is
+        # mutated) already remembers where name lives on the value's type.
         try:
-            return maybe(getattr(self.__value, name))
-        except Exception:
-            return Nothing()
+            value = getattr(self.__value, name, None)
+        except Exception as e:
+            if _metrics.active:
+                _metrics.record_swallowed('getattr', e)
+            if _tracing.enabled:
+                return _tracing.trace('getattr', name, e.__class__)
+            return NOTHING
 
-    def __setattr__(self, name, v):
-        if name == "_Something__value":
-            return super(Something, self).__setattr__(name, v)
+        if value is None:
+            if _tracing.enabled:
+                return _tracing.trace('getattr', name, None)
+            return NOTHING
 
+        return maybe(value)
+
+    def __setattr__(self, name, v):
         return setattr(self.__value, name, v)
 
     # region Containers Methods
@@ -221,10 +311,35 @@ class Something(Maybe):
         return len(self.__value)
 
     def __getitem__(self, key):
+        value = self.__value
+        klass = value.__class__
+        error = None
         try:
-            return maybe(self.__value[key])
-        except (KeyError, TypeError, IndexError):
-            return Nothing()
+            # Resolve misses on the common containers without raising
+            if klass is dict:
+                result = value.get(key)
+            elif klass in _SEQUENCE_TYPES and key.__class__ is int:
+                if -len(value) <= key < len(value):
+                    result = value[key]
+                else:
+                    result = None
+                    error = IndexError
+            else:
+                result = _subscript(value, key)
+        except (KeyError, TypeError, IndexError) as e:
+            if _metrics.active:
+                _metrics.record_swallowed('getitem', e)
+            result = None
+            error = e.__class__
+
+        if result is None:
+            if _tracing.enabled:
+                if error is None and klass is dict and key not in value:
+                    error = KeyError
+                return _tracing.trace('getitem', key, error)
+            return NOTHING
+
+        return maybe(result)
 
     def __setitem__(self, key, value):
         self.__value[key] = value
@@ -408,69 +523,131 @@ class Something(Maybe):
 
     def __iadd__(self, other):
         """Implements addition with assignment."""
-        self.__value += other
-        return self
+        return _assign(self, iadd(self.__value, other))
 
     def __isub__(self, other):
         """Implements subtraction with assignment."""
-        self.__value -= other
-        return self
+        return _assign(self, isub(self.__value, other))
 
     def __imul__(self, other):
         """Implements multiplication with assignment."""
-        self.__value *= other
-        return self
+        return _assign(self, imul(self.__value, other))
 
     def __ifloordiv__(self, other):
         """Implements integer division with assignment using the //= operator."""
-        self.__value //= other
-        return self
+        return _assign(self, ifloordiv(self.__value, other))
 
     def __idiv__(self, other):
         """Implements division with assignment using the /= operator."""
-        self.__value /= other
-        return self
+        value = self.__value
+        value /= other
+        return _assign(self, value)
 
     def __imod__(self, other):
         """Implements modulo with assignment using the %= operator."""
-        self.__value %= other
-        return self
+        return _assign(self, imod(self.__value, other))
 
     def __ipow__(self, other):
         """Implements behavior for exponents with assignment using the **= operator."""
-        self.__value **= other
-        return self
+        return _assign(self, ipow(self.__value, other))
 
     def __ilshift__(self, other):
         """Implements left bitwise shift with assignment using the <<= operator."""
-        self.__value <<= other
-        return self
+        return _assign(self, ilshift(self.__value, other))
 
     def __irshift__(self, other):
         """Implements right bitwise shift with assignment using the >>= operator."""
-        self.__value >>= other
-        return self
+        return _assign(self, irshift(self.__value, other))
 
     def __iand__(self, other):
         """Implements bitwise and with assignment using the &= operator."""
-        self.__value &= other
-        return self
+        return _assign(self, iand(self.__value, other))
 
     def __ior__(self, other):
         """Implements bitwise or with assignment using the |= operator."""
-        self.__value |= other
-        return self
+        return _assign(self, ior(self.__value, other))
 
     def __ixor__(self, other):
         """Implements bitwise xor with assignment using the ^= operator."""
-        self.__value ^= other
-        return self
+        return _assign(self, ixor(self.__value, other))
 
     # endregion
 
 
-def maybe(value):
-    """Wraps an object with a Maybe instance.
+_set_value = Something._Something__value.__set__
+_get_hash = Something._Something__hash.__get__
+_set_hash = Something._Something__hash.__set__
+_del_hash = Something._Something__hash.__delete__
+_NONE_HASH = hash(None)
+
+
+def _assign(something, value):
+    """Stores the result of an in-place operator. Interned wrappers are shared,
+    so they are never mutated; a new Something is returned instead."""
+    if _interning.is_interned(something):
+        return Something(value)
+
+    _set_value(something, value)
+    try:
+        _del_hash(something)
+    except AttributeError:
+        pass
+
+    if isinstance(something, _memoizing.MemoizedSomething):
+        # Its remembered lookups belong to the old value.
+        something.invalidate()
+
+    return something
+
+
+_BUFFER_TYPES = frozenset([bytes, bytearray, memoryview])
+
+
+def _slice_view(view, key):
+    """Slices a memoryview without copying. Unlike plain slicing, bounds
+    outside the view and a zero step give None instead of clamping."""
+    size = len(view)
+    if key.step == 0:
+        return None
+
+    for bound in (key.start, key.stop):
+        if bound is not None and not -size <= bound <= size:
+            return None
+
+    return view[key]
+
+
+def _subscript(value, key):
+    """Returns value[key], except that a memoryview slice which _slice_view
+    rejects raises IndexError. Every item lookup (Something, compiled paths,
+    lenses, schemas and rewritten chains) goes through this for non-dict
+    values, so they all agree on what a miss is."""
+    if key.__class__ is slice and value.__class__ is memoryview:
+        result = _slice_view(value, key)
+        if result is None:
+            raise IndexError('memoryview slice out of range')
+        return result
+
+    return value[key]
+
+
+def _rebuild_buffer(buf, kind, fmt=None, shape=None):
+    """Unpickles a Something whose value was pickled as a PickleBuffer.
+
+    In-band, buf arrives as bytes or bytearray; out-of-band it is whatever
+    buffer object was handed to ``pickle.loads(buffers=...)``, which is
+    wrapped without copying when the original value was a memoryview.
+    """
+    if kind is memoryview:
+        return Something(memoryview(buf).cast('B').cast(fmt, shape))
+
+    return Something(buf if buf.__class__ is kind else kind(buf))
+
+
+def maybe(value, memoize=False, maxsize=None):
+    """Wraps an object with a Maybe instance. With memoize=True the wrapper
+    remembers up to maxsize (by default ``MEMOIZE_CACHE_SIZE``) attribute and
+    item lookups (see ``pymaybe.memoizing``).
 
       >>> maybe("I'm a value")
       Something("I'm a value")
@@ -566,13 +743,18 @@ def maybe(value):
         '0'
 
     """
+    if memoize:
+        return _memoizing.memoized(value, _memoizing.MEMOIZE_CACHE_SIZE if maxsize is None else maxsize)
+
     if isinstance(value, Maybe):
         return value
 
     if value is not None:
+        if _interning.enabled:
+            return _interning.intern(value)
         return Something(value)
 
-    return Nothing()
+    return NOTHING
 
 
 def get_doctest_globs():
@@ -598,6 +780,34 @@ def get_doctest_globs():
     return globals_dict
 
 
+from pymaybe import metrics as _metrics  # noqa: E402
+from pymaybe import tracing as _tracing  # noqa: E402
+from pymaybe import interning as _interning  # noqa: E402
+from pymaybe import memoizing as _memoizing  # noqa: E402
+from pymaybe.metrics import MetricsRegistry, disable_metrics, enable_metrics, metrics_context  # noqa: E402,F401
+from pymaybe.tracing import disable_provenance, enable_provenance, provenance  # noqa: E402,F401
+from pymaybe.interning import disable_interning, enable_interning  # noqa: E402,F401
+from pymaybe.memoizing import MemoizedSomething  # noqa: E402,F401
+from pymaybe.caching import maybe_cached  # noqa: E402,F401
+from pymaybe.lens import M, Lens, apply_lens, compile_lens  # noqa: E402,F401
+from pymaybe.paths import MaybePath, maybe_path  # noqa: E402,F401
+from pymaybe.ndjson import extract_ndjson  # noqa: E402,F401
+from pymaybe.index import MaybeIndex  # noqa: E402,F401
+from pymaybe.schema import compile_schema  # noqa: E402,F401
+from pymaybe.compact import MaybeList  # noqa: E402,F401
+from pymaybe.stream import MaybeStream  # noqa: E402,F401
+from pymaybe.buffers import maybe_view  # noqa: E402,F401
+from pymaybe.lazyjson import lazy_json  # noqa: E402,F401
+from pymaybe.sorting import maybe_sort_key, sort_maybes  # noqa: E402,F401
+
+if version_info >= (3, 6):
+    from pymaybe.aio import maybe_aiter, maybe_gather  # noqa: E402,F401
+if version_info >= (3, 5):
+    from pymaybe.parallel import maybe_map  # noqa: E402,F401
+    from pymaybe.chains import maybe_chains  # noqa: E402,F401
+from pymaybe.vectorized import MaybeArray  # noqa: E402,F401
+
+
 if __name__ == "__main__":
     import doctest
     doctest.testmod(globs=get_doctest_globs())
@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+
+from collections import OrderedDict
+from threading import Lock
+
+
+class LRUCache(object):
+    """A small thread-safe, size-bounded mapping with least-recently-used
+    eviction. A maxsize of None means unbounded."""
+
+    def __init__(self, maxsize=128):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            try:
+                value = self._data.pop(key)
+            except KeyError:
+                return default
+
+            self._data[key] = value
+            return value
+
+    def put(self, key, value):
+        """Stores value under key and returns the list of evicted (key, value) pairs."""
+        evicted = []
+        with self._lock:
+            self._data.pop(key, None)
+            self._data[key] = value
+            while self.maxsize is not None and len(self._data) > self.maxsize:
+                evicted.append(self._data.popitem(last=False))
+
+        return evicted
+
+    def pop(self, key, default=None):
+        with self._lock:
+            return self._data.pop(key, default)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def __len__(self):
+        return len(self._data)
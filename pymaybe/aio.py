@@ -0,0 +1,178 @@
+# -*- coding: utf-8 -*-
+"""Asyncio support for Maybe values (Python 3.6+).
+
+Importing this module makes Something and Nothing awaitable and async
+iterable, and adds an ``or_else_async`` coroutine method to both.
+"""
+
+import asyncio
+import inspect
+
+from pymaybe import NOTHING, Maybe, Nothing, Something, maybe
+
+
+def _something_await(self):
+    value = self.get()
+    if not inspect.isawaitable(value):
+        return self
+
+    try:
+        result = yield from (value.__await__() if hasattr(type(value), '__await__') else value)
+    except asyncio.CancelledError:
+        raise
+    except Exception:
+        return NOTHING
+
+    return maybe(result)
+
+
+def _nothing_await(self):
+    return self
+    yield  # pragma: no cover
+
+
+async def _something_or_else_async(self, els=None):
+    return self.get()
+
+
+async def _nothing_or_else_async(self, els=None):
+    if callable(els):
+        els = els()
+
+    if inspect.isawaitable(els):
+        els = await els
+
+    return els
+
+
+async def _iterate(value):
+    if hasattr(type(value), '__aiter__'):
+        async for item in value:
+            yield maybe(item)
+        return
+
+    try:
+        items = iter(value)
+    except TypeError:
+        items = iter([value])
+
+    for item in items:
+        yield maybe(item)
+
+
+class _Failure(object):
+    __slots__ = ('exception',)
+
+    def __init__(self, exception):
+        self.exception = exception
+
+
+async def _prefetch(value, prefetch):
+    queue = asyncio.Queue(maxsize=prefetch)
+    done = object()
+
+    async def produce():
+        try:
+            async for item in _iterate(value):
+                await queue.put(item)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            await queue.put(_Failure(e))
+        await queue.put(done)
+
+    producer = asyncio.ensure_future(produce())
+    try:
+        while True:
+            item = await queue.get()
+            if item is done:
+                return
+            if item.__class__ is _Failure:
+                # Raised with its own traceback, so it shows where the source failed.
+                raise item.exception
+            yield item
+    finally:
+        producer.cancel()
+        # Wait for the cancellation to land so the task is not left pending.
+        # Unlike awaiting the task, wait() does not raise its CancelledError,
+        # so a cancellation of the consumer itself still propagates.
+        await asyncio.wait([producer])
+
+
+def _something_aiter(self):
+    return _iterate(self.get())
+
+
+async def _nothing_aiter(self):
+    return
+    yield  # pragma: no cover
+
+
+Something.__await__ = _something_await
+Something.__aiter__ = _something_aiter
+Something.or_else_async = _something_or_else_async
+Nothing.__await__ = _nothing_await
+Nothing.__aiter__ = _nothing_aiter
+Nothing.or_else_async = _nothing_or_else_async
+
+
+def maybe_aiter(value, prefetch=0):
+    """Iterates value asynchronously, yielding every element as a Maybe.
+
+    value may be an async iterable (an async generator, a streaming cursor),
+    a plain iterable, or a Maybe wrapping either; Nothing yields no elements.
+    With prefetch > 0 a background task pulls up to prefetch elements ahead
+    of the consumer, so the source keeps streaming while the current elements
+    are processed. Errors raised by the source are re-raised to the consumer,
+    and the background task is cancelled once the iterator is exhausted,
+    closed with ``aclose()`` or garbage collected.
+
+    ``async for item in maybe(source)`` is the same as ``maybe_aiter(source)``.
+    """
+    if isinstance(value, Maybe):
+        if value.is_none():
+            return _nothing_aiter(value)
+        value = value.get()
+
+    if prefetch:
+        return _prefetch(value, prefetch)
+
+    return _iterate(value)
+
+
+async def _resolve(aw, timeout):
+    if isinstance(aw, Maybe):
+        if aw.is_none():
+            return NOTHING
+        aw = aw.get()
+
+    try:
+        if timeout is None:
+            result = await aw
+        else:
+            result = await asyncio.wait_for(aw, timeout)
+    except asyncio.CancelledError:
+        raise
+    except Exception:
+        return NOTHING
+
+    return maybe(result)
+
+
+async def maybe_gather(*aws, limit=None, timeout=None):
+    """Awaits aws concurrently and returns their results, in order, as Maybe values.
+
+    At most limit awaitables run at once, each one gets timeout seconds, and
+    failures, timeouts and None results become Nothing. Arguments may also be
+    Maybe-wrapped awaitables, such as the result of ``maybe(client).fetch()``.
+    """
+    semaphore = asyncio.Semaphore(limit) if limit else None
+
+    async def run(aw):
+        if semaphore is None:
+            return await _resolve(aw, timeout)
+
+        async with semaphore:
+            return await _resolve(aw, timeout)
+
+    return list(await asyncio.gather(*[run(aw) for aw in aws]))
@@ -0,0 +1,35 @@
+# -*- coding: utf-8 -*-
+
+from pymaybe import NOTHING, Maybe, Something
+
+
+def maybe_view(value):
+    """Wraps a bytes-like value (anything supporting the buffer protocol) in
+    a Something over a memoryview of it, so that slicing never copies:
+
+        >>> payload = maybe_view(b'HEADERbody')
+        >>> payload[:6]
+        Something(<memory at 0x...>)
+        >>> payload[6:].get(copy=True)
+        b'body'
+        >>> payload[6:100]
+        Nothing
+
+    Slices whose bounds fall outside the buffer, wrong-type keys and zero
+    steps give Nothing rather than a clamped or failed slice. Integer indexes
+    return the byte value as with bytes. get() returns the view itself and
+    ``get(copy=True)`` a bytes copy. While any view is alive, a wrapped
+    bytearray cannot be resized.
+    """
+    if isinstance(value, Maybe):
+        if value.is_none():
+            return NOTHING
+        value = value.get()
+
+    if value is None:
+        return NOTHING
+
+    if value.__class__ is memoryview:
+        return Something(value)
+
+    return Something(memoryview(value))
@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+
+from collections import namedtuple
+from functools import wraps
+from threading import Lock
+
+try:
+    from time import monotonic as _clock
+except ImportError:  # pragma: no cover
+    from time import time as _clock
+
+from pymaybe import maybe
+from pymaybe._cache import LRUCache
+
+CacheInfo = namedtuple('CacheInfo', [
+    'hits', 'nothing_hits', 'misses', 'evictions', 'nothing_evictions', 'expirations',
+    'currsize', 'nothing_currsize', 'maxsize', 'nothing_maxsize',
+])
+
+_MISSING = object()
+
+
+def _make_key(args, kwargs):
+    if not kwargs:
+        return args
+
+    return args + (_MISSING,) + tuple(sorted(kwargs.items()))
+
+
+class _MaybeCache(object):
+    """Separate LRU caches with their own TTLs for Something and Nothing results."""
+
+    def __init__(self, maxsize, ttl, nothing_maxsize, nothing_ttl, timer):
+        self.values = LRUCache(maxsize)
+        self.nothings = LRUCache(nothing_maxsize)
+        self.ttl = ttl
+        self.nothing_ttl = nothing_ttl
+        self.timer = timer
+        self._lock = Lock()
+        self.hits = self.nothing_hits = self.misses = 0
+        self.evictions = self.nothing_evictions = self.expirations = 0
+
+    def _lookup(self, cache, key, now):
+        entry = cache.get(key, _MISSING)
+        if entry is _MISSING:
+            return _MISSING
+
+        expires, result = entry
+        if expires is not None and now >= expires:
+            cache.pop(key)
+            with self._lock:
+                self.expirations += 1
+            return _MISSING
+
+        return result
+
+    def get(self, key):
+        now = self.timer()
+        result = self._lookup(self.values, key, now)
+        if result is not _MISSING:
+            with self._lock:
+                self.hits += 1
+            return result
+
+        result = self._lookup(self.nothings, key, now)
+        if result is not _MISSING:
+            with self._lock:
+                self.nothing_hits += 1
+            return result
+
+        with self._lock:
+            self.misses += 1
+        return _MISSING
+
+    def put(self, key, result):
+        if result.is_some():
+            cache, ttl = self.values, self.ttl
+        else:
+            cache, ttl = self.nothings, self.nothing_ttl
+
+        if cache.maxsize == 0 or ttl == 0:
+            return
+
+        evicted = len(cache.put(key, (None if ttl is None else self.timer() + ttl, result)))
+        if evicted:
+            with self._lock:
+                if cache is self.values:
+                    self.evictions += evicted
+                else:
+                    self.nothing_evictions += evicted
+
+    def info(self):
+        with self._lock:
+            return CacheInfo(self.hits, self.nothing_hits, self.misses, self.evictions,
+                             self.nothing_evictions, self.expirations, len(self.values),
+                             len(self.nothings), self.values.maxsize, self.nothings.maxsize)
+
+    def clear(self):
+        self.values.clear()
+        self.nothings.clear()
+        with self._lock:
+            self.hits = self.nothing_hits = self.misses = 0
+            self.evictions = self.nothing_evictions = self.expirations = 0
+
+
+def maybe_cached(fn=None, maxsize=128, ttl=None, nothing_maxsize=_MISSING, nothing_ttl=_MISSING, timer=_clock):
+    """Memoizes a function, returning its result wrapped with maybe().
+
+    Something and Nothing results are kept in separate LRU caches, so misses
+    can be cached (negative caching) with their own capacity and TTL:
+
+        @maybe_cached(maxsize=1024, ttl=300, nothing_maxsize=4096, nothing_ttl=30)
+        def load_config(name):
+            return remote.fetch(name)
+
+    nothing_maxsize and nothing_ttl default to maxsize and ttl. A maxsize
+    (or nothing_maxsize) of None means unbounded, a TTL of None means entries
+    never expire and a nothing_maxsize or nothing_ttl of 0 disables negative
+    caching. Calls with unhashable arguments are not cached. The wrapper
+    exposes cache_info(), cache_clear() and invalidate(*args, **kwargs).
+    """
+    if fn is None:
+        return lambda f: maybe_cached(f, maxsize, ttl, nothing_maxsize, nothing_ttl, timer)
+
+    cache = _MaybeCache(maxsize, ttl,
+                        maxsize if nothing_maxsize is _MISSING else nothing_maxsize,
+                        ttl if nothing_ttl is _MISSING else nothing_ttl, timer)
+
+    @wraps(fn)
+    def wrapper(*args, **kwargs):
+        key = _make_key(args, kwargs)
+        try:
+            result = cache.get(key)
+        except TypeError:
+            return maybe(fn(*args, **kwargs))
+
+        if result is _MISSING:
+            result = maybe(fn(*args, **kwargs))
+            cache.put(key, result)
+
+        # Every call gets its own wrapper, so in-place operators on a result
+        # (which mutate a Something) never reach the cache entry.
+        return result.__copy__() if result.is_some() else result
+
+    def invalidate(*args, **kwargs):
+        key = _make_key(args, kwargs)
+        try:
+            cache.values.pop(key)
+        except TypeError:
+            return  # Unhashable arguments are never cached.
+
+        cache.nothings.pop(key)
+
+    wrapper.cache_info = cache.info
+    wrapper.cache_clear = cache.clear
+    wrapper.invalidate = invalidate
+    return wrapper
@@ -0,0 +1,340 @@
+# -*- coding: utf-8 -*-
+"""Definition-time rewriting of static ``maybe(...)`` chains (Python 3.5+).
+
+The ``maybe_chains`` decorator parses the decorated function's source and
+replaces every chain of the form::
+
+    maybe(value).attr[key].method(arg).or_else(default)
+
+that ends in ``or_else``, ``or_none``, ``get``, ``is_some`` or ``is_none``
+with a call to a generated function that walks the raw values with the
+same guards as Something / Nothing, without building a wrapper per hop.
+"""
+
+import ast
+import inspect
+import textwrap
+from types import FunctionType
+
+from pymaybe import Maybe, NOTHING, NothingValueError, Something, _subscript, maybe
+from pymaybe import metrics as _metrics
+from pymaybe import tracing as _tracing
+from pymaybe._cache import LRUCache
+
+CHAINS_CACHE_SIZE = 256
+
+_TERMINALS = frozenset(['or_else', 'or_none', 'get', 'is_some', 'is_none'])
+
+_MISSING = {
+    'or_else': 'return els() if callable(els) else els',
+    'or_none': 'return None',
+    'get': "raise NothingValueError('No such element')",
+    'is_some': 'return False',
+    'is_none': 'return True',
+}
+
+_FOUND = {
+    'or_else': 'return value',
+    'or_none': 'return value',
+    'get': 'return value',
+    'is_some': 'return True',
+    'is_none': 'return False',
+}
+
+_GUARD = '''\
+    if value is None:
+        %(missing)s
+    if isinstance(value, Maybe):
+        if value.is_none():
+            %(missing)s
+        value = value.get()'''
+
+_ATTR_STEP = '''\
+    try:
+        value = getattr(value, %(name)r, None)
+    except Exception:
+        %(missing)s'''
+
+_ITEM_STEP = '''\
+    try:
+        value = value.get(%(key)s) if value.__class__ is dict else _subscript(value, %(key)s)
+    except (KeyError, TypeError, IndexError):
+        %(missing)s'''
+
+# Decorated function code -> (factory code, compiled chain helpers), so
+# decorating the same function again does not parse its source again.
+_cache = LRUCache(CHAINS_CACHE_SIZE)
+
+
+def _subscript_key(node):
+    key = node.slice
+    if isinstance(key, getattr(ast, 'Index', ())):  # Python < 3.9
+        key = key.value
+    if isinstance(key, (ast.Slice, getattr(ast, 'ExtSlice', ()))):
+        return None
+
+    return key
+
+
+class _ChainRewriter(ast.NodeTransformer):
+    """Replaces rewritable chains with calls to generated helpers."""
+
+    def __init__(self, maybe_names):
+        self.maybe_names = maybe_names
+        self.helpers = []
+
+    def visit_Call(self, node):
+        self.generic_visit(node)
+        chain = self._match(node)
+        if chain is None:
+            return node
+
+        base, ops, terminal, params, terminal_args = chain
+        name = '_maybe_chain_%d' % len(self.helpers)
+        self.helpers.append((name, _generate(name, ops, terminal, len(params))))
+        call = ast.Call(func=ast.Name(id=name, ctx=ast.Load()), args=[base] + params + terminal_args, keywords=[])
+        return ast.copy_location(call, node)
+
+    def _match(self, node):
+        """Returns (base, ops, terminal, params, terminal_args) if node is a rewritable chain."""
+        func = node.func
+        if not isinstance(func, ast.Attribute) or func.attr not in _TERMINALS:
+            return None
+
+        terminal = func.attr
+        if terminal == 'or_else':
+            if node.keywords and (len(node.keywords) != 1 or node.keywords[0].arg != 'els' or node.args):
+                return None
+            if len(node.args) > 1 or any(isinstance(a, ast.Starred) for a in node.args):
+                return None
+            terminal_args = node.args or [kw.value for kw in node.keywords]
+        elif node.args or node.keywords:
+            return None
+        else:
+            terminal_args = []
+
+        hops = []
+        params = []
+        current = func.value
+        while True:
+            if isinstance(current, ast.Attribute):
+                if current.attr.startswith('__') or hasattr(Something, current.attr):
+                    return None
+                hops.append(('attr', current.attr))
+                current = current.value
+            elif isinstance(current, ast.Subscript):
+                key = _subscript_key(current)
+                if key is None:
+                    return None
+                hops.append(('item', key))
+                current = current.value
+            elif isinstance(current, ast.Call) and self._is_maybe(current):
+                base = current.args[0]
+                break
+            elif isinstance(current, ast.Call):
+                if any(isinstance(a, ast.Starred) for a in current.args):
+                    return None
+                if any(kw.arg is None for kw in current.keywords):
+                    return None
+                hops.append(('call', current.args, current.keywords))
+                current = current.func
+            else:
+                return None
+
+        # Hop arguments become helper parameters, in source evaluation order.
+        ops = []
+        for hop in reversed(hops):
+            if hop[0] == 'attr':
+                ops.append(hop)
+            elif hop[0] == 'item':
+                ops.append(('item', len(params)))
+                params.append(hop[1])
+            else:
+                positional = list(range(len(params), len(params) + len(hop[1])))
+                params.extend(hop[1])
+                keywords = []
+                for kw in hop[2]:
+                    keywords.append((kw.arg, len(params)))
+                    params.append(kw.value)
+                ops.append(('call', positional, keywords))
+
+        return base, tuple(ops), terminal, params, terminal_args
+
+    def _is_maybe(self, node):
+        if not isinstance(node.func, ast.Name) or node.func.id not in self.maybe_names:
+            return False
+
+        return len(node.args) == 1 and not node.keywords and not isinstance(node.args[0], ast.Starred)
+
+
+def _generate(name, ops, terminal, param_count):
+    """Generates the source of one chain helper."""
+    params = ['_p%d' % i for i in range(param_count)]
+    if terminal == 'or_else':
+        params.append('els=None')
+
+    missing = _MISSING[terminal]
+    guard = _GUARD % {'missing': missing}
+
+    # The equivalent dynamic chain, used while metrics or provenance are on
+    # so that swallowed errors are still recorded.
+    dynamic = ['maybe(value)']
+    lines = [guard]
+    for op in ops:
+        if op[0] == 'attr':
+            dynamic.append('.%s' % op[1])
+            lines.append(_ATTR_STEP % {'name': op[1], 'missing': missing})
+        elif op[0] == 'item':
+            dynamic.append('[_p%d]' % op[1])
+            lines.append(_ITEM_STEP % {'key': '_p%d' % op[1], 'missing': missing})
+        else:
+            args = ['_p%d' % i for i in op[1]] + ['%s=_p%d' % kw for kw in op[2]]
+            dynamic.append('(%s)' % ', '.join(args))
+            lines.append('    value = value(%s)' % ', '.join(args))
+        lines.append(guard)
+
+    dynamic.append('.%s(%s)' % (terminal, 'els' if terminal == 'or_else' else ''))
+    header = [
+        'def %s(%s):' % (name, ', '.join(['value'] + params)),
+        '    if _metrics.active or _tracing.enabled:',
+        '        return %s' % ''.join(dynamic),
+    ]
+    lines.append('    ' + _FOUND[terminal])
+    return '\n'.join(header + lines)
+
+
+def _compile_helpers(helpers):
+    namespace = {
+        'Maybe': Maybe, 'NOTHING': NOTHING, 'NothingValueError': NothingValueError,
+        'maybe': maybe, '_metrics': _metrics, '_tracing': _tracing, '_subscript': _subscript,
+    }
+    for name, source in helpers:
+        exec(compile(source, '<%s>' % name, 'exec'), namespace)
+
+    return [namespace[name] for name, _ in helpers]
+
+
+def _rewrite(fn):
+    """Returns (factory code, compiled chain helpers) for fn, or None."""
+    try:
+        source = textwrap.dedent(inspect.getsource(fn))
+        filename = inspect.getsourcefile(fn) or '<maybe_chains>'
+    except (OSError, TypeError):
+        return None
+
+    tree = ast.parse(source)
+    funcdef = tree.body[0] if tree.body else None
+    if not isinstance(funcdef, (ast.FunctionDef, getattr(ast, 'AsyncFunctionDef', ()))):
+        return None
+    if funcdef.name != fn.__code__.co_name or not _innermost_is_us(funcdef):
+        return None
+
+    code = fn.__code__
+    local_names = set(code.co_varnames) | set(code.co_cellvars)
+    maybe_names = set(name for name in code.co_names
+                      if name not in local_names and fn.__globals__.get(name) is maybe)
+    if not maybe_names:
+        return None
+
+    # Private names would have been mangled by the enclosing class body.
+    for node in ast.walk(funcdef):
+        name = getattr(node, 'id', None) or getattr(node, 'attr', None) or ''
+        if name.startswith('__') and not name.endswith('__'):
+            return None
+
+    rewriter = _ChainRewriter(maybe_names)
+    funcdef = rewriter.visit(funcdef)
+    if not rewriter.helpers:
+        return None
+
+    # Decorators, defaults and annotations were already evaluated for fn and
+    # are copied over from it, so they must not be evaluated again.
+    funcdef.decorator_list = []
+    funcdef.returns = None
+    funcdef.args.defaults = []
+    funcdef.args.kw_defaults = [None] * len(funcdef.args.kw_defaults)
+    for arg in _all_args(funcdef.args):
+        arg.annotation = None
+
+    # Wrapping the function in a factory turns the helpers into closure
+    # variables, so the module namespace is left untouched.
+    names = [name for name, _ in rewriter.helpers]
+    factory = ast.FunctionDef(
+        name='_maybe_chains_factory',
+        args=_arguments(names),
+        body=[funcdef, ast.Return(value=ast.Name(id=funcdef.name, ctx=ast.Load()))],
+        decorator_list=[],
+        returns=None,
+    )
+    module = ast.Module(body=[ast.copy_location(factory, funcdef)], type_ignores=[])
+    ast.fix_missing_locations(module)
+    ast.increment_lineno(module, code.co_firstlineno - 1)
+
+    module_code = compile(module, filename, 'exec')
+    factory_code = next(c for c in module_code.co_consts if getattr(c, 'co_name', None) == factory.name)
+    return factory_code, _compile_helpers(rewriter.helpers)
+
+
+def _innermost_is_us(funcdef):
+    if not funcdef.decorator_list:
+        return True
+
+    decorator = funcdef.decorator_list[-1]
+    if isinstance(decorator, ast.Call):
+        decorator = decorator.func
+    return getattr(decorator, 'id', getattr(decorator, 'attr', None)) == 'maybe_chains'
+
+
+def _all_args(arguments):
+    args = list(getattr(arguments, 'posonlyargs', [])) + list(arguments.args) + list(arguments.kwonlyargs)
+    return args + [a for a in (arguments.vararg, arguments.kwarg) if a is not None]
+
+
+def _arguments(names):
+    fields = {
+        'posonlyargs': [], 'args': [ast.arg(arg=name, annotation=None) for name in names],
+        'vararg': None, 'kwonlyargs': [], 'kw_defaults': [], 'kwarg': None, 'defaults': [],
+    }
+    return ast.arguments(**dict((k, v) for k, v in fields.items() if k in ast.arguments._fields))
+
+
+def maybe_chains(fn):
+    """Rewrites the static ``maybe(...)`` chains in fn at definition time.
+
+    Only chains rooted at a call of this module's ``maybe`` and ending in
+    ``or_else``, ``or_none``, ``get``, ``is_some`` or ``is_none`` are
+    rewritten; everything else runs unchanged. Results, including the
+    exceptions swallowed by item and attribute lookups, are the same as the
+    dynamic chain's, and hop arguments are still evaluated once each, before
+    the walk. Must be the innermost decorator. Functions whose source is
+    unavailable, and closures, are returned unchanged.
+
+        >>> @maybe_chains
+        ... def city(user):
+        ...     return maybe(user)['address'].city.or_else('unknown')
+        >>> city({'address': None})
+        'unknown'
+    """
+    if not isinstance(fn, FunctionType) or fn.__code__.co_freevars:
+        return fn
+
+    rewritten = _cache.get(fn.__code__)
+    if rewritten is None:
+        rewritten = _rewrite(fn) or (None, None)
+        _cache.put(fn.__code__, rewritten)
+
+    factory_code, helpers = rewritten
+    if factory_code is None:
+        return fn
+
+    factory = FunctionType(factory_code, fn.__globals__)
+    new_fn = factory(*helpers)
+    new_fn.__defaults__ = fn.__defaults__
+    new_fn.__kwdefaults__ = fn.__kwdefaults__
+    new_fn.__annotations__ = fn.__annotations__
+    new_fn.__dict__.update(fn.__dict__)
+    new_fn.__module__ = fn.__module__
+    new_fn.__doc__ = fn.__doc__
+    new_fn.__qualname__ = fn.__qualname__
+    new_fn.__wrapped__ = fn
+    return new_fn
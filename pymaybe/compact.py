@@ -0,0 +1,175 @@
+# -*- coding: utf-8 -*-
+
+from array import array
+from sys import getsizeof
+
+from pymaybe import NOTHING, Maybe, Something
+
+
+def _unwrap(value):
+    if isinstance(value, Maybe):
+        return value.get() if value.is_some() else None
+
+    return value
+
+
+# Bit offsets of the absent elements for every possible bitmap byte.
+_ABSENT = [tuple(bit for bit in range(8) if not byte & (1 << bit)) for byte in range(256)]
+
+
+class MaybeList(object):
+    """A compact list of optional values.
+
+    Values live in an ``array.array`` of the given typecode (for numbers or
+    characters) or in a plain list (typecode=None), and presence is tracked in a separate
+    bitmap, so no Something / Nothing wrapper is stored per element. Wrappers
+    are only created when elements are accessed:
+
+        >>> scores = MaybeList([1.5, None, 3.0], typecode='d')
+        >>> scores[0], scores[1]
+        (Something(1.5), Nothing)
+        >>> scores.or_else(0.0).tolist()
+        [1.5, 0.0, 3.0]
+
+    None and Nothing are stored as absent elements; Something is unwrapped.
+    """
+
+    __slots__ = ('typecode', '_values', '_bits', '_len', '_fill')
+
+    def __init__(self, iterable=(), typecode=None):
+        self.typecode = typecode
+        self._values = [] if typecode is None else array(typecode)
+        self._bits = bytearray()
+        self._len = 0
+        # Absent elements hold the typecode's zero: 0, 0.0 or '\0' for 'u'.
+        self._fill = None if typecode is None else array(typecode, bytes(self._values.itemsize))[0]
+        self.extend(iterable)
+
+    def _present(self, i):
+        return self._bits[i >> 3] & (1 << (i & 7))
+
+    def _index(self, i):
+        if i < 0:
+            i += self._len
+        if not 0 <= i < self._len:
+            raise IndexError('MaybeList index out of range')
+
+        return i
+
+    def append(self, value):
+        value = _unwrap(value)
+        # Store the value first: the array rejects values of the wrong type,
+        # and the bitmap and length must not move when it does.
+        self._values.append(self._fill if value is None else value)
+
+        i = self._len
+        if not i & 7:
+            self._bits.append(0)
+        if value is not None:
+            self._bits[i >> 3] |= 1 << (i & 7)
+
+        self._len = i + 1
+
+    def extend(self, iterable):
+        if isinstance(iterable, MaybeList) and iterable.typecode == self.typecode and not self._len & 7:
+            # Byte-aligned: both the values and the bitmap can be copied in bulk.
+            self._values.extend(iterable._values)
+            self._bits.extend(iterable._bits)
+            self._len += iterable._len
+            return
+
+        if iterable is self:
+            iterable = list(iterable)
+
+        append = self.append
+        for value in iterable:
+            append(value)
+
+    def __len__(self):
+        return self._len
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            result = MaybeList(typecode=self.typecode)
+            for j in range(*i.indices(self._len)):
+                result.append(self._values[j] if self._present(j) else None)
+            return result
+
+        i = self._index(i)
+        return Something(self._values[i]) if self._present(i) else NOTHING
+
+    def __setitem__(self, i, value):
+        i = self._index(i)
+        value = _unwrap(value)
+        if value is None:
+            self._values[i] = self._fill
+            self._bits[i >> 3] &= ~(1 << (i & 7)) & 0xFF
+        else:
+            self._values[i] = value
+            self._bits[i >> 3] |= 1 << (i & 7)
+
+    def __iter__(self):
+        bits = self._bits
+        for i, value in enumerate(self._values):
+            yield Something(value) if bits[i >> 3] & (1 << (i & 7)) else NOTHING
+
+    def __eq__(self, other):
+        if not isinstance(other, MaybeList):
+            return NotImplemented
+
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    __hash__ = None
+
+    def _gaps(self):
+        """Yields (start, offsets) for every bitmap byte with absent elements."""
+        bits = self._bits
+        tail = self._len & 7
+        if tail:
+            # Mark the unused bits of the last byte as present so they are skipped.
+            bits = bits[:-1] + bytearray([bits[-1] | (0xFF << tail) & 0xFF])
+
+        for byte_index, byte in enumerate(bits):
+            if byte != 0xFF:
+                yield byte_index << 3, _ABSENT[byte]
+
+    def count_some(self):
+        """Returns the number of present elements."""
+        return sum(bin(byte).count('1') for byte in self._bits)
+
+    def or_else(self, els=None):
+        """Returns the raw values with every absent element replaced by els,
+        as an ``array.array`` for typed storage or a list otherwise."""
+        if callable(els):
+            els = els()
+
+        if self.typecode is not None and els is None:
+            return self.or_none()
+
+        result = self._values[:]
+        if self.count_some() == self._len:
+            return result
+
+        for start, offsets in self._gaps():
+            for offset in offsets:
+                result[start + offset] = els
+
+        return result
+
+    def or_none(self):
+        """Returns the raw values as a list with None for absent elements."""
+        bits = self._bits
+        return [value if bits[i >> 3] & (1 << (i & 7)) else None for i, value in enumerate(self._values)]
+
+    def __sizeof__(self):
+        return object.__sizeof__(self) + getsizeof(self._values) + getsizeof(self._bits)
+
+    def __repr__(self):
+        if self.typecode is None:
+            return 'MaybeList(%r)' % (self.or_none(),)
+
+        return 'MaybeList(%r, typecode=%r)' % (self.or_none(), self.typecode)
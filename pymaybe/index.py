@@ -0,0 +1,154 @@
+# -*- coding: utf-8 -*-
+
+from sys import getsizeof
+
+try:
+    from time import perf_counter as _clock
+except ImportError:  # pragma: no cover
+    from time import time as _clock
+
+from pymaybe import maybe
+from pymaybe.paths import maybe_path
+
+_MISSING = object()
+_CONTAINERS = (dict, list, tuple)
+
+
+def _path_keys(path):
+    if isinstance(path, tuple):
+        return path
+
+    if isinstance(path, list):
+        return tuple(path)
+
+    return tuple(key for _, key in maybe_path(path).segments)
+
+
+class MaybeIndex(object):
+    """A flat ``path -> value`` index over a read-mostly nested document of
+    dicts, lists and tuples, answering lookups with a single hash probe.
+
+    Paths are ``maybe_path`` strings or tuples of keys, and results match
+    ``maybe(doc)[k1][k2]...``:
+
+        >>> index = MaybeIndex({'store': {'name': 'MyStore', 'tags': ['a', 'b']}})
+        >>> index.get('store.name')
+        Something('MyStore')
+        >>> index.get(('store', 'tags', 1))
+        Something('b')
+        >>> index.get('store.address.street')
+        Nothing
+
+    With eager=False nothing is indexed up front and every looked-up path
+    (and its ancestors) is remembered as it is resolved. max_depth and
+    prefixes bound which paths are indexed; anything outside the indexed
+    region is resolved by walking from its nearest indexed ancestor. The
+    index is a snapshot: call rebuild() after mutating the document.
+    """
+
+    def __init__(self, doc, eager=True, max_depth=None, prefixes=None):
+        self.doc = doc
+        self.eager = eager
+        self.max_depth = max_depth
+        self.prefixes = None if prefixes is None else [_path_keys(p) for p in prefixes]
+        self.build_seconds = 0.0
+        self._index = {(): doc}
+        if eager:
+            self.rebuild()
+
+    def _allowed(self, path):
+        if self.max_depth is not None and len(path) > self.max_depth:
+            return False
+
+        if self.prefixes is None:
+            return True
+
+        depth = len(path)
+        for prefix in self.prefixes:
+            if path[:len(prefix)] == prefix or prefix[:depth] == path:
+                return True
+
+        return False
+
+    def rebuild(self):
+        """(Re)indexes the document and records how long it took in build_seconds."""
+        start = _clock()
+        index = {(): self.doc}
+        if self.eager:
+            stack = [((), self.doc)]
+            while stack:
+                path, value = stack.pop()
+                if value.__class__ is dict:
+                    children = value.items()
+                elif value.__class__ in (list, tuple):
+                    children = enumerate(value)
+                else:
+                    continue
+
+                for key, child in children:
+                    child_path = path + (key,)
+                    if not self._allowed(child_path):
+                        continue
+
+                    index[child_path] = child
+                    if isinstance(child, _CONTAINERS):
+                        stack.append((child_path, child))
+
+        self._index = index
+        self.build_seconds = _clock() - start
+
+    def get(self, path):
+        """Returns the value at path as Something, or Nothing."""
+        keys = _path_keys(path)
+        try:
+            value = self._index.get(keys, _MISSING)
+        except TypeError:
+            # Unhashable keys (such as slices before Python 3.12) are never indexed.
+            return self._resolve(keys)
+
+        if value is not _MISSING:
+            return maybe(value)
+
+        return self._resolve(keys)
+
+    __getitem__ = get
+
+    def _resolve(self, keys):
+        # Walk from the nearest indexed ancestor, remembering new nodes in lazy mode.
+        depth = len(keys) - 1
+        while depth > 0 and not self._indexed(keys[:depth]):
+            depth -= 1
+
+        current = maybe(self._index[keys[:depth]])
+        remember = not self.eager
+        for i in range(depth, len(keys)):
+            current = current[keys[i]]
+            if current.is_none():
+                return current
+
+            if remember and self._allowed(keys[:i + 1]):
+                try:
+                    self._index[keys[:i + 1]] = current.get()
+                except TypeError:
+                    remember = False
+
+        return current
+
+    def _indexed(self, path):
+        try:
+            return path in self._index
+        except TypeError:
+            return False
+
+    def __len__(self):
+        return len(self._index)
+
+    def stats(self):
+        """Returns the number of indexed paths, the build time and the
+        approximate memory held by the index itself (not the document)."""
+        index_bytes = getsizeof(self._index) + sum(getsizeof(path) for path in self._index)
+        return {
+            'entries': len(self._index),
+            'build_seconds': self.build_seconds,
+            'index_bytes': index_bytes,
+        }
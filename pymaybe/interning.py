@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+"""Optional interning of Something wrappers.
+
+When enabled, ``maybe(x)`` returns one shared Something per distinct hot
+value (by default ints, floats, bools and short strings / bytes) for as long
+as any reference to that wrapper is alive. The table holds weak references
+only, so it never keeps a wrapper or its value alive by itself.
+
+    >>> from pymaybe import maybe
+    >>> enable_interning()
+    >>> maybe(42) is maybe(42)
+    True
+    >>> disable_interning()
+    >>> maybe(42) is maybe(42)
+    False
+
+Interned wrappers are shared, so in-place operators such as ``+=`` on them
+rebind to a new Something instead of mutating it.
+"""
+
+from threading import Lock
+from weakref import ref
+
+try:
+    from _weakref import _remove_dead_weakref
+except ImportError:
+    def _remove_dead_weakref(table, key):
+        wrapper_ref = table.get(key)
+        if wrapper_ref is not None and wrapper_ref() is None:
+            table.pop(key, None)
+
+from pymaybe import Something
+
+DEFAULT_TYPES = (int, float, bool, str, bytes)
+
+# Checked by maybe(); while False, every call builds a new Something.
+enabled = False
+_max_length = 64
+
+# One {value: weakref} table per interned type, so that 1, 1.0 and True stay
+# distinct even though they compare (and hash) equal.
+_tables = {}
+_lock = Lock()
+
+
+def _discard(table, key):
+    # The garbage collector can run this inside intern() while _lock is held,
+    # so it must not take the lock; the removal only happens if the entry
+    # still holds a dead reference, as in WeakValueDictionary.
+    def callback(dead):
+        _remove_dead_weakref(table, key)
+
+    return callback
+
+
+def intern(value):
+    """Returns the shared Something for value, creating it if needed."""
+    table = _tables.get(value.__class__)
+    if table is None:
+        return Something(value)
+
+    if value.__class__ in (str, bytes) and len(value) > _max_length:
+        return Something(value)
+
+    wrapper_ref = table.get(value)
+    if wrapper_ref is not None:
+        wrapper = wrapper_ref()
+        if wrapper is not None:
+            return wrapper
+
+    with _lock:
+        wrapper_ref = table.get(value)
+        wrapper = None if wrapper_ref is None else wrapper_ref()
+        if wrapper is None:
+            wrapper = Something(value)
+            table[value] = ref(wrapper, _discard(table, value))
+
+    return wrapper
+
+
+def is_interned(something):
+    """Returns True if something is the shared wrapper for its value."""
+    if not _tables:
+        return False
+
+    value = something.get()
+    table = _tables.get(value.__class__)
+    if table is None:
+        return False
+
+    try:
+        wrapper_ref = table.get(value)
+    except TypeError:
+        return False
+
+    return wrapper_ref is not None and wrapper_ref() is something
+
+
+def interned_count():
+    """Returns the number of live interned wrappers."""
+    return sum(1 for table in _tables.values() for wrapper_ref in table.values() if wrapper_ref() is not None)
+
+
+def enable_interning(types=DEFAULT_TYPES, max_length=64):
+    """Interns wrappers for values whose exact type is in types (such as an
+    Enum class), with str and bytes values limited to max_length. Types from
+    earlier calls stay interned."""
+    global enabled, _max_length
+    _max_length = max_length
+    with _lock:
+        for kind in types:
+            _tables.setdefault(kind, {})
+    enabled = True
+
+
+def disable_interning():
+    """Stops interning new values. Wrappers that were already handed out stay
+    shared, and so stay protected from in-place mutation, until they die."""
+    global enabled
+    enabled = False
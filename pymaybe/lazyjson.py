@@ -0,0 +1,262 @@
+# -*- coding: utf-8 -*-
+
+import json
+import re
+from json.decoder import scanstring
+
+try:
+    from collections.abc import Mapping, Sequence
+except ImportError:  # pragma: no cover
+    from collections import Mapping, Sequence
+
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+
+# Everything up to the next bracket outside a string, then that bracket. The
+# lookahead + backreference makes the run atomic, so a bracket-free tail is
+# rejected in linear time.
+_BRACKET = re.compile(r'(?=((?:[^"\[\]{}]+|"[^"\\]*(?:\\.[^"\\]*)*")*))\1([\[\]{}])')
+_SCALAR = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"|[^,:\]}\s]+')
+
+_decoder = json.JSONDecoder()
+
+
+def _error(message, text, pos):
+    return ValueError('%s: line %d column %d (char %d)' % (
+        message, text.count('\n', 0, pos) + 1, pos - text.rfind('\n', 0, pos), pos))
+
+
+def _skip(text, pos):
+    """Returns the index just past the JSON value starting at pos, without decoding it."""
+    char = text[pos:pos + 1]
+    if char == '{' or char == '[':
+        depth = 0
+        match = _BRACKET.match
+        while True:
+            m = match(text, pos)
+            if m is None:
+                raise _error('Unterminated container', text, pos)
+            pos = m.end()
+            if m.group(2) in '[{':
+                depth += 1
+            else:
+                depth -= 1
+                if depth == 0:
+                    return pos
+
+    m = _SCALAR.match(text, pos)
+    if m is None:
+        raise _error('Expecting value', text, pos)
+
+    return m.end()
+
+
+def _decode(text, pos):
+    """Returns the value at pos: a lazy node for containers, a Python value otherwise."""
+    char = text[pos:pos + 1]
+    if char == '{':
+        return LazyObject(text, pos)
+    if char == '[':
+        return LazyArray(text, pos)
+    if char == '"':
+        return scanstring(text, pos + 1)[0]
+
+    return _decoder.raw_decode(text, pos)[0]
+
+
+class _LazyNode(object):
+    __slots__ = ('_text', '_start', '_pos', '_done')
+
+    def __init__(self, text, start):
+        self._text = text
+        self._start = start
+        self._pos = start + 1
+        self._done = False
+
+    def _next(self, closing):
+        """Advances past the separator before the next member and returns its
+        position, or None (marking the node done) at the closing bracket."""
+        text = self._text
+        pos = _WHITESPACE.match(text, self._pos).end()
+        char = text[pos:pos + 1]
+        if char == closing:
+            self._done = True
+            self._pos = pos + 1
+            return None
+
+        if self._pos == self._start + 1:
+            return pos
+        if char != ',':
+            raise _error("Expecting ',' delimiter", text, pos)
+
+        return _WHITESPACE.match(text, pos + 1).end()
+
+    def to_python(self):
+        """Fully decodes this subtree into plain dicts and lists."""
+        return _decoder.raw_decode(self._text, self._start)[0]
+
+
+class LazyObject(_LazyNode, Mapping):
+    """A JSON object that indexes its members only as far as lookups need,
+    and decodes a member only when it is accessed. Duplicate keys resolve to
+    their first occurrence."""
+
+    __slots__ = ('_offsets', '_children')
+
+    def __init__(self, text, start):
+        _LazyNode.__init__(self, text, start)
+        self._offsets = {}
+        self._children = {}
+
+    def _scan(self, key=None):
+        """Indexes members until key is found, or to the end of the object."""
+        text = self._text
+        offsets = self._offsets
+        while not self._done:
+            pos = self._next('}')
+            if pos is None:
+                return
+
+            if text[pos:pos + 1] != '"':
+                raise _error('Expecting property name enclosed in double quotes', text, pos)
+            name, pos = scanstring(text, pos + 1)
+            pos = _WHITESPACE.match(text, pos).end()
+            if text[pos:pos + 1] != ':':
+                raise _error("Expecting ':' delimiter", text, pos)
+            pos = _WHITESPACE.match(text, pos + 1).end()
+
+            self._pos = _skip(text, pos)
+            if name not in offsets:
+                offsets[name] = pos
+                if name == key:
+                    return
+
+    def __getitem__(self, key):
+        try:
+            return self._children[key]
+        except KeyError:
+            pass
+
+        if key not in self._offsets and not self._done:
+            self._scan(key)
+
+        value = _decode(self._text, self._offsets[key])
+        self._children[key] = value
+        return value
+
+    def __contains__(self, key):
+        if key not in self._offsets and not self._done:
+            self._scan(key)
+
+        return key in self._offsets
+
+    def __iter__(self):
+        self._scan()
+        return iter(list(self._offsets))
+
+    def __len__(self):
+        self._scan()
+        return len(self._offsets)
+
+    def __repr__(self):
+        return '<LazyObject of %d indexed keys%s>' % (len(self._offsets), '' if self._done else ', partial')
+
+
+class LazyArray(_LazyNode, Sequence):
+    """A JSON array that indexes its elements only as far as lookups need,
+    and decodes an element only when it is accessed."""
+
+    __slots__ = ('_offsets', '_children')
+
+    def __init__(self, text, start):
+        _LazyNode.__init__(self, text, start)
+        self._offsets = []
+        self._children = {}
+
+    def _scan(self, count=None):
+        """Indexes elements until count are known, or to the end of the array."""
+        text = self._text
+        offsets = self._offsets
+        while not self._done and (count is None or len(offsets) < count):
+            pos = self._next(']')
+            if pos is None:
+                return
+
+            self._pos = _skip(text, pos)
+            offsets.append(pos)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            self._scan()
+            return [self[i] for i in range(*index.indices(len(self._offsets)))]
+
+        if index.__class__ is not int and not isinstance(index, int):
+            raise TypeError('list indices must be integers or slices, not %s' % type(index).__name__)
+
+        if index < 0:
+            self._scan()
+            index += len(self._offsets)
+        elif index >= len(self._offsets):
+            self._scan(index + 1)
+
+        if not 0 <= index < len(self._offsets):
+            raise IndexError('list index out of range')
+
+        try:
+            return self._children[index]
+        except KeyError:
+            value = self._children[index] = _decode(self._text, self._offsets[index])
+            return value
+
+    def __len__(self):
+        self._scan()
+        return len(self._offsets)
+
+    def __eq__(self, other):
+        if isinstance(other, (list, LazyArray)):
+            return list(self) == list(other)
+
+        return NotImplemented
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    __hash__ = None
+
+    def __repr__(self):
+        return '<LazyArray of %d indexed elements%s>' % (len(self._offsets), '' if self._done else ', partial')
+
+
+def lazy_json(data):
+    """Returns a lazily decoded view of the JSON document in data (str or bytes).
+
+    Objects and arrays are returned as LazyObject / LazyArray nodes, which act
+    like read-only dicts and lists: lookups skip over the raw text of the
+    members they do not need and decode only what is accessed, remembering
+    member offsets and decoded values for repeated access. Wrapped with
+    ``maybe()`` they navigate exactly like the parsed document:
+
+        >>> from pymaybe import maybe
+        >>> doc = lazy_json(b'{"items": [1, 2, 3], "user": {"name": "Eran", "age": null}}')
+        >>> maybe(doc)['user']['name']
+        Something('Eran')
+        >>> maybe(doc)['user']['age'].or_else(0)
+        0
+        >>> maybe(doc)['items'][5]
+        Nothing
+
+    Skipped parts are only checked for balanced brackets and strings, so a
+    malformed document may go unnoticed until the broken part is accessed
+    (which raises ValueError). ``to_python()`` decodes a node fully.
+    """
+    if not isinstance(data, str):
+        data = data.decode(json.detect_encoding(data) if hasattr(json, 'detect_encoding') else 'utf-8')
+
+    pos = _WHITESPACE.match(data).end()
+    value = _decode(data, pos)
+    if not isinstance(value, _LazyNode):
+        end = _WHITESPACE.match(data, _skip(data, pos)).end()
+        if end != len(data):
+            raise _error('Extra data', data, end)
+
+    return value
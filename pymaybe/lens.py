@@ -0,0 +1,195 @@
+# -*- coding: utf-8 -*-
+
+import operator
+
+from pymaybe import NOTHING, Maybe, Nothing, Something, _subscript, maybe
+
+_ATTR = 'attr'
+_ITEM = 'item'
+_CALL = 'call'
+_BINOP = 'binop'
+
+# Attribute names that resolve to Maybe methods rather than the wrapped value's.
+_MAYBE_METHODS = frozenset(['is_some', 'is_none', 'get', 'or_else', 'or_none', 'or_empty_list'])
+
+_BINOPS = (
+    ('add', '+'), ('sub', '-'), ('mul', '*'), ('floordiv', '//'), ('div', '/'),
+    ('mod', '%'), ('pow', '**'), ('lshift', '<<'), ('rshift', '>>'),
+    ('and', '&'), ('or', '|'), ('xor', '^'),
+)
+_OPERATORS = {
+    '+': operator.add, '-': operator.sub, '*': operator.mul, '//': operator.floordiv,
+    '/': getattr(operator, 'div', operator.truediv), '%': operator.mod, '**': operator.pow,
+    '<<': operator.lshift, '>>': operator.rshift, '&': operator.and_, '|': operator.or_, '^': operator.xor,
+}
+
+
+class Lens(object):
+    """A recorded chain of attribute, item, call and arithmetic operations.
+
+    Build one from the ``M`` placeholder, then apply it to many values with
+    ``apply_lens`` or turn it into a flat function with ``compile_lens``:
+
+        >>> zip_code = M.user.address['zip'].or_else('')
+        >>> apply_lens(zip_code, {'user': None})
+        ''
+        >>> get_zip = compile_lens(M['user']['address']['zip'])
+        >>> get_zip({'user': {'address': {'zip': '10001'}}})
+        Something('10001')
+        >>> get_zip({'user': {}})
+        Nothing
+
+    Once a hop produces Nothing the remaining operations are skipped, up to
+    the first Maybe method (``or_else``, ``get``, ...) in the chain.
+    """
+
+    __slots__ = ('_ops', '_compiled')
+
+    def __init__(self, ops=()):
+        self._ops = ops
+        self._compiled = None
+
+    def _extend(self, op):
+        return Lens(self._ops + (op,))
+
+    def __getattr__(self, name):
+        if name.startswith('__') and name.endswith('__'):
+            raise AttributeError(name)
+
+        return self._extend((_ATTR, name))
+
+    def __getitem__(self, key):
+        return self._extend((_ITEM, key))
+
+    def __call__(self, *args, **kwargs):
+        return self._extend((_CALL, args, kwargs))
+
+    def __iter__(self):
+        raise TypeError('Lens objects are not iterable')
+
+    def __repr__(self):
+        parts = ['M']
+        for op in self._ops:
+            if op[0] == _ATTR:
+                parts.append('.%s' % op[1])
+            elif op[0] == _ITEM:
+                parts.append('[%r]' % (op[1],))
+            elif op[0] == _CALL:
+                args = [repr(a) for a in op[1]] + ['%s=%r' % kv for kv in sorted(op[2].items())]
+                parts.append('(%s)' % ', '.join(args))
+            elif op[3]:
+                parts.insert(0, '(%r %s ' % (op[2], op[1]))
+                parts.append(')')
+            else:
+                parts.insert(0, '(')
+                parts.append(' %s %r)' % (op[1], op[2]))
+
+        return ''.join(parts)
+
+
+def _binop(symbol, reflected):
+    def method(self, other):
+        return self._extend((_BINOP, symbol, other, reflected))
+
+    return method
+
+
+for _name, _symbol in _BINOPS:
+    setattr(Lens, '__%s__' % _name, _binop(_symbol, False))
+    setattr(Lens, '__r%s__' % _name, _binop(_symbol, True))
+
+del _name, _symbol
+
+M = Lens()
+
+
+def _split(ops):
+    """Splits ops into the part walked on raw values and the tail applied to the resulting Maybe."""
+    for i, op in enumerate(ops):
+        if op[0] == _ATTR and op[1] in _MAYBE_METHODS:
+            return ops[:i], ops[i:]
+
+    return ops, ()
+
+
+def _apply_ops(current, ops):
+    for op in ops:
+        kind = op[0]
+        if kind == _ATTR:
+            current = getattr(current, op[1])
+        elif kind == _ITEM:
+            current = current[op[1]]
+        elif kind == _CALL:
+            current = current(*op[1], **op[2])
+        elif not isinstance(current, Nothing):
+            fn = _OPERATORS[op[1]]
+            current = fn(op[2], current) if op[3] else fn(current, op[2])
+
+    return current
+
+
+def apply_lens(expr, value):
+    """Applies expr to value with the same semantics as chaining on ``maybe(value)``."""
+    return _apply_ops(maybe(value), expr._ops)
+
+
+_GUARD = [
+    '    if value is None:',
+    '        return %(exit)s',
+    '    if isinstance(value, Maybe):',
+    '        if value.is_none():',
+    '            return %(exit)s',
+    '        value = value.get()',
+]
+
+
+def compile_lens(expr):
+    """Compiles expr into a flat function that walks raw values without
+    building a Maybe per hop. The result is cached on the expression."""
+    if expr._compiled is not None:
+        return expr._compiled
+
+    prefix, tail = _split(expr._ops)
+    namespace = {'Maybe': Maybe, 'NOTHING': NOTHING, 'Something': Something, 'maybe': maybe, '_subscript': _subscript}
+    if tail:
+        namespace['_tail'] = tail
+        namespace['_apply_ops'] = _apply_ops
+        exit_expr = '_apply_ops(NOTHING, _tail)'
+        result_expr = '_apply_ops(Something(value), _tail)'
+    else:
+        exit_expr = 'NOTHING'
+        result_expr = 'Something(value)'
+
+    guard = [line % {'exit': exit_expr} for line in _GUARD]
+    lines = ['def lens(value):'] + guard
+    for i, op in enumerate(prefix):
+        kind = op[0]
+        const = '_c%d' % i
+        if kind == _ATTR:
+            namespace[const] = op[1]
+            lines += ['    try:', '        value = getattr(value, %s, None)' % const,
+                      '    except Exception:', '        return %s' % exit_expr]
+        elif kind == _ITEM:
+            namespace[const] = op[1]
+            item = 'value[%s]' % const
+            if op[1].__class__ is slice:
+                item = '_subscript(value, %s)' % const
+            lines += ['    try:',
+                      '        value = value.get(%s) if value.__class__ is dict else %s' % (const, item),
+                      '    except (KeyError, TypeError, IndexError):', '        return %s' % exit_expr]
+        elif kind == _CALL:
+            namespace[const + 'a'], namespace[const + 'k'] = op[1], op[2]
+            lines.append('    value = value(*%sa, **%sk)' % (const, const))
+        else:
+            namespace[const] = op[2]
+            if op[3]:
+                lines.append('    value = %s %s value' % (const, op[1]))
+            else:
+                lines.append('    value = value %s %s' % (op[1], const))
+
+        lines += guard
+
+    lines.append('    return %s' % result_expr)
+    exec(compile('\n'.join(lines), '<lens %r>' % (expr,), 'exec'), namespace)
+    expr._compiled = namespace['lens']
+    return expr._compiled
@@ -0,0 +1,178 @@
+# -*- coding: utf-8 -*-
+"""Opt-in memoizing wrappers for objects with expensive attributes.
+
+``maybe(obj, memoize=True)`` returns a MemoizedSomething, which remembers the
+result of every attribute and item lookup made through it, Nothing included,
+so reading the same derived field again does not run the property again.
+Values found this way are wrapped as MemoizedSomething too, so whole chains
+are remembered:
+
+    >>> from pymaybe import maybe
+    >>> class Order(object):
+    ...     calls = 0
+    ...     @property
+    ...     def total(self):
+    ...         Order.calls += 1
+    ...         return 42
+    >>> order = maybe(Order(), memoize=True)
+    >>> order.total, order.total, order.discount
+    (Something(42), Something(42), Nothing)
+    >>> Order.calls
+    1
+    >>> order.invalidate('total')
+    >>> order.total.get(), Order.calls
+    (42, 2)
+
+Each wrapper keeps at most maxsize results, evicting the oldest first.
+Setting or deleting an attribute or item through the wrapper, and in-place
+operators, drop the affected results; changes made to the object directly
+need an explicit ``invalidate()``.
+"""
+
+from pymaybe import Maybe, NOTHING, Something
+
+MEMOIZE_CACHE_SIZE = 128
+
+_MISSING = object()
+
+
+def _memoized(result, maxsize):
+    if result.__class__ is Something:
+        return MemoizedSomething(result.get(), maxsize)
+
+    return result
+
+
+class MemoizedSomething(Something):
+    """A Something that caches its attribute and item lookups.
+
+    Results live in one plain dict per wrapper, keyed by attribute name, or
+    by a 1-tuple for item keys so the two never collide. Reads are a single
+    dict lookup without locking; concurrent misses may compute a result
+    twice. When the dict is full the oldest result is evicted.
+    """
+
+    __slots__ = ('__memo', '__maxsize')
+
+    def __init__(self, value, maxsize=MEMOIZE_CACHE_SIZE):
+        if maxsize < 1:
+            raise ValueError('maxsize must be at least 1')
+
+        Something.__init__(self, value)
+        _set_memo(self, {})
+        _set_maxsize(self, maxsize)
+
+    def __reduce__(self):
+        return MemoizedSomething, (self.get(), _get_maxsize(self))
+
+    def __reduce_ex__(self, protocol):
+        return self.__reduce__()
+
+    def __copy__(self):
+        return MemoizedSomething(self.get(), _get_maxsize(self))
+
+    def __deepcopy__(self, memo):
+        return MemoizedSomething(Something.__deepcopy__(self, memo).get(), _get_maxsize(self))
+
+    def __getattribute__(self, name):
+        # Remembered results are served before the normal lookup, which for
+        # a value attribute would first have to fail on the wrapper.
+        result = _get_memo(self).get(name, _MISSING)
+        if result is _MISSING:
+            return object.__getattribute__(self, name)
+
+        return result
+
+    def __getattr__(self, name):
+        result = _memoized(Something.__getattr__(self, name), _get_maxsize(self))
+        self._remember(name, result)
+        return result
+
+    def __getitem__(self, key):
+        memo = _get_memo(self)
+        try:
+            result = memo.get((key,), _MISSING)
+        except TypeError:
+            # Unhashable keys (such as slices before Python 3.12) are not cached.
+            return _memoized(Something.__getitem__(self, key), _get_maxsize(self))
+
+        if result is _MISSING:
+            result = _memoized(Something.__getitem__(self, key), _get_maxsize(self))
+            self._remember((key,), result)
+
+        return result
+
+    def _remember(self, key, result):
+        memo = _get_memo(self)
+        if len(memo) >= _get_maxsize(self):
+            try:
+                del memo[next(iter(memo))]
+            except (KeyError, RuntimeError, StopIteration):
+                pass  # Lost a race with another thread; the bound is approximate then.
+
+        memo[key] = result
+
+    def __setattr__(self, name, v):
+        Something.__setattr__(self, name, v)
+        _get_memo(self).pop(name, None)
+
+    def __delattr__(self, name):
+        delattr(self.get(), name)
+        _get_memo(self).pop(name, None)
+
+    def __setitem__(self, key, value):
+        Something.__setitem__(self, key, value)
+        self._forget_item(key)
+
+    def __delitem__(self, key):
+        Something.__delitem__(self, key)
+        self._forget_item(key)
+
+    def _forget_item(self, key):
+        if key.__class__ is slice:
+            # A slice assignment can change any index.
+            self.invalidate()
+            return
+
+        try:
+            _get_memo(self).pop((key,), None)
+        except TypeError:
+            self.invalidate()
+
+    def invalidate(self, *keys):
+        """Drops the remembered results for the given attribute names and item
+        keys, or all of them when none are given."""
+        memo = _get_memo(self)
+        if not keys:
+            memo.clear()
+            return
+
+        for key in keys:
+            memo.pop(key, None)
+            try:
+                memo.pop((key,), None)
+            except TypeError:
+                pass
+
+    def cached_count(self):
+        """Returns the number of remembered lookups."""
+        return len(_get_memo(self))
+
+
+_get_memo = MemoizedSomething._MemoizedSomething__memo.__get__
+_set_memo = MemoizedSomething._MemoizedSomething__memo.__set__
+_get_maxsize = MemoizedSomething._MemoizedSomething__maxsize.__get__
+_set_maxsize = MemoizedSomething._MemoizedSomething__maxsize.__set__
+
+
+def memoized(value, maxsize=MEMOIZE_CACHE_SIZE):
+    """Returns value wrapped in a MemoizedSomething, or Nothing for None."""
+    if isinstance(value, Maybe):
+        if value.__class__ is MemoizedSomething or value.is_none():
+            return value
+        value = value.get()
+
+    if value is None:
+        return NOTHING
+
+    return MemoizedSomething(value, maxsize)
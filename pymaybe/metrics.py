@@ -0,0 +1,251 @@
+# -*- coding: utf-8 -*-
+"""Opt-in hot path metrics.
+
+Nothing is recorded until metrics are enabled, either for the whole process
+with ``enable_metrics()`` or for the current context with ``metrics_context()``.
+While disabled, instrumented code only pays for a single flag check.
+"""
+
+from contextlib import contextmanager
+from functools import wraps
+from threading import Lock
+
+from pymaybe import Maybe
+
+try:
+    from time import perf_counter as _clock
+except ImportError:  # pragma: no cover
+    from time import time as _clock
+
+try:
+    from contextvars import ContextVar
+except ImportError:  # pragma: no cover
+    ContextVar = None
+
+LATENCY_BUCKETS = (1e-6, 2.5e-6, 5e-6, 1e-5, 2.5e-5, 5e-5, 1e-4, 2.5e-4, 5e-4, 1e-3, 1e-2, 0.1, 1.0)
+
+# True whenever a registry may be active, so hot paths can skip all metrics work with one check.
+active = False
+
+_process_registry = None
+_context_registry = ContextVar('pymaybe_metrics', default=None) if ContextVar is not None else None
+_context_users = 0
+_state_lock = Lock()
+
+
+class _PathStats(object):
+    __slots__ = ('hits', 'misses', 'miss_depths', 'buckets', 'latency_sum')
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.miss_depths = {}
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.latency_sum = 0.0
+
+    def snapshot(self):
+        cumulative = []
+        total = 0
+        for count in self.buckets:
+            total += count
+            cumulative.append(total)
+
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'miss_depths': dict(self.miss_depths),
+            'latency': {
+                'buckets': dict(zip(LATENCY_BUCKETS + (float('inf'),), cumulative)),
+                'sum': self.latency_sum,
+                'count': total,
+            },
+        }
+
+
+class MetricsRegistry(object):
+    """Collects per-path hit/miss counters, miss depths, latency histograms
+    and the exceptions swallowed by Something lookups."""
+
+    def __init__(self):
+        self._lock = Lock()
+        self._paths = {}
+        self._swallowed = {}
+
+    def record(self, path, hit, depth, seconds):
+        """Records one evaluation of path. depth is the hop that produced Nothing on a miss."""
+        with self._lock:
+            stats = self._paths.get(path)
+            if stats is None:
+                stats = self._paths[path] = _PathStats()
+
+            if hit:
+                stats.hits += 1
+            else:
+                stats.misses += 1
+                stats.miss_depths[depth] = stats.miss_depths.get(depth, 0) + 1
+
+            index = 0
+            for bound in LATENCY_BUCKETS:
+                if seconds <= bound:
+                    break
+                index += 1
+            stats.buckets[index] += 1
+            stats.latency_sum += seconds
+
+    def record_swallowed(self, operation, exc):
+        key = (operation, exc.__class__.__name__)
+        with self._lock:
+            self._swallowed[key] = self._swallowed.get(key, 0) + 1
+
+    def reset(self):
+        with self._lock:
+            self._paths.clear()
+            self._swallowed.clear()
+
+    def snapshot(self):
+        """Returns a plain dict copy of every metric."""
+        with self._lock:
+            return {
+                'paths': dict((path, stats.snapshot()) for path, stats in self._paths.items()),
+                'swallowed_exceptions': dict(
+                    ('%s:%s' % key, count) for key, count in self._swallowed.items()),
+            }
+
+    def to_prometheus(self, prefix='pymaybe'):
+        """Renders every metric in the Prometheus text exposition format."""
+        with self._lock:
+            paths = sorted((path, stats.snapshot()) for path, stats in self._paths.items())
+            swallowed = sorted(self._swallowed.items())
+
+        lines = []
+
+        def header(name, kind, doc):
+            lines.append('# HELP %s_%s %s' % (prefix, name, doc))
+            lines.append('# TYPE %s_%s %s' % (prefix, name, kind))
+
+        header('path_hits_total', 'counter', 'Path evaluations that produced Something.')
+        for path, stats in paths:
+            lines.append('%s_path_hits_total{path="%s"} %d' % (prefix, _escape(path), stats['hits']))
+
+        header('path_misses_total', 'counter', 'Path evaluations that produced Nothing, by failing hop.')
+        for path, stats in paths:
+            for depth, count in sorted(stats['miss_depths'].items()):
+                lines.append('%s_path_misses_total{path="%s",depth="%d"} %d' % (
+                    prefix, _escape(path), depth, count))
+
+        header('path_latency_seconds', 'histogram', 'Path evaluation latency.')
+        for path, stats in paths:
+            latency = stats['latency']
+            for bound, count in sorted(latency['buckets'].items()):
+                le = '+Inf' if bound == float('inf') else repr(bound)
+                lines.append('%s_path_latency_seconds_bucket{path="%s",le="%s"} %d' % (
+                    prefix, _escape(path), le, count))
+            lines.append('%s_path_latency_seconds_sum{path="%s"} %r' % (prefix, _escape(path), latency['sum']))
+            lines.append('%s_path_latency_seconds_count{path="%s"} %d' % (prefix, _escape(path), latency['count']))
+
+        header('swallowed_exceptions_total', 'counter', 'Exceptions turned into Nothing by Something lookups.')
+        for (operation, exception), count in swallowed:
+            lines.append('%s_swallowed_exceptions_total{operation="%s",exception="%s"} %d' % (
+                prefix, operation, exception, count))
+
+        return '\n'.join(lines) + '\n'
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _update_active():
+    global active
+    active = _process_registry is not None or _context_users > 0
+
+
+def enable_metrics(registry=None):
+    """Enables metrics for the whole process and returns the registry in use."""
+    global _process_registry
+    with _state_lock:
+        _process_registry = registry if registry is not None else MetricsRegistry()
+        _update_active()
+
+    return _process_registry
+
+
+def disable_metrics():
+    global _process_registry
+    with _state_lock:
+        _process_registry = None
+        _update_active()
+
+
+@contextmanager
+def metrics_context(registry=None):
+    """Records metrics into registry for code running in the current context
+    (thread or asyncio task) only. Requires Python 3.7+."""
+    global _context_users
+    if _context_registry is None:
+        raise RuntimeError('metrics_context requires contextvars (Python 3.7+)')
+
+    registry = registry if registry is not None else MetricsRegistry()
+    token = _context_registry.set(registry)
+    with _state_lock:
+        _context_users += 1
+        _update_active()
+
+    try:
+        yield registry
+    finally:
+        _context_registry.reset(token)
+        with _state_lock:
+            _context_users -= 1
+            _update_active()
+
+
+def current_registry():
+    """Returns the registry for the current context, falling back to the process registry."""
+    if _context_registry is not None:
+        registry = _context_registry.get()
+        if registry is not None:
+            return registry
+
+    return _process_registry
+
+
+def observe_path(path, walk, obj):
+    """Runs walk(obj) -> (value, depth) and records the outcome under path."""
+    registry = current_registry()
+    if registry is None:
+        return walk(obj)
+
+    start = _clock()
+    value, depth = walk(obj)
+    registry.record(path, value is not None, depth, _clock() - start)
+    return value, depth
+
+
+def record_swallowed(operation, exc):
+    registry = current_registry()
+    if registry is not None:
+        registry.record_swallowed(operation, exc)
+
+
+def instrument(name):
+    """Decorates a function returning a Maybe so its hits, misses and latency are recorded under name."""
+    def decorator(fn):
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not active:
+                return fn(*args, **kwargs)
+
+            registry = current_registry()
+            if registry is None:
+                return fn(*args, **kwargs)
+
+            start = _clock()
+            result = fn(*args, **kwargs)
+            hit = result is not None and not (isinstance(result, Maybe) and result.is_none())
+            registry.record(name, hit, 0, _clock() - start)
+            return result
+
+        return wrapper
+
+    return decorator
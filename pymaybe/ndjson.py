@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+
+import json
+import mmap
+import os
+
+from pymaybe.paths import maybe_path
+
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+
+def _compile_fields(fields):
+    """Normalizes fields into a tuple of (keys, default) pairs."""
+    if isinstance(fields, dict):
+        fields = fields.items()
+
+    compiled = []
+    for field in fields:
+        if isinstance(field, (tuple, list)):
+            path, default = field
+        else:
+            path, default = field, None
+
+        if isinstance(path, (tuple, list)):
+            keys = tuple(path)
+        else:
+            keys = tuple(key for _, key in maybe_path(path).segments)
+        compiled.append((keys, default))
+
+    return tuple(compiled)
+
+
+def _iter_chunked_lines(stream, chunk_size):
+    # A line longer than a chunk is collected piecewise and joined once.
+    pending = []
+    while True:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            break
+
+        end = chunk.find(b'\n')
+        if end == -1:
+            pending.append(chunk)
+            continue
+
+        pending.append(chunk[:end])
+        lines = chunk[end + 1:].split(b'\n')
+        yield b''.join(pending)
+        pending = [lines.pop()]
+        for line in lines:
+            yield line
+
+    tail = b''.join(pending)
+    if tail:
+        yield tail
+
+
+def _iter_mmap_lines(stream):
+    if os.fstat(stream.fileno()).st_size == 0:
+        return
+
+    mapped = mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ)
+    try:
+        start = 0
+        size = len(mapped)
+        while start < size:
+            end = mapped.find(b'\n', start)
+            if end == -1:
+                end = size
+            yield mapped[start:end]
+            start = end + 1
+    finally:
+        mapped.close()
+
+
+def _extract(record, fields):
+    row = []
+    for keys, default in fields:
+        value = record
+        for key in keys:
+            try:
+                value = value[key]
+            except (KeyError, TypeError, IndexError):
+                value = None
+
+            if value is None:
+                break
+
+        if value is None:
+            value = default() if callable(default) else default
+        row.append(value)
+
+    return tuple(row)
+
+
+def extract_ndjson(source, fields, chunk_size=DEFAULT_CHUNK_SIZE, use_mmap=False, loads=json.loads):
+    """Yields a tuple of extracted values for every record of a
+    newline-delimited JSON file.
+
+    source is a file path (str, bytes or os.PathLike) or a binary stream. fields is a sequence of paths or
+    (path, default) pairs, or a dict of path -> default. A path is either a
+    ``maybe_path`` string or a tuple of keys; tuple paths must be given as part
+    of a (path, default) pair. Each value is looked up with the same semantics
+    as ``maybe(record)[k1][k2]...or_else(default)``.
+
+    The input is read in chunk_size blocks (or memory-mapped with use_mmap)
+    so memory stays flat regardless of the file size. Blank lines are skipped.
+
+        >>> import io
+        >>> lines = io.BytesIO(b'{"user": {"id": 1}, "tags": ["a"]}\\n{"user": null}\\n')
+        >>> list(extract_ndjson(lines, [('user.id', 0), ('tags[0]', '')]))
+        [(1, 'a'), (0, '')]
+    """
+    fields = _compile_fields(fields)
+
+    if hasattr(source, '__fspath__'):
+        source = os.fspath(source)
+
+    if isinstance(source, (str, bytes)):
+        with open(source, 'rb') as stream:
+            for row in _extract_stream(stream, fields, chunk_size, use_mmap, loads):
+                yield row
+    else:
+        for row in _extract_stream(source, fields, chunk_size, use_mmap, loads):
+            yield row
+
+
+def _extract_stream(stream, fields, chunk_size, use_mmap, loads):
+    lines = _iter_mmap_lines(stream) if use_mmap else _iter_chunked_lines(stream, chunk_size)
+    for line in lines:
+        if not line.strip():
+            continue
+
+        yield _extract(loads(line), fields)
@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Executor, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from itertools import islice
+
+from pymaybe import maybe
+
+_EXECUTORS = {
+    'thread': ThreadPoolExecutor,
+    'process': ProcessPoolExecutor,
+}
+
+
+def _call_chunk(fn, chunk):
+    """Runs fn over chunk in a worker. Failures are returned as None, which becomes Nothing."""
+    results = []
+    for item in chunk:
+        try:
+            results.append(fn(item))
+        except Exception:
+            results.append(None)
+
+    return results
+
+
+def _chunks(iterable, chunksize):
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, chunksize))
+        if not chunk:
+            return
+        yield chunk
+
+
+def maybe_map(fn, iterable, executor='thread', chunksize=1, max_workers=None, max_in_flight=None, ordered=True):
+    """Applies fn to every item of iterable on an executor and yields the
+    results as Something/Nothing, the way ``maybe(fn)(item)`` would, except
+    that exceptions raised by fn also become Nothing.
+
+    executor is an Executor instance or ``'thread'`` (I/O-bound work) /
+    ``'process'`` (CPU-bound work, fn and items must be picklable), in which
+    case a pool with max_workers workers is created and shut down when the
+    generator finishes. Items are sent to workers in chunks of chunksize and
+    at most max_in_flight chunks (default: twice the worker count) are pending
+    at any time, so iterable is consumed lazily. Results come back in input
+    order unless ordered is False, in which case each chunk is yielded as
+    soon as it completes.
+
+        >>> list(maybe_map(lambda x: 10 // x, [1, 0, 5], chunksize=2))
+        [Something(10), Nothing, Something(2)]
+    """
+    owned = not isinstance(executor, Executor)
+    if owned:
+        executor = _EXECUTORS[executor](max_workers=max_workers)
+
+    if max_in_flight is None:
+        max_in_flight = 2 * (getattr(executor, '_max_workers', None) or max_workers or 1)
+
+    pending = deque()
+    chunks = _chunks(iterable, chunksize)
+    try:
+        for chunk in chunks:
+            pending.append(executor.submit(_call_chunk, fn, chunk))
+            if len(pending) < max_in_flight:
+                continue
+
+            for result in _drain(pending, ordered):
+                yield result
+
+        while pending:
+            for result in _drain(pending, ordered):
+                yield result
+    finally:
+        for future in pending:
+            future.cancel()
+        if owned:
+            executor.shutdown(wait=True)
+
+
+def _drain(pending, ordered):
+    """Removes at least one finished chunk from pending and returns its results as Maybes."""
+    if ordered:
+        done = [pending.popleft()]
+    else:
+        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            pending.remove(future)
+
+    return [maybe(value) for future in done for value in future.result()]
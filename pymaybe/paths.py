@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+
+import re
+
+from pymaybe import NOTHING, Maybe, _subscript, maybe
+from pymaybe import metrics as _metrics
+from pymaybe import tracing as _tracing
+from pymaybe._cache import LRUCache
+
+PATH_CACHE_SIZE = 1024
+
+_NAME = 0
+_ITEM = 1
+
+_SEGMENT_RE = re.compile(r"""
+      (?P<dot>\.)?(?P<name>[^.\[\]'"\s]+)
+    | \[\s*(?P<index>-?\d+)\s*\]
+    | \[\s*(?P<quote>['"])(?P<key>.*?)(?P=quote)\s*\]
+""", re.VERBOSE)
+
+_cache = LRUCache(PATH_CACHE_SIZE)
+
+
+def parse_path(path):
+    """Splits a path string into a tuple of (kind, key) segments.
+
+        >>> parse_path("items[0].price")
+        ((0, 'items'), (1, 0), (0, 'price'))
+        >>> parse_path("['first name']")
+        ((1, 'first name'),)
+    """
+    segments = []
+    pos = 0
+    length = len(path)
+    while pos < length:
+        match = _SEGMENT_RE.match(path, pos)
+        if match is None or (match.group('dot') and pos == 0):
+            raise ValueError('Invalid path %r at position %d' % (path, pos))
+
+        if match.group('name') is not None:
+            if pos > 0 and not match.group('dot'):
+                raise ValueError('Invalid path %r at position %d' % (path, pos))
+            segments.append((_NAME, match.group('name')))
+        elif match.group('index') is not None:
+            segments.append((_ITEM, int(match.group('index'))))
+        else:
+            segments.append((_ITEM, match.group('key')))
+
+        pos = match.end()
+
+    return tuple(segments)
+
+
+class MaybePath(object):
+    """A pre-parsed path that walks raw dicts, lists and objects in a single loop.
+
+    Name segments (``a.b``) look up keys on containers and attributes on any
+    other object. Bracket segments (``[0]``, ``['key']``) always look up items.
+    Missing keys, wrong types and out of range indexes produce Nothing exactly
+    like chaining ``Something.__getitem__`` / ``Something.__getattr__``.
+    """
+
+    __slots__ = ('path', 'segments')
+
+    def __init__(self, path):
+        self.path = path
+        self.segments = parse_path(path)
+
+    def __call__(self, obj):
+        if _metrics.active:
+            value, hop = _metrics.observe_path(self.path, self._walk, obj)
+        else:
+            value, hop = self._walk(obj)
+
+        if value is None:
+            if _tracing.enabled:
+                key = self.segments[hop][1] if hop < len(self.segments) else None
+                return _tracing.trace('path', key, None, hop)
+            return NOTHING
+
+        return maybe(value)
+
+    def _walk(self, obj):
+        """Returns (value, hop) where value is None if segment number hop came up empty."""
+        cur = obj
+        hop = 0
+        for kind, key in self.segments:
+            if isinstance(cur, Maybe):
+                cur = cur.get() if cur.is_some() else None
+
+            if cur is None:
+                return None, hop
+
+            if kind == _ITEM or hasattr(type(cur), '__getitem__'):
+                try:
+                    cur = cur.get(key) if type(cur) is dict else _subscript(cur, key)
+                except (KeyError, TypeError, IndexError):
+                    return None, hop
+            else:
+                try:
+                    cur = getattr(cur, key, None)
+                except Exception:
+                    return None, hop
+
+            if cur is None:
+                return None, hop
+
+            hop += 1
+
+        if isinstance(cur, Maybe) and cur.is_none():
+            return None, hop
+
+        return cur, hop
+
+    def __repr__(self):
+        return 'MaybePath(%r)' % self.path
+
+
+def maybe_path(path):
+    """Compiles path into a MaybePath, reusing previously compiled paths.
+
+        >>> get_price = maybe_path("items[0].price")
+        >>> get_price({'items': [{'price': 10}]})
+        Something(10)
+        >>> get_price({'items': []})
+        Nothing
+    """
+    compiled = _cache.get(path)
+    if compiled is None:
+        compiled = MaybePath(path)
+        _cache.put(path, compiled)
+
+    return compiled
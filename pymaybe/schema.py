@@ -0,0 +1,158 @@
+# -*- coding: utf-8 -*-
+
+from collections import namedtuple
+
+from pymaybe import Maybe, _subscript
+from pymaybe._cache import LRUCache
+from pymaybe.paths import maybe_path
+
+SCHEMA_CACHE_SIZE = 256
+
+Field = namedtuple('Field', 'name path default converter')
+
+_cache = LRUCache(SCHEMA_CACHE_SIZE)
+
+_SLICE = object()
+
+_LOOKUP = '''\
+    if %(parent)s is None:
+        %(var)s = None
+    elif %(parent)s.__class__ is dict:
+        %(var)s = %(parent)s.get(%(key)s)
+    else:
+        try:
+            %(var)s = %(item)s
+        except (KeyError, TypeError, IndexError):
+            %(var)s = None'''
+
+
+def _path_keys(path):
+    if isinstance(path, (tuple, list)):
+        return tuple(path)
+
+    return tuple(key for _, key in maybe_path(path).segments)
+
+
+def _trie_path(path):
+    # Slices are unhashable before Python 3.12, so they are keyed by their
+    # bounds. Keys are paired with their type so that 1, 1.0 and True, which
+    # compare equal but do not index alike, stay distinct.
+    return tuple((_SLICE, key.start, key.stop, key.step) if key.__class__ is slice else (key.__class__, key)
+                 for key in path)
+
+
+def _normalize(fields):
+    """Turns the accepted schema spellings into a tuple of Fields."""
+    if isinstance(fields, dict):
+        fields = [(name, path) for name, path in fields.items()]
+
+    normalized = []
+    for field in fields:
+        name, path, default, converter = (tuple(field) + (None, None))[:4]
+        normalized.append(Field(name, _path_keys(path), default, converter))
+
+    return tuple(normalized)
+
+
+def _generate(fields, output, dtype):
+    namespace = {'Maybe': Maybe, '_subscript': _subscript}
+    lines = [
+        'def extract(record):',
+        '    v0 = record',
+        '    if isinstance(v0, Maybe):',
+        '        v0 = v0.get() if v0.is_some() else None',
+    ]
+
+    # Each distinct key prefix is looked up once, so shared prefixes form a trie.
+    variables = {(): 'v0'}
+    for field in fields:
+        path = _trie_path(field.path)
+        for depth in range(1, len(path) + 1):
+            prefix = path[:depth]
+            if prefix in variables:
+                continue
+
+            var = 'v%d' % len(variables)
+            key = '_k%d' % len(variables)
+            namespace[key] = field.path[depth - 1]
+            parent = variables[prefix[:-1]]
+            item = '%s[%s]' % (parent, key)
+            if namespace[key].__class__ is slice:
+                item = '_subscript(%s, %s)' % (parent, key)
+            lines.append(_LOOKUP % {'parent': parent, 'var': var, 'key': key, 'item': item})
+            variables[prefix] = var
+
+    values = []
+    for i, field in enumerate(fields):
+        leaf = variables[_trie_path(field.path)]
+        found = leaf
+        if field.converter is not None:
+            namespace['_c%d' % i] = field.converter
+            found = '_c%d(%s)' % (i, leaf)
+
+        if field.default is None:
+            missing = 'None'
+        else:
+            namespace['_d%d' % i] = field.default
+            missing = '_d%d()' % i if callable(field.default) else '_d%d' % i
+
+        if found == leaf and missing == 'None':
+            values.append(leaf)
+        else:
+            values.append('(%s if %s is not None else %s)' % (found, leaf, missing))
+
+    if output == 'tuple':
+        lines.append('    return (%s,)' % ', '.join(values))
+    elif output == 'dict':
+        for i, field in enumerate(fields):
+            namespace['_n%d' % i] = field.name
+        lines.append('    return {%s}' % ', '.join('_n%d: %s' % (i, v) for i, v in enumerate(values)))
+    elif output == 'numpy':
+        import numpy as np
+        namespace['_row'] = lambda row: np.array(row, dtype=dtype)[()]
+        lines.append('    return _row((%s,))' % ', '.join(values))
+    else:
+        raise ValueError("output must be 'tuple', 'dict' or 'numpy', not %r" % (output,))
+
+    exec(compile('\n'.join(lines), '<schema>', 'exec'), namespace)
+    return namespace['extract']
+
+
+def compile_schema(fields, output='tuple', dtype=None):
+    """Compiles a record schema into a single generated extraction function.
+
+    fields is a sequence of ``(name, path[, default[, converter]])`` tuples or
+    a dict of name -> path, where a path is a ``maybe_path`` string or a tuple
+    of keys. Every field is looked up with the semantics of
+    ``maybe(record)[k1][k2]...``; converter is applied to values that are
+    found and default is used, like ``Nothing.or_else``, for the rest. Key
+    prefixes shared between fields are walked only once.
+
+    output selects the row type: ``'tuple'``, ``'dict'`` or ``'numpy'`` (a
+    structured row of dtype). Compiled schemas are cached.
+
+        >>> extract = compile_schema([
+        ...     ('id', 'payload.user.id'),
+        ...     ('name', 'payload.user.name', 'anonymous'),
+        ...     ('age', 'payload.user.age', 0, int),
+        ... ])
+        >>> extract({'payload': {'user': {'id': 7, 'age': '42'}}})
+        (7, 'anonymous', 42)
+        >>> extract({'payload': None})
+        (None, 'anonymous', 0)
+    """
+    fields = _normalize(fields)
+    # Fields compare by equality, so the types of names, keys and defaults
+    # are part of the key too; otherwise 0, 0.0 and False would share code.
+    types = tuple((field.name.__class__, _trie_path(field.path), field.default.__class__) for field in fields)
+    key = (fields, types, output, dtype)
+    try:
+        extract = _cache.get(key)
+    except TypeError:
+        return _generate(fields, output, dtype)
+
+    if extract is None:
+        extract = _generate(fields, output, dtype)
+        _cache.put(key, extract)
+
+    return extract
@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+
+from pymaybe import Nothing, Something
+
+_PLACEMENTS = {'first': (0, 1), 'last': (1, 0)}
+
+
+def maybe_sort_key(nothing='first'):
+    """Returns a key function that decorates a Maybe (or a plain value, with
+    None taken as Nothing) as a tuple once, so that sorted(), min(), max(),
+    heapq and bisect compare plain tuples instead of calling the Maybe
+    comparison methods on every step:
+
+        >>> from pymaybe import maybe
+        >>> sorted([maybe(3), maybe(None), maybe(1)], key=maybe_sort_key())
+        [Nothing, Something(1), Something(3)]
+        >>> sorted([3, None, 1], key=maybe_sort_key(nothing='last'))
+        [1, 3, None]
+
+    With nothing='first' the order is the one Something and Nothing define
+    (Nothing sorts before every value); 'last' puts Nothing after them.
+    """
+    try:
+        absent, present = _PLACEMENTS[nothing]
+    except KeyError:
+        raise ValueError("nothing must be 'first' or 'last', not %r" % (nothing,))
+
+    absent_key = (absent,)
+
+    def key(item):
+        klass = item.__class__
+        if klass is Something:
+            return (present, item.get())
+        if item is None or isinstance(item, Nothing):
+            return absent_key
+        if isinstance(item, Something):
+            return (present, item.get())
+
+        return (present, item)
+
+    return key
+
+
+def sort_maybes(iterable, nothing='first', reverse=False):
+    """Returns a new sorted list of the Maybe values in iterable. Nothing is
+    placed first or last as in ``maybe_sort_key`` whether or not the values
+    are sorted in reverse:
+
+        >>> from pymaybe import maybe
+        >>> sort_maybes([maybe(3), maybe(None), maybe(1)], nothing='last', reverse=True)
+        [Something(3), Something(1), Nothing]
+    """
+    if reverse and nothing in _PLACEMENTS:
+        nothing = 'first' if nothing == 'last' else 'last'
+
+    return sorted(iterable, key=maybe_sort_key(nothing), reverse=reverse)
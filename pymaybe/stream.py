@@ -0,0 +1,201 @@
+# -*- coding: utf-8 -*-
+
+from itertools import islice
+
+from pymaybe import Maybe, Something, maybe
+
+DEFAULT_CHUNK_SIZE = 256
+
+_STAGE = 'stage'
+_MAP = 'map'  # a stage that gives exactly one element per element
+_TAKE = 'take'
+
+
+def _unwrap(value):
+    if isinstance(value, Maybe):
+        return value.get() if value.is_some() else None
+
+    return value
+
+
+class MaybeStream(object):
+    """A lazy pipeline over an iterable, where every element is a Maybe.
+
+    Items are pulled from the source chunk_size at a time and pushed through
+    each stage as a whole chunk, so the per-item overhead is a list
+    comprehension step rather than a generator round trip or a wrapper per
+    stage. Nothing is evaluated until the stream is iterated, and only one
+    chunk is held in memory at a time:
+
+        >>> stream = MaybeStream([1, None, 3]).map(lambda x: x * 10)
+        >>> stream.collect()
+        [Something(10), Nothing, Something(30)]
+        >>> list(stream.or_else(0))
+        [10, 0, 30]
+        >>> list(MaybeStream(range(10)).filter_some(lambda x: x % 2).take(3).or_else())
+        [1, 3, 5]
+
+    Streams are immutable: every method returns a new stream over the same
+    source, which can be iterated once if it is a generator. After
+    ``or_else`` the elements are plain values; later stages treat them as
+    ``maybe(value)`` would.
+    """
+
+    __slots__ = ('_source', '_ops', '_raw', 'chunk_size')
+
+    def __init__(self, iterable, chunk_size=DEFAULT_CHUNK_SIZE):
+        if chunk_size < 1:
+            raise ValueError('chunk_size must be at least 1')
+
+        self._source = iterable
+        self._ops = ()
+        self._raw = False
+        self.chunk_size = chunk_size
+
+    # Internally elements are kept unwrapped, with None standing for Nothing,
+    # and are only wrapped when they leave a stream that is not raw.
+
+    def _extend(self, kind, arg, raw=None):
+        stream = MaybeStream(self._source, self.chunk_size)
+        stream._ops = self._ops + ((kind, arg),)
+        stream._raw = self._raw if raw is None else raw
+        return stream
+
+    def map(self, fn):
+        """Replaces every Something(x) with ``maybe(fn(x))``; Nothing is kept."""
+        def stage(chunk):
+            return [None if value is None else _unwrap(fn(value)) for value in chunk]
+
+        return self._extend(_MAP, stage, raw=False)
+
+    def flat_map(self, fn):
+        """Replaces every Something(x) with the elements of ``maybe(fn(x))``,
+        each wrapped with ``maybe()``; a None result adds no elements and
+        Nothing is kept."""
+        def stage(chunk):
+            result = []
+            for value in chunk:
+                if value is None:
+                    result.append(None)
+                    continue
+
+                produced = _unwrap(fn(value))
+                if produced is not None:
+                    result.extend(_unwrap(item) for item in Something(produced))
+            return result
+
+        return self._extend(_STAGE, stage, raw=False)
+
+    def filter_some(self, predicate=None):
+        """Drops Nothing, and the values predicate rejects if one is given."""
+        if predicate is None:
+            def stage(chunk):
+                return [value for value in chunk if value is not None]
+        else:
+            def stage(chunk):
+                return [value for value in chunk if value is not None and predicate(value)]
+
+        return self._extend(_STAGE, stage, raw=False)
+
+    def or_else(self, els=None):
+        """Unwraps every element, replacing Nothing with els (called per
+        element if callable), like ``Maybe.or_else``."""
+        if callable(els):
+            def stage(chunk):
+                return [els() if value is None else value for value in chunk]
+        else:
+            def stage(chunk):
+                return [els if value is None else value for value in chunk]
+
+        return self._extend(_MAP, stage, raw=True)
+
+    def take(self, n):
+        """Stops after n elements. map and or_else stages never see elements
+        past the limit; after filter_some or flat_map, up to a chunk of extra
+        source items may be read and passed through the stages before it."""
+        return self._extend(_TAKE, n)
+
+    def _chunks(self):
+        source = iter(self._source)
+        ops = self._ops
+        remaining = dict((i, op[1]) for i, op in enumerate(ops) if op[0] == _TAKE)
+        if any(n <= 0 for n in remaining.values()):
+            return
+
+        # ahead[i] lists the takes reached from before op i through one-to-one
+        # stages only; a chunk can be clipped to their limit right there.
+        ahead = [()] * (len(ops) + 1)
+        for i in range(len(ops) - 1, -1, -1):
+            kind = ops[i][0]
+            if kind == _TAKE:
+                ahead[i] = (i,) + ahead[i + 1]
+            elif kind == _MAP:
+                ahead[i] = ahead[i + 1]
+
+        def limit(size, i):
+            for k in ahead[i]:
+                size = min(size, remaining[k])
+            return size
+
+        while True:
+            chunk = [_unwrap(item) for item in islice(source, limit(self.chunk_size, 0))]
+            if not chunk:
+                return
+
+            exhausted = False
+            for i, (kind, arg) in enumerate(ops):
+                if kind == _TAKE:
+                    chunk = chunk[:remaining[i]]
+                    remaining[i] -= len(chunk)
+                    exhausted = exhausted or remaining[i] == 0
+                else:
+                    if kind == _MAP:
+                        chunk = chunk[:limit(len(chunk), i)]
+                    chunk = arg(chunk)
+
+                if not chunk:
+                    break
+
+            if chunk:
+                yield chunk
+
+            if exhausted:
+                return
+
+    def chunks(self):
+        """Yields the processed elements a chunk (a non-empty list) at a time."""
+        if self._raw:
+            return self._chunks()
+
+        return ([maybe(value) for value in chunk] for chunk in self._chunks())
+
+    def __iter__(self):
+        for chunk in self.chunks():
+            for item in chunk:
+                yield item
+
+    def batch(self, n):
+        """Yields the elements as lists of n (the last one may be shorter)."""
+        if n < 1:
+            raise ValueError('batch size must be at least 1')
+
+        pending = []
+        for chunk in self.chunks():
+            pending.extend(chunk)
+            while len(pending) >= n:
+                yield pending[:n]
+                del pending[:n]
+
+        if pending:
+            yield pending
+
+    def collect(self):
+        """Returns every element as a list."""
+        result = []
+        for chunk in self.chunks():
+            result.extend(chunk)
+
+        return result
+
+    def __repr__(self):
+        return 'MaybeStream(%r, chunk_size=%d, stages=%d)' % (self._source, self.chunk_size, len(self._ops))
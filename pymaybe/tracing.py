@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+"""Optional provenance for Nothing.
+
+When enabled, lookups that come up empty return a Nothing that remembers the
+failing operation, key or attribute name, exception type and (for compiled
+paths) hop index. Only those plain values are kept, never the exception
+instance, its traceback or any frame, so it is cheap enough for production.
+
+    >>> from pymaybe import maybe
+    >>> enable_provenance()
+    >>> provenance(maybe({'a': {}})['a']['b'].c)
+    Provenance(operation='getitem', key='b', exception=<class 'KeyError'>, hop=None)
+    >>> disable_provenance()
+    >>> provenance(maybe({'a': {}})['a']['b'].c) is None
+    True
+"""
+
+from collections import namedtuple
+
+from pymaybe import Nothing
+
+# Checked by the lookup hot paths; while False, misses return the shared NOTHING.
+enabled = False
+
+Provenance = namedtuple('Provenance', 'operation key exception hop')
+
+
+class TracedNothing(Nothing):
+    """A Nothing carrying the raw provenance fields of the lookup that produced it."""
+
+    __slots__ = ('_record',)
+
+    def __new__(cls, record):
+        self = object.__new__(cls)
+        self._record = record
+        return self
+
+
+def trace(operation, key, exception, hop=None):
+    return TracedNothing((operation, key, exception, hop))
+
+
+def provenance(value):
+    """Returns the Provenance of a traced Nothing, or None for any other value."""
+    if isinstance(value, TracedNothing):
+        return Provenance(*value._record)
+
+    return None
+
+
+def enable_provenance():
+    global enabled
+    enabled = True
+
+
+def disable_provenance():
+    global enabled
+    enabled = False
@@ -0,0 +1,225 @@
+# -*- coding: utf-8 -*-
+
+import operator
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+from pymaybe import NOTHING, Maybe, Nothing, NothingValueError, Something
+
+
+def _unwrap(value):
+    if isinstance(value, Maybe):
+        return value.get() if value.is_some() else None
+
+    return value
+
+
+class MaybeArray(object):
+    """A column of optional values stored as a NumPy array plus a boolean
+    "is some" mask.
+
+    Arithmetic, comparisons and ``or_else`` follow the semantics of
+    Something / Nothing element-wise, but run as batched array operations.
+    Arithmetic involving an absent element yields an absent element, and
+    dividing a present element by zero raises ZeroDivisionError. Absent
+    elements hold fill, by default the zero of the column's dtype.
+
+        >>> prices = MaybeArray([10, None, 30])
+        >>> (prices * 2).or_else(0).tolist()
+        [20, 0, 60]
+        >>> prices > 15
+        array([False, False,  True])
+    """
+
+    __slots__ = ('values', 'mask')
+
+    def __init__(self, values, mask=None, dtype=None, fill=None):
+        if np is None:
+            raise ImportError('MaybeArray requires numpy')
+
+        if mask is None:
+            if isinstance(values, np.ndarray) and values.dtype != object:
+                mask = np.ones(values.shape, dtype=bool)
+            else:
+                items = [_unwrap(v) for v in values]
+                mask = np.fromiter((v is not None for v in items), dtype=bool, count=len(items))
+                if fill is None:
+                    fill = _zero([v for v in items if v is not None], dtype)
+                values = [fill if v is None else v for v in items]
+
+        self.values = np.asarray(values, dtype=dtype)
+        self.mask = np.asarray(mask, dtype=bool)
+
+    def is_some(self):
+        return self.mask.copy()
+
+    def is_none(self):
+        return ~self.mask
+
+    def get(self):
+        if not self.mask.all():
+            raise NothingValueError('No such element')
+
+        return self.values
+
+    def or_else(self, els=None):
+        if callable(els):
+            els = els()
+
+        if els is None:
+            result = self.values.astype(object)
+            result[~self.mask] = None
+            return result
+
+        return np.where(self.mask, self.values, els)
+
+    def or_none(self):
+        return self.or_else()
+
+    def tolist(self):
+        return [Something(v) if m else NOTHING for v, m in zip(self.values.tolist(), self.mask.tolist())]
+
+    # region Containers Methods
+
+    def __len__(self):
+        return len(self.values)
+
+    def __iter__(self):
+        return iter(self.tolist())
+
+    def __getitem__(self, key):
+        values = self.values[key]
+        mask = self.mask[key]
+        if isinstance(mask, np.ndarray):
+            return MaybeArray(values, mask)
+
+        return Something(values.item() if isinstance(values, np.generic) else values) if mask else NOTHING
+
+    # endregion
+
+    # region Custom representation
+
+    def __repr__(self):
+        return 'MaybeArray([%s])' % ', '.join(
+            repr(v) if m else 'Nothing' for v, m in zip(self.values.tolist(), self.mask.tolist()))
+
+    # endregion
+
+    # region Comparison
+
+    def _compare(self, other, op, some_none, none_some, none_none):
+        values, mask, truthy = _operand(other)
+        if values is None:
+            return np.where(self.mask, some_none, none_none)
+
+        with np.errstate(all='ignore'):
+            raw = op(self.values, values)
+
+        if none_some is None:
+            none_some = truthy
+        return np.where(self.mask, np.where(mask, raw, some_none), np.where(mask, none_some, none_none))
+
+    def __eq__(self, other):
+        return self._compare(other, operator.eq, False, False, True)
+
+    def __ne__(self, other):
+        return ~self.__eq__(other)
+
+    def __lt__(self, other):
+        return self._compare(other, operator.lt, False, None, False)
+
+    def __gt__(self, other):
+        return self._compare(other, operator.gt, True, False, False)
+
+    def __le__(self, other):
+        return self._compare(other, operator.le, False, True, True)
+
+    def __ge__(self, other):
+        return self._compare(other, operator.ge, True, False, True)
+
+    __hash__ = None
+
+    # endregion
+
+
+def _zero(present, dtype):
+    """Returns the placeholder stored for absent elements: the zero of the
+    column's dtype, so that it never changes the inferred dtype (a 0 among
+    strings would turn into '0')."""
+    if dtype is None and not present:
+        return 0
+
+    return np.zeros(1, dtype=np.asarray(present, dtype=dtype).dtype if dtype is None else dtype)[0]
+
+
+def _check_divisor(op, divisor, mask):
+    # Absent elements hold placeholders, so NumPy's own warnings are silenced;
+    # a present zero divisor raises like the scalar Something operators do.
+    if op in _DIVISIONS and np.any((np.asarray(divisor) == 0) & mask):
+        raise ZeroDivisionError('division by zero')
+
+
+def _operand(other):
+    """Returns (values, mask, truthy) for the right hand side of an operation,
+    with values None for Nothing, which is never passed to the operator."""
+    if isinstance(other, MaybeArray):
+        return other.values, other.mask, True
+
+    if other is None or isinstance(other, Nothing):
+        return None, False, False
+
+    if isinstance(other, Something):
+        return other.get(), True, True
+
+    return other, True, np.asarray(other, dtype=bool)
+
+
+_DIVISIONS = frozenset([operator.floordiv, operator.truediv, operator.mod])
+
+
+def _absent(array):
+    return MaybeArray(array.values.copy(), np.zeros(array.mask.shape, dtype=bool))
+
+
+def _binary(op):
+    def method(self, other):
+        values, mask, _ = _operand(other)
+        if values is None:
+            return _absent(self)
+
+        mask = self.mask & mask
+        _check_divisor(op, values, mask)
+        with np.errstate(all='ignore'):
+            result = op(self.values, values)
+        return MaybeArray(result, mask)
+
+    return method
+
+
+def _reflected(op):
+    def method(self, other):
+        values, mask, _ = _operand(other)
+        if values is None:
+            return _absent(self)
+
+        mask = self.mask & mask
+        _check_divisor(op, self.values, mask)
+        with np.errstate(all='ignore'):
+            result = op(values, self.values)
+        return MaybeArray(result, mask)
+
+    return method
+
+
+for _name, _op in (('add', operator.add), ('sub', operator.sub), ('mul', operator.mul),
+                   ('floordiv', operator.floordiv), ('truediv', operator.truediv),
+                   ('div', operator.truediv), ('mod', operator.mod), ('pow', operator.pow),
+                   ('lshift', operator.lshift), ('rshift', operator.rshift),
+                   ('and', operator.and_), ('or', operator.or_), ('xor', operator.xor)):
+    setattr(MaybeArray, '__%s__' % _name, _binary(_op))
+    setattr(MaybeArray, '__r%s__' % _name, _reflected(_op))
+
+del _name, _op
@@ -65,6 +65,9 @@ setup(
     package_dir={'pymaybe': 'pymaybe'},
     include_package_data=True,
     install_requires=requirements,
+    extras_require={
+        'numpy': ['numpy'],
+    },
     license="BSD",
     zip_safe=False,
     keywords='pymaybe',
@@ -0,0 +1,176 @@
+# -*- coding: utf-8 -*-
+
+"""
+aio_cases
+----------------------------------
+
+Tests for `pymaybe.aio` module, loaded by test_aio on Python 3.6+ only since
+they use async generators.
+"""
+
+import asyncio
+import traceback
+import unittest
+
+from pymaybe import maybe, maybe_aiter, maybe_gather, Something, Nothing
+
+
+class Client(object):
+    async def fetch(self, value, delay=0):
+        await asyncio.sleep(delay)
+        return value
+
+    async def fail(self):
+        raise RuntimeError('boom')
+
+
+def run(coro):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.run_until_complete(loop.shutdown_asyncgens())
+        loop.close()
+
+
+class TestAwaitable(unittest.TestCase):
+
+    def test_awaitSomething_resolvesToMaybe(self):
+        async def main():
+            client = maybe(Client())
+            return (await client.fetch('value'), await client.fetch(None),
+                    await client.fail(), await client.missing(), await maybe(5))
+
+        value, none, failed, missing, plain = run(main())
+        self.assertIsInstance(value, Something)
+        self.assertEqual(value, 'value')
+        self.assertIsInstance(none, Nothing)
+        self.assertIsInstance(failed, Nothing)
+        self.assertIsInstance(missing, Nothing)
+        self.assertEqual(plain, 5)
+
+    def test_orElseAsync_acceptsAsyncFactories(self):
+        async def default():
+            return 'default'
+
+        async def main():
+            return (await maybe(None).or_else_async(default), await maybe(None).or_else_async('x'),
+                    await maybe(None).or_else_async(lambda: 'y'), await maybe(1).or_else_async(default))
+
+        self.assertEqual(run(main()), ('default', 'x', 'y', 1))
+
+
+class TestMaybeGather(unittest.TestCase):
+
+    def test_gather_returnsMaybesInOrder(self):
+        client = Client()
+        results = run(maybe_gather(client.fetch(1), client.fail(), client.fetch(None),
+                                   maybe(client).fetch(4), maybe(None).fetch()))
+        self.assertEqual(results, [1, Nothing(), Nothing(), 4, Nothing()])
+
+    def test_gather_timeoutBecomesNothing(self):
+        client = Client()
+        results = run(maybe_gather(client.fetch(1), client.fetch(2, delay=5), timeout=0.05))
+        self.assertEqual(results, [1, Nothing()])
+
+    def test_gather_respectsLimit(self):
+        running = []
+        peak = []
+
+        async def task(i):
+            running.append(i)
+            peak.append(len(running))
+            await asyncio.sleep(0.01)
+            running.remove(i)
+            return i
+
+        results = run(maybe_gather(*[task(i) for i in range(10)], limit=3))
+        self.assertEqual(results, list(range(10)))
+        self.assertEqual(max(peak), 3)
+
+
+async def stream(values, delay=0, log=None):
+    for value in values:
+        if log is not None:
+            log.append(('produced', value))
+        await asyncio.sleep(delay)
+        yield value
+
+
+async def collect(aiterable, log=None):
+    results = []
+    async for item in aiterable:
+        if log is not None:
+            log.append(('consumed', item.or_none()))
+        results.append(item)
+    return results
+
+
+class TestAsyncIteration(unittest.TestCase):
+
+    def test_asyncFor_overSomething(self):
+        results = run(collect(maybe(stream([1, None, 3]))))
+        self.assertEqual(results, [1, Nothing(), 3])
+        self.assertTrue(all(isinstance(r, (Something, Nothing)) for r in results))
+
+    def test_asyncFor_overNothingAndPlainValues(self):
+        self.assertEqual(run(collect(maybe(None))), [])
+        self.assertEqual(run(collect(maybe([1, None]))), [1, Nothing()])
+        self.assertEqual(run(collect(maybe(5))), [5])
+
+    def test_prefetch_matchesPlainIteration(self):
+        for prefetch in (0, 1, 4, 100):
+            results = run(collect(maybe_aiter(maybe(stream(range(10))), prefetch=prefetch)))
+            self.assertEqual(results, list(range(10)))
+
+    def test_prefetch_pullsAheadOfConsumer(self):
+        log = []
+
+        async def main():
+            async for item in maybe_aiter(stream(range(6), log=log), prefetch=3):
+                log.append(('consumed', item.get()))
+                await asyncio.sleep(0.01)
+
+        run(main())
+        # By the time the first element is consumed, later ones have been produced.
+        first_consumed = log.index(('consumed', 0))
+        self.assertIn(('produced', 2), log[:first_consumed + 2])
+        self.assertEqual([e for e in log if e[0] == 'consumed'], [('consumed', i) for i in range(6)])
+
+    def test_prefetch_reraisesSourceErrors(self):
+        async def failing():
+            yield 1
+            raise RuntimeError('boom')
+
+        async def main():
+            results = []
+            try:
+                async for item in maybe_aiter(failing(), prefetch=2):
+                    results.append(item)
+            except RuntimeError as e:
+                return results, e
+
+        results, error = run(main())
+        self.assertEqual(results, [1])
+        self.assertEqual(str(error), 'boom')
+        frames = [frame.name for frame in traceback.extract_tb(error.__traceback__)]
+        self.assertIn('failing', frames)
+
+    def test_prefetch_cancelsProducerOnClose(self):
+        produced = []
+
+        async def main():
+            iterator = maybe_aiter(stream(range(1000), log=produced), prefetch=2)
+            async for item in iterator:
+                break
+            await iterator.aclose()
+            count = len(produced)
+            await asyncio.sleep(0.01)
+            return count
+
+        count = run(main())
+        self.assertEqual(len(produced), count)
+        self.assertLess(count, 10)
+
+    def test_maybeAiter_nothing(self):
+        self.assertEqual(run(collect(maybe_aiter(Nothing(), prefetch=4))), [])
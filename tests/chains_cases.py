@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+
+"""
+chains_cases
+----------------------------------
+
+Tests for `pymaybe.chains` module, loaded by test_chains on Python 3.5+ only
+since they use keyword-only parameters.
+"""
+
+import unittest
+
+from pymaybe import maybe, maybe_chains
+
+
+class TestKeywordOnlyArguments(unittest.TestCase):
+
+    def test_keepsFunctionMetadata(self):
+        def documented(record, key='a', *args, flag=True, **kwargs):
+            """Docs."""
+            return maybe(record)[key].or_else(flag)
+
+        documented.custom = 1
+        rewritten = maybe_chains(documented)
+        self.assertEqual(rewritten.__name__, 'documented')
+        self.assertEqual(rewritten.__doc__, 'Docs.')
+        self.assertEqual(rewritten.custom, 1)
+        self.assertTrue(rewritten.__wrapped__ is documented)
+        self.assertEqual(rewritten({}), True)
+        self.assertEqual(rewritten({}, flag=False), False)
+        self.assertEqual(rewritten({'b': 2}, 'b'), 2)
@@ -0,0 +1,19 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+test_aio
+----------------------------------
+
+Tests for `pymaybe.aio` module.
+"""
+
+import sys
+import unittest
+
+if sys.version_info >= (3, 6):
+    from tests.aio_cases import TestAwaitable, TestMaybeGather, TestAsyncIteration  # noqa: F401
+
+
+if __name__ == '__main__':
+    unittest.main()
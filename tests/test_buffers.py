@@ -0,0 +1,137 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+test_buffers
+----------------------------------
+
+Tests for `pymaybe.buffers` module.
+"""
+
+import doctest
+import unittest
+
+from pymaybe import M, compile_lens, compile_schema, maybe, maybe_view, Something, Nothing
+from pymaybe.paths import _ITEM, MaybePath
+
+try:
+    from pymaybe import maybe_chains
+except ImportError:  # Python < 3.5
+    maybe_chains = None
+
+
+def load_tests(loader, tests, ignore):
+    import pymaybe.buffers
+    tests.addTests(doctest.DocTestSuite(pymaybe.buffers, optionflags=doctest.ELLIPSIS))
+    return tests
+
+
+PAYLOAD = bytes(bytearray(range(256))) * 16
+
+
+def _sliced(value, key):
+    return maybe(value)[key].or_none()
+
+
+_sliced_rewritten = maybe_chains(_sliced) if maybe_chains is not None else None
+
+
+class TestMaybeView(unittest.TestCase):
+
+    def test_wrapsBuffers(self):
+        for value in (PAYLOAD, bytearray(PAYLOAD), memoryview(PAYLOAD), maybe(PAYLOAD)):
+            view = maybe_view(value)
+            self.assertIsInstance(view, Something)
+            self.assertIsInstance(view.get(), memoryview)
+
+        self.assertIsInstance(maybe_view(None), Nothing)
+        self.assertIsInstance(maybe_view(Nothing()), Nothing)
+        with self.assertRaises(TypeError):
+            maybe_view(42)
+
+    def test_slicingDoesNotCopy(self):
+        data = bytearray(PAYLOAD)
+        header = maybe_view(data)[16:32][4:8]
+        self.assertIsInstance(header.get(), memoryview)
+        self.assertEqual(header.get().tobytes(), PAYLOAD[20:24])
+
+        data[20] = 255
+        self.assertEqual(header.get()[0], 255)
+
+    def test_sliceSemanticsMatchBytesInRange(self):
+        view = maybe_view(PAYLOAD)
+        for key in (slice(None), slice(0, 10), slice(-10, None), slice(5, 1), slice(None, None, -3),
+                    slice(len(PAYLOAD), None), slice(-len(PAYLOAD), 3)):
+            self.assertEqual(view[key].get(copy=True), PAYLOAD[key])
+
+    def test_outOfRangeAndInvalidSlicesAreNothing(self):
+        view = maybe_view(PAYLOAD)
+        size = len(PAYLOAD)
+        for key in (slice(0, size + 1), slice(size + 1, None), slice(-size - 1, 2),
+                    slice(None, None, 0), slice('a', 2), slice(1.5, 2)):
+            self.assertIsInstance(view[key], Nothing, key)
+
+        self.assertIsInstance(view['a'], Nothing)
+        self.assertIsInstance(view[size], Nothing)
+        self.assertIsInstance(maybe_view(b'')[0:1], Nothing)
+
+    def test_indexing(self):
+        view = maybe_view(PAYLOAD)
+        self.assertEqual(view[1], 1)
+        self.assertEqual(view[-1], 255)
+
+    def test_getCopy(self):
+        view = maybe_view(PAYLOAD)[0:4]
+        self.assertIsInstance(view.get(), memoryview)
+        copied = view.get(copy=True)
+        self.assertEqual(copied, PAYLOAD[0:4])
+        self.assertTrue(copied.__class__ is bytes)
+
+    def test_plainBytesAreUnchanged(self):
+        self.assertEqual(maybe(PAYLOAD)[0:4], PAYLOAD[0:4])
+        self.assertEqual(maybe(PAYLOAD)[0:len(PAYLOAD) + 10], PAYLOAD)
+
+
+class TestSliceSemanticsEverywhere(unittest.TestCase):
+
+    KEYS = (slice(2, 4), slice(2, 100), slice(-100, None), slice(None, None, 0), slice(1, None), slice('a', 2))
+
+    def assertSameResult(self, result, expected, key):
+        if expected is None:
+            self.assertIsNone(result, key)
+        else:
+            self.assertEqual(bytes(result), bytes(expected), key)
+
+    def test_rewrittenChainsMatchDynamic(self):
+        if _sliced_rewritten is None:
+            self.skipTest('maybe_chains requires Python 3.5+')
+
+        self.assertIsNot(_sliced_rewritten, _sliced)
+        view = memoryview(b'abcdef')
+        for key in self.KEYS:
+            self.assertSameResult(_sliced_rewritten(view, key), _sliced(view, key), key)
+
+    def test_lensesSchemasAndPathsMatchDynamic(self):
+        record = {'data': memoryview(b'abcdef')}
+        for key in self.KEYS:
+            expected = maybe(record)['data'][key].or_none()
+            self.assertSameResult(compile_lens(M['data'][key])(record).or_none(), expected, key)
+            self.assertSameResult(compile_schema([('s', ('data', key))])(record)[0], expected, key)
+
+            path = MaybePath('data')
+            path.segments += ((_ITEM, key),)
+            self.assertSameResult(path(record).or_none(), expected, key)
+
+
+class TestGetCopy(unittest.TestCase):
+
+    def test_shallowCopiesOtherValues(self):
+        value = {'a': [1]}
+        copied = maybe(value).get(copy=True)
+        self.assertEqual(copied, value)
+        self.assertFalse(copied is value)
+        self.assertTrue(copied['a'] is value['a'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,171 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+test_caching
+----------------------------------
+
+Tests for `pymaybe.caching` module.
+"""
+
+import threading
+import unittest
+
+from pymaybe import maybe_cached, Something, Nothing
+
+
+class FakeTimer(object):
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestMaybeCached(unittest.TestCase):
+
+    def setUp(self):
+        self.calls = []
+        self.timer = FakeTimer()
+        self.data = {'a': 1, 'b': 2, 'c': 3}
+
+    def lookup_fn(self, **options):
+        @maybe_cached(timer=self.timer, **options)
+        def lookup(key):
+            self.calls.append(key)
+            return self.data.get(key)
+
+        return lookup
+
+    def test_bareDecorator(self):
+        @maybe_cached
+        def double(x):
+            self.calls.append(x)
+            return x * 2
+
+        self.assertEqual(double(2), 4)
+        self.assertIsInstance(double(2), Something)
+        self.assertEqual(self.calls, [2])
+
+    def test_cachesSomethingAndNothing(self):
+        lookup = self.lookup_fn()
+        self.assertEqual(lookup('a'), 1)
+        self.assertEqual(lookup('a'), 1)
+        self.assertIsInstance(lookup('x'), Nothing)
+        self.assertIsInstance(lookup('x'), Nothing)
+        self.assertEqual(self.calls, ['a', 'x'])
+
+        info = lookup.cache_info()
+        self.assertEqual((info.hits, info.nothing_hits, info.misses), (1, 1, 2))
+        self.assertEqual((info.currsize, info.nothing_currsize), (1, 1))
+
+    def test_inPlaceOperatorsDoNotChangeCachedResults(self):
+        lookup = self.lookup_fn()
+        first = lookup('a')
+        first += 10
+        self.assertEqual(first, 11)
+
+        second = lookup('a')
+        self.assertEqual(second, 1)
+        second += 5
+        self.assertEqual(lookup('a'), 1)
+        self.assertEqual(self.calls, ['a'])
+
+    def test_independentTtls(self):
+        lookup = self.lookup_fn(ttl=100, nothing_ttl=10)
+        lookup('a')
+        lookup('x')
+        self.timer.now = 50
+        lookup('a')
+        lookup('x')
+        self.assertEqual(self.calls, ['a', 'x', 'x'])
+        self.assertEqual(lookup.cache_info().expirations, 1)
+
+        self.timer.now = 200
+        lookup('a')
+        self.assertEqual(self.calls, ['a', 'x', 'x', 'a'])
+
+    def test_independentCapacities_evictLeastRecentlyUsed(self):
+        lookup = self.lookup_fn(maxsize=2, nothing_maxsize=1)
+        lookup('a')
+        lookup('b')
+        lookup('a')
+        lookup('c')  # evicts 'b'
+        lookup('x')
+        lookup('y')  # evicts 'x'
+        del self.calls[:]
+
+        lookup('a')
+        lookup('c')
+        lookup('y')
+        self.assertEqual(self.calls, [])
+        lookup('b')
+        lookup('x')
+        self.assertEqual(self.calls, ['b', 'x'])
+
+        info = lookup.cache_info()
+        self.assertEqual((info.evictions, info.nothing_evictions), (2, 2))
+
+    def test_negativeCachingCanBeDisabled(self):
+        lookup = self.lookup_fn(nothing_maxsize=0)
+        lookup('x')
+        lookup('x')
+        self.assertEqual(self.calls, ['x', 'x'])
+
+    def test_negativeCacheCanBeUnboundedAndNeverExpire(self):
+        lookup = self.lookup_fn(maxsize=1, ttl=10, nothing_maxsize=None, nothing_ttl=None)
+        for key in ('x', 'y', 'z'):
+            lookup(key)
+        self.timer.now = 100.0
+        for key in ('x', 'y', 'z'):
+            lookup(key)
+        self.assertEqual(self.calls, ['x', 'y', 'z'])
+
+        info = lookup.cache_info()
+        self.assertEqual((info.maxsize, info.nothing_maxsize, info.nothing_currsize), (1, None, 3))
+
+    def test_invalidateAndClear(self):
+        lookup = self.lookup_fn()
+        lookup('x')
+        self.data['x'] = 'now present'
+        lookup.invalidate('x')
+        self.assertEqual(lookup('x'), 'now present')
+
+        lookup.cache_clear()
+        self.assertEqual(lookup.cache_info().currsize, 0)
+        self.assertEqual(lookup.cache_info().hits, 0)
+
+    def test_kwargsAndUnhashableArguments(self):
+        @maybe_cached
+        def join(items, sep=','):
+            self.calls.append(sep)
+            return sep.join(items)
+
+        self.assertEqual(join(('a', 'b'), sep='-'), 'a-b')
+        self.assertEqual(join(('a', 'b'), sep='-'), 'a-b')
+        self.assertEqual(join(['a', 'b']), 'a,b')
+        self.assertEqual(join(['a', 'b']), 'a,b')
+        self.assertEqual(self.calls, ['-', ',', ','])
+        join.invalidate(['a', 'b'])
+        join.invalidate(('a', 'b'), sep=[])
+
+    def test_threadSafety(self):
+        lookup = self.lookup_fn(maxsize=8)
+
+        def worker():
+            for i in range(200):
+                lookup(('a', 'b', 'c', 'x', 'y')[i % 5] + str(i % 11))
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        info = lookup.cache_info()
+        self.assertEqual(info.hits + info.nothing_hits + info.misses, 1600)
+        self.assertTrue(info.currsize <= 8)
+
+
+if __name__ == '__main__':
+    unittest.main()
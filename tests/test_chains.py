@@ -0,0 +1,159 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+test_chains
+----------------------------------
+
+Tests for `pymaybe.chains` module.
+"""
+
+import doctest
+import sys
+import unittest
+
+from pymaybe import maybe, NothingValueError, Something, NOTHING, enable_metrics, disable_metrics
+
+if sys.version_info >= (3, 5):
+    from pymaybe import maybe_chains
+    from pymaybe.chains import _cache
+    from tests.chains_cases import TestKeywordOnlyArguments  # noqa: F401
+
+
+def load_tests(loader, tests, ignore):
+    if sys.version_info >= (3, 5):
+        import pymaybe.chains
+        tests.addTests(doctest.DocTestSuite(pymaybe.chains))
+    return tests
+
+
+class User(object):
+    def __init__(self, name=None, address=None):
+        self.name = name
+        self.address = address
+
+    def lookup(self, key, default=None):
+        return {'zip': '10001'}.get(key, default)
+
+    @property
+    def broken(self):
+        raise RuntimeError('boom')
+
+
+def chains(record, key='tags', index=0):
+    return (
+        maybe(record)['user'].name.or_else('anonymous'),
+        maybe(record)['user'].address['city'].or_none(),
+        maybe(record)[key][index].or_else(lambda: 'none'),
+        maybe(record)['user'].lookup('zip', default='?').or_else(),
+        maybe(record)['user'].broken.is_some(),
+        maybe(record)['count'].is_none(),
+        maybe(record)['nested']['value'].or_else(els=-1),
+    )
+
+
+RECORDS = [
+    {'user': User('eran', {'city': 'NYC'}), 'tags': ['a', 'b'], 'count': 0, 'nested': {'value': 0}},
+    {'user': User(), 'tags': [], 'nested': {'value': Something(3)}},
+    {'user': None, 'tags': 'xyz', 'nested': {'value': NOTHING}},
+    {'user': {'name': 'dict'}, 'tags': {0: 'zero'}, 'nested': None},
+    {'user': maybe(User('wrapped')), 'tags': None, 'nested': []},
+    {},
+    [],
+    'text',
+    None,
+]
+
+
+@unittest.skipIf(sys.version_info < (3, 5), 'maybe_chains requires Python 3.5+')
+class TestMaybeChains(unittest.TestCase):
+
+    def test_matchesDynamicChains(self):
+        rewritten = maybe_chains(chains)
+        self.assertTrue(rewritten is not chains)
+        for record in RECORDS:
+            self.assertEqual(rewritten(record), chains(record))
+            self.assertEqual(rewritten(record, 'tags', 1), chains(record, 'tags', 1))
+
+    def test_getRaises(self):
+        @maybe_chains
+        def get_name(record):
+            return maybe(record)['user'].name.get()
+
+        self.assertEqual(get_name({'user': User('eran')}), 'eran')
+        with self.assertRaises(NothingValueError):
+            get_name({})
+
+    def test_argumentsAreEvaluatedOnce(self):
+        calls = []
+
+        def key(name):
+            calls.append(name)
+            return name
+
+        @maybe_chains
+        def lookup(record):
+            return maybe(record)[key('a')][key('b')].or_else(key('default'))
+
+        self.assertEqual(lookup({'a': {'b': 1}}), 1)
+        self.assertEqual(lookup(None), 'default')
+        self.assertEqual(calls, ['a', 'b', 'default'] * 2)
+
+    def test_nestedChainsAndLambdas(self):
+        @maybe_chains
+        def nested(records):
+            return [maybe(r)['a'].or_else(maybe(r)['b'].or_else(0)) for r in records]
+
+        self.assertEqual(nested([{'a': 1}, {'b': 2}, None]), [1, 2, 0])
+
+    def test_unsupportedChainsAreLeftDynamic(self):
+        @maybe_chains
+        def sliced(record):
+            return maybe(record)['items'][1:].or_else([])
+
+        self.assertEqual(sliced({'items': [1, 2, 3]}), [2, 3])
+        self.assertEqual(sliced({}), [])
+
+    def test_returnsFunctionUnchanged(self):
+        captured = 'x'
+
+        def closure(record):
+            return maybe(record)[captured].or_none()
+
+        def no_chains(record):
+            return record
+
+        def shadowed(maybe):
+            return maybe.or_none()
+
+        for fn in (closure, no_chains, shadowed):
+            self.assertTrue(maybe_chains(fn) is fn)
+
+    def test_outerDecoratorsAreKept(self):
+        def twice(fn):
+            return lambda record: [fn(record)] * 2
+
+        @twice
+        @maybe_chains
+        def wrapped(record):
+            return maybe(record)['a'].or_else(0)
+
+        self.assertEqual(wrapped({'a': 1}), [1, 1])
+
+    def test_compiledRewriteIsCached(self):
+        maybe_chains(chains)
+        self.assertTrue(chains.__code__ in _cache)
+        self.assertEqual(maybe_chains(chains)(RECORDS[0]), chains(RECORDS[0]))
+
+    def test_metricsStillRecordSwallowedErrors(self):
+        rewritten = maybe_chains(chains)
+        registry = enable_metrics()
+        try:
+            rewritten(RECORDS[7])
+        finally:
+            disable_metrics()
+        self.assertTrue(registry.snapshot()['swallowed_exceptions'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,143 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+test_compact
+----------------------------------
+
+Tests for `pymaybe.compact` module.
+"""
+
+import doctest
+import sys
+import unittest
+from array import array
+
+from pymaybe import maybe, MaybeList, Something, Nothing
+
+
+def load_tests(loader, tests, ignore):
+    import pymaybe.compact
+    tests.addTests(doctest.DocTestSuite(pymaybe.compact))
+    return tests
+
+
+VALUES = [1, None, 3, None, 5, 6, 7, 8, None, 10, 11]
+
+
+class TestMaybeList(unittest.TestCase):
+
+    def test_elementAccess(self):
+        for typecode in (None, 'q'):
+            items = MaybeList(VALUES, typecode=typecode)
+            self.assertEqual(len(items), len(VALUES))
+            for i, value in enumerate(VALUES):
+                self.assertEqual(items[i], maybe(value))
+            self.assertEqual(items[-1], Something(11))
+            self.assertIsInstance(items[1], Nothing)
+
+    def test_characterTypecode(self):
+        # 'u' is deprecated in favour of 'w' from Python 3.13 on.
+        letters = MaybeList(['a', None, Something('c')], 'w' if sys.version_info >= (3, 13) else 'u')
+        self.assertEqual(letters.or_none(), ['a', None, 'c'])
+        self.assertEqual(letters.or_else('-').tolist(), ['a', '-', 'c'])
+        letters[0] = None
+        self.assertEqual(letters[0], Nothing())
+        self.assertEqual(MaybeList([None], 'd')._values.tolist(), [0.0])
+
+    def test_indexOutOfRange(self):
+        items = MaybeList([1, 2])
+        with self.assertRaises(IndexError):
+            items[2]
+        with self.assertRaises(IndexError):
+            items[-3]
+
+    def test_iteration(self):
+        self.assertEqual(list(MaybeList(VALUES, 'q')), [maybe(v) for v in VALUES])
+
+    def test_maybeValuesAreUnwrapped(self):
+        items = MaybeList([Something(1), Nothing(), maybe(None), 4], 'q')
+        self.assertEqual(items.or_none(), [1, None, None, 4])
+
+    def test_slicing(self):
+        items = MaybeList(VALUES, 'q')
+        for s in (slice(2, 9), slice(None, None, -1), slice(1, None, 3), slice(5, 2)):
+            sliced = items[s]
+            self.assertIsInstance(sliced, MaybeList)
+            self.assertEqual(sliced.typecode, 'q')
+            self.assertEqual(sliced.or_none(), VALUES[s])
+
+    def test_appendAndExtend(self):
+        items = MaybeList(typecode='d')
+        items.append(1.5)
+        items.append(None)
+        items.extend([None, 2.5])
+        self.assertEqual(items.or_none(), [1.5, None, None, 2.5])
+
+    def test_rejectedAppendLeavesListUnchanged(self):
+        for head in ([], [1, None] * 4):
+            items = MaybeList(head, 'q')
+            with self.assertRaises(TypeError):
+                items.append('x')
+            self.assertEqual(len(items), len(head))
+            items.append(None)
+            self.assertEqual(items.or_none(), head + [None])
+            self.assertEqual(list(items.or_else(0)), [0 if v is None else v for v in head + [None]])
+
+    def test_extendFromMaybeList(self):
+        # Byte-aligned (bulk) and unaligned extends must agree.
+        for head in ([], VALUES[:8], VALUES[:3]):
+            items = MaybeList(head, 'q')
+            items.extend(MaybeList(VALUES, 'q'))
+            self.assertEqual(items.or_none(), head + VALUES)
+
+    def test_extendWithItself(self):
+        items = MaybeList([1, None, 3])
+        items.extend(items)
+        self.assertEqual(items.or_none(), [1, None, 3, 1, None, 3])
+
+    def test_setitem(self):
+        items = MaybeList(VALUES, 'q')
+        items[0] = None
+        items[1] = Something(2)
+        items[-1] = Nothing()
+        self.assertEqual(items.or_none(), [None, 2] + VALUES[2:-1] + [None])
+
+    def test_orElse(self):
+        typed = MaybeList(VALUES, 'q')
+        filled = typed.or_else(0)
+        self.assertIsInstance(filled, array)
+        self.assertEqual(filled.tolist(), [0 if v is None else v for v in VALUES])
+        self.assertEqual(typed.or_else(lambda: -1).tolist(), [-1 if v is None else v for v in VALUES])
+        self.assertEqual(typed.or_else(), VALUES)
+
+        objects = MaybeList(['a', None, 'c'])
+        self.assertEqual(objects.or_else('-'), ['a', '-', 'c'])
+
+    def test_orElseDoesNotMutate(self):
+        items = MaybeList(VALUES, 'q')
+        items.or_else(0)
+        self.assertEqual(items.or_none(), VALUES)
+
+    def test_countSome(self):
+        self.assertEqual(MaybeList(VALUES).count_some(), 8)
+        self.assertEqual(MaybeList().count_some(), 0)
+
+    def test_equality(self):
+        self.assertEqual(MaybeList(VALUES, 'q'), MaybeList(VALUES))
+        self.assertNotEqual(MaybeList(VALUES), MaybeList(VALUES[:-1]))
+        self.assertNotEqual(MaybeList([1, None]), MaybeList([1, 0]))
+
+    def test_repr(self):
+        self.assertEqual(repr(MaybeList([1, None])), 'MaybeList([1, None])')
+        self.assertEqual(repr(MaybeList([1, None], 'q')), "MaybeList([1, None], typecode='q')")
+
+    def test_smallerThanWrappedList(self):
+        values = [float(i) if i % 3 else None for i in range(10000)]
+        wrapped = [maybe(v) for v in values]
+        self.assertLess(sys.getsizeof(MaybeList(values, 'd')),
+                        sys.getsizeof(wrapped) + sum(sys.getsizeof(w) for w in wrapped))
+
+
+if __name__ == '__main__':
+    unittest.main()
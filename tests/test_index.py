@@ -0,0 +1,114 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+test_index
+----------------------------------
+
+Tests for `pymaybe.index` module.
+"""
+
+import doctest
+import unittest
+
+from pymaybe import maybe, MaybeIndex, Something, Nothing
+
+
+def load_tests(loader, tests, ignore):
+    import pymaybe.index
+    tests.addTests(doctest.DocTestSuite(pymaybe.index))
+    return tests
+
+
+DOC = {
+    'store': {
+        'name': 'MyStore',
+        'departments': {
+            'sales': {'head_count': '10', 'tags': ['a', 'b']},
+            'marketing': None,
+        },
+        'locations': [{'city': 'NYC'}, {'city': 'SF'}],
+    },
+    'version': 3,
+}
+
+PATHS = [
+    ('store', 'name'),
+    ('store', 'departments', 'sales', 'head_count'),
+    ('store', 'departments', 'sales', 'tags', 1),
+    ('store', 'departments', 'sales', 'tags', -1),
+    ('store', 'departments', 'sales', 'tags', 5),
+    ('store', 'departments', 'marketing'),
+    ('store', 'departments', 'marketing', 'head_count'),
+    ('store', 'locations', 0, 'city'),
+    ('store', 'name', 0),
+    ('store', 'address', 'street'),
+    ('version',),
+    ('version', 'x'),
+    (),
+]
+
+
+class TestMaybeIndex(unittest.TestCase):
+
+    def assertMatchesMaybe(self, index):
+        for path in PATHS:
+            expected = maybe(DOC)
+            for key in path:
+                expected = expected[key]
+            result = index.get(path)
+            self.assertEqual(type(result), type(expected), path)
+            self.assertEqual(result, expected, path)
+
+    def test_eager_matchesMaybe(self):
+        self.assertMatchesMaybe(MaybeIndex(DOC))
+
+    def test_lazy_matchesMaybe_andRemembersPaths(self):
+        index = MaybeIndex(DOC, eager=False)
+        self.assertEqual(len(index), 1)
+        self.assertMatchesMaybe(index)
+        self.assertTrue(len(index) > 1)
+        self.assertMatchesMaybe(index)
+
+    def test_limits_matchMaybe_andBoundEntries(self):
+        full = MaybeIndex(DOC)
+        shallow = MaybeIndex(DOC, max_depth=2)
+        prefixed = MaybeIndex(DOC, prefixes=['store.locations'])
+        self.assertMatchesMaybe(shallow)
+        self.assertMatchesMaybe(prefixed)
+        self.assertTrue(len(shallow) < len(full))
+        self.assertEqual(sorted(prefixed._index, key=repr), sorted([
+            (), ('store',), ('store', 'locations'), ('store', 'locations', 0), ('store', 'locations', 1),
+            ('store', 'locations', 0, 'city'), ('store', 'locations', 1, 'city')], key=repr))
+
+    def test_unhashableKeys_matchMaybe(self):
+        paths = [('store', ['name']), ('store', 'locations', slice(0, 1)), ('store', 'locations', slice(1, None), 0)]
+        for index in (MaybeIndex(DOC), MaybeIndex(DOC, eager=False)):
+            for _ in range(2):
+                for path in paths:
+                    expected = maybe(DOC)
+                    for key in path:
+                        expected = expected[key]
+                    self.assertEqual(index.get(path), expected, path)
+
+    def test_stringPaths(self):
+        index = MaybeIndex(DOC)
+        self.assertEqual(index['store.locations[1].city'], Something('SF'))
+        self.assertIsInstance(index['store.locations[2].city'], Nothing)
+
+    def test_stats_andRebuild(self):
+        doc = {'a': {'b': 1}}
+        index = MaybeIndex(doc)
+        stats = index.stats()
+        self.assertEqual(stats['entries'], 3)
+        self.assertTrue(stats['index_bytes'] > 0)
+        self.assertTrue(stats['build_seconds'] >= 0)
+
+        doc['a']['c'] = 2
+        self.assertEqual(index.get('a.c'), 2)
+        index.rebuild()
+        self.assertEqual(index.stats()['entries'], 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
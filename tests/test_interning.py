@@ -0,0 +1,113 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+test_interning
+----------------------------------
+
+Tests for `pymaybe.interning` module.
+"""
+
+import doctest
+import gc
+import unittest
+
+from pymaybe import maybe, Something, enable_interning, disable_interning
+from pymaybe import interning
+
+
+def load_tests(loader, tests, ignore):
+    tests.addTests(doctest.DocTestSuite(interning))
+    return tests
+
+
+class TestInterning(unittest.TestCase):
+
+    def setUp(self):
+        enable_interning()
+
+    def tearDown(self):
+        disable_interning()
+
+    def test_sharesWrappersForHotValues(self):
+        for value in (7, 2.5, True, 'short', b'bytes'):
+            self.assertTrue(maybe(value) is maybe(value))
+
+    def test_attributeAndItemLookupsAreInterned(self):
+        class Point(object):
+            x = 3
+
+        self.assertTrue(maybe(Point()).x is maybe(3))
+        self.assertTrue(maybe({'x': 3})['x'] is maybe(3))
+
+    def test_equalValuesOfDifferentTypesStayDistinct(self):
+        one, one_float, true = maybe(1), maybe(1.0), maybe(True)
+        self.assertTrue(one.get().__class__ is int)
+        self.assertTrue(one_float.get().__class__ is float)
+        self.assertTrue(true.get() is True)
+        self.assertFalse(one is one_float or one is true)
+
+    def test_skipsOtherTypesAndLongStrings(self):
+        self.assertFalse(maybe((1, 2)) is maybe((1, 2)))
+        self.assertFalse(maybe('x' * 100) is maybe('x' * 100))
+        self.assertEqual(maybe([1]), [1])
+
+    def test_customTypes(self):
+        class Color(object):
+            pass
+
+        red = Color()
+        enable_interning(types=(Color,))
+        self.assertTrue(maybe(red) is maybe(red))
+
+    def test_doesNotKeepWrappersAlive(self):
+        maybe(123456)
+        gc.collect()
+        self.assertFalse(123456 in interning._tables[int])
+
+        kept = maybe(654321)
+        self.assertEqual(interning.interned_count(), 1)
+        del kept
+
+    def test_collectingCyclesWhileInterning(self):
+        # Weakref callbacks run by the collector inside intern() must not
+        # wait for the lock intern() is holding.
+        class Node(object):
+            pass
+
+        thresholds = gc.get_threshold()
+        gc.set_threshold(1, 1, 1)
+        try:
+            for i in range(2000):
+                cycle = Node()
+                cycle.self = cycle
+                cycle.wrapper = maybe(100000 + i)
+                del cycle
+        finally:
+            gc.set_threshold(*thresholds)
+        gc.collect()
+        self.assertEqual(interning.interned_count(), 0)
+
+    def test_inPlaceOperatorsDoNotMutateSharedWrappers(self):
+        shared = maybe(10)
+        counter = maybe(10)
+        counter += 5
+        self.assertEqual(counter, 15)
+        self.assertEqual(shared, 10)
+        self.assertTrue(maybe(10) is shared)
+
+    def test_inPlaceOperatorsStillMutateOtherWrappers(self):
+        disable_interning()
+        value = Something(10)
+        alias = value
+        value += 5
+        self.assertTrue(value is alias)
+        self.assertEqual(alias, 15)
+
+    def test_disable(self):
+        disable_interning()
+        self.assertFalse(maybe(5) is maybe(5))
+
+
+if __name__ == '__main__':
+    unittest.main()
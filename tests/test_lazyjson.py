@@ -0,0 +1,147 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+test_lazyjson
+----------------------------------
+
+Tests for `pymaybe.lazyjson` module.
+"""
+
+import doctest
+import json
+import unittest
+
+from pymaybe import maybe, lazy_json, Nothing
+from pymaybe.lazyjson import LazyArray, LazyObject
+
+
+def load_tests(loader, tests, ignore):
+    import pymaybe.lazyjson
+    tests.addTests(doctest.DocTestSuite(pymaybe.lazyjson))
+    return tests
+
+
+DOCUMENT = u'''
+{
+    "meta": {"id": 7, "owner": {"name": "Eran", "email": null}},
+    "items": [
+        {"id": 1, "name": "a \\"quoted\\" ]} name", "tags": ["x", "y"], "price": 1.5e2},
+        {"id": 2, "name": "caf\\u00e9", "tags": [], "price": -3},
+        {"id": 3, "nested": {"deep": [[1, [2, [3]]], {"k": "v"}]}, "ok": true, "no": false}
+    ],
+    "empty": {},
+    "total": 3
+}
+'''
+
+PATHS = [
+    ('meta', 'id'),
+    ('meta', 'owner', 'name'),
+    ('meta', 'owner', 'email'),
+    ('meta', 'missing'),
+    ('items', 0, 'name'),
+    ('items', 0, 'tags', 1),
+    ('items', 0, 'price'),
+    ('items', 1, 'name'),
+    ('items', 1, 'tags', 0),
+    ('items', -1, 'nested', 'deep', 0, 1, 1, 0),
+    ('items', 2, 'nested', 'deep', 1, 'k'),
+    ('items', 2, 'ok'),
+    ('items', 2, 'no'),
+    ('items', 3),
+    ('items', 'id'),
+    ('empty', 'x'),
+    ('total',),
+    ('total', 'x'),
+    ('nope', 'x'),
+]
+
+
+def chain(value, path):
+    result = maybe(value)
+    for key in path:
+        result = result[key]
+    return result
+
+
+class TestLazyJson(unittest.TestCase):
+
+    def test_matchesParsedDocument(self):
+        parsed = json.loads(DOCUMENT)
+        for data in (DOCUMENT, DOCUMENT.encode('utf-8'), DOCUMENT.encode('utf-16')):
+            doc = lazy_json(data)
+            for path in PATHS:
+                self.assertEqual(chain(doc, path), chain(parsed, path), path)
+                self.assertEqual(chain(doc, path).or_else('default'), chain(parsed, path).or_else('default'), path)
+
+    def test_nodesActLikeDictsAndLists(self):
+        parsed = json.loads(DOCUMENT)
+        doc = lazy_json(DOCUMENT)
+        self.assertIsInstance(doc, LazyObject)
+        self.assertIsInstance(doc['items'], LazyArray)
+        self.assertEqual(doc, parsed)
+        self.assertEqual(parsed, doc)
+        self.assertEqual(list(doc), list(parsed))
+        self.assertEqual(len(doc['items']), 3)
+        self.assertEqual(doc['items'][1:], parsed['items'][1:])
+        self.assertTrue('total' in doc)
+        self.assertFalse('nope' in doc)
+        self.assertEqual(doc.get('nope', 1), 1)
+        self.assertEqual(doc.to_python(), parsed)
+        self.assertEqual(doc['items'][0].to_python(), parsed['items'][0])
+
+        with self.assertRaises(TypeError):
+            doc['items']['id']
+        with self.assertRaises(TypeError):
+            doc[['unhashable']]
+
+    def test_scalarDocuments(self):
+        self.assertEqual(lazy_json('  "text" '), 'text')
+        self.assertEqual(lazy_json('12.5'), 12.5)
+        self.assertIsNone(lazy_json('null'))
+        self.assertEqual(maybe(lazy_json('[]'))[0], Nothing())
+
+    def test_indexesOnlyWhatIsNeeded(self):
+        doc = lazy_json(DOCUMENT)
+        self.assertEqual(doc['meta']['id'], 7)
+        self.assertEqual(len(doc._offsets), 1)
+        self.assertFalse(doc._done)
+
+        items = doc['items']
+        self.assertEqual(items[0]['id'], 1)
+        self.assertEqual(len(items._offsets), 1)
+
+        # Repeated access returns the cached child node.
+        self.assertIs(doc['items'], items)
+        self.assertIs(items[0], items[0])
+
+    def test_skipsLargeSiblings(self):
+        text = json.dumps({'header': {'id': 1}, 'body': [{'n': i} for i in range(10000)]})
+        doc = lazy_json(text)
+        self.assertEqual(maybe(doc)['header']['id'].or_else(0), 1)
+        self.assertNotIn('body', doc._offsets)
+        self.assertEqual(maybe(doc)['body'][-1]['n'].or_else(0), 9999)
+
+    def test_duplicateKeysResolveToFirstOccurrence(self):
+        doc = lazy_json('{"a": 1, "a": 2}')
+        self.assertEqual(doc['a'], 1)
+        self.assertEqual(len(doc), 1)
+
+    def test_malformedJsonRaisesWhenReached(self):
+        for text in ('', '{"a": [1, 2}', '{"a" 1}', '{"a": 1 "b": 2}', '[1 2]', '[,1]', '[1,]',
+                     '{"a": 1,}', '{1: 2}', '"x" y', '{"a": [1, 2'):
+            with self.assertRaises(ValueError):
+                doc = lazy_json(text)
+                len(doc)
+                maybe(doc)['a'][1]
+
+        # A broken member that lookups skip over goes unnoticed.
+        doc = lazy_json('{"a": 1, "b": [tru, 2], "c": 3}')
+        self.assertEqual(doc['c'], 3)
+        with self.assertRaises(ValueError):
+            doc['b'][0]
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,97 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+test_lens
+----------------------------------
+
+Tests for `pymaybe.lens` module.
+"""
+
+import doctest
+import unittest
+
+from pymaybe import maybe, M, Lens, apply_lens, compile_lens, Something, Nothing
+
+
+def load_tests(loader, tests, ignore):
+    import pymaybe.lens
+    tests.addTests(doctest.DocTestSuite(pymaybe.lens))
+    return tests
+
+
+class Address(object):
+    def __init__(self, zip_code):
+        self.zip = zip_code
+
+
+class User(object):
+    def __init__(self, name, address=None):
+        self.name = name
+        self.address = address
+
+    def greet(self, greeting='Hello'):
+        return '%s %s' % (greeting, self.name)
+
+
+class TestLens(unittest.TestCase):
+
+    def setUp(self):
+        self.records = [
+            {'user': User('eran', Address('10001')), 'count': 3},
+            {'user': User('dana'), 'count': None},
+            {'user': None},
+            {},
+            None,
+        ]
+
+    def assertMatchesDynamic(self, expr, dynamic):
+        compiled = compile_lens(expr)
+        for rec in self.records:
+            expected = dynamic(maybe(rec))
+            self.assertEqual(apply_lens(expr, rec), expected)
+            self.assertEqual(compiled(rec), expected)
+            self.assertEqual(type(compiled(rec)), type(expected))
+
+    def test_recordsOperations(self):
+        expr = M.user.address['zip']
+        self.assertIsInstance(expr, Lens)
+        self.assertEqual(repr(expr), "M.user.address['zip']")
+        self.assertEqual(repr(M.count * 2), "(M.count * 2)")
+
+    def test_attributesAndItems_matchDynamicChains(self):
+        self.assertMatchesDynamic(M['user'].address.zip, lambda m: m['user'].address.zip)
+        self.assertMatchesDynamic(M['user'].phone, lambda m: m['user'].phone)
+
+    def test_calls_matchDynamicChains(self):
+        self.assertMatchesDynamic(M['user'].name.upper(), lambda m: m['user'].name.upper())
+        self.assertMatchesDynamic(M['user'].greet(greeting='Hi'), lambda m: m['user'].greet(greeting='Hi'))
+
+    def test_maybeMethods_areTerminal(self):
+        self.assertMatchesDynamic(M['user'].address.zip.or_else('none'),
+                                  lambda m: m['user'].address.zip.or_else('none'))
+        self.assertMatchesDynamic(M['user'].address.is_some(), lambda m: m['user'].address.is_some())
+
+    def test_arithmetic(self):
+        compiled = compile_lens(M['count'] * 2 + 1)
+        self.assertEqual(compiled(self.records[0]), 7)
+        self.assertIsInstance(compiled(self.records[1]), Nothing)
+        self.assertEqual(apply_lens(10 - M['count'], self.records[0]), 7)
+        self.assertIsInstance(apply_lens(10 - M['count'], self.records[1]), Nothing)
+
+    def test_compileLens_isCachedAndHandlesOddNames(self):
+        expr = M['user'].address
+        self.assertTrue(compile_lens(expr) is compile_lens(expr))
+        self.assertIsInstance(compile_lens(getattr(M, 'class'))(object()), Nothing)
+        self.assertIsInstance(compile_lens(getattr(M, 'a-b'))(object()), Nothing)
+
+    def test_acceptsMaybeInput(self):
+        self.assertEqual(compile_lens(M['a'])(maybe({'a': 1})), Something(1))
+        self.assertIsInstance(compile_lens(M['a'])(Nothing()), Nothing)
+
+    def test_isNotIterable(self):
+        self.assertRaises(TypeError, list, M)
+
+
+if __name__ == '__main__':
+    unittest.main()
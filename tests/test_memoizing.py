@@ -0,0 +1,177 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+test_memoizing
+----------------------------------
+
+Tests for `pymaybe.memoizing` module.
+"""
+
+import copy
+import doctest
+import pickle
+import unittest
+
+from pymaybe import maybe, MemoizedSomething, Something, Nothing
+
+
+def load_tests(loader, tests, ignore):
+    import pymaybe.memoizing
+    tests.addTests(doctest.DocTestSuite(pymaybe.memoizing))
+    return tests
+
+
+class Report(object):
+    def __init__(self, rows):
+        self.rows = rows
+        self.calls = 0
+
+    @property
+    def total(self):
+        self.calls += 1
+        return sum(self.rows)
+
+    @property
+    def missing(self):
+        self.calls += 1
+        return None
+
+    @property
+    def broken(self):
+        self.calls += 1
+        raise RuntimeError('boom')
+
+
+class TestMemoizedSomething(unittest.TestCase):
+
+    def test_maybeWithMemoize(self):
+        self.assertIsInstance(maybe(Report([]), memoize=True), MemoizedSomething)
+        self.assertIsInstance(maybe(maybe(Report([])), memoize=True), MemoizedSomething)
+        self.assertIs(maybe(None, memoize=True), Nothing())
+        wrapper = maybe(Report([]), memoize=True)
+        self.assertIs(maybe(wrapper, memoize=True), wrapper)
+        self.assertIs(maybe(wrapper), wrapper)
+        self.assertNotIsInstance(maybe(Report([])), MemoizedSomething)
+
+    def test_attributesAreComputedOnce(self):
+        report = Report([1, 2, 3])
+        wrapper = maybe(report, memoize=True)
+        for _ in range(3):
+            self.assertEqual(wrapper.total, Something(6))
+            self.assertEqual(wrapper.missing, Nothing())
+            self.assertEqual(wrapper.broken, Nothing())
+        self.assertEqual(report.calls, 3)
+        self.assertEqual(wrapper.cached_count(), 3)
+
+    def test_itemsAndChainsAreMemoized(self):
+        data = {'a': {'b': [10, 20]}}
+        wrapper = maybe(data, memoize=True)
+        child = wrapper['a']
+        self.assertIsInstance(child, MemoizedSomething)
+        self.assertIs(wrapper['a'], child)
+        self.assertIs(wrapper['a']['b'][1], child['b'][1])
+        self.assertEqual(wrapper['a']['b'][1], 20)
+        self.assertEqual(wrapper['x']['y'], Nothing())
+
+        # Unhashable keys are looked up every time.
+        self.assertEqual(wrapper['a']['b'][0:1], Something([10]))
+        self.assertEqual(wrapper[['a']], Nothing())
+
+    def test_invalidate(self):
+        report = Report([1, 2])
+        wrapper = maybe(report, memoize=True)
+        wrapper.total
+        wrapper.missing
+        report.rows.append(3)
+        self.assertEqual(wrapper.total, 3)
+
+        wrapper.invalidate('total')
+        self.assertEqual(wrapper.total, 6)
+        self.assertEqual(wrapper.cached_count(), 2)
+
+        wrapper.invalidate()
+        self.assertEqual(wrapper.cached_count(), 0)
+        self.assertEqual(report.calls, 3)
+
+    def test_writesThroughWrapperInvalidate(self):
+        wrapper = maybe(Report([1]), memoize=True)
+        self.assertEqual(wrapper.rows, [1])
+        wrapper.rows = [5]
+        self.assertEqual(wrapper.rows, [5])
+        del wrapper.rows
+        self.assertEqual(wrapper.rows, Nothing())
+
+        items = maybe({'a': 1}, memoize=True)
+        self.assertEqual(items['a'], 1)
+        items['a'] = 2
+        self.assertEqual(items['a'], 2)
+        del items['a']
+        self.assertEqual(items['a'], Nothing())
+
+        values = maybe([1, 2, 3], memoize=True)
+        self.assertEqual(values[0], 1)
+        values[0:2] = [7, 8]
+        self.assertEqual(values[0], 7)
+
+    def test_inPlaceOperatorsInvalidate(self):
+        values = maybe([1, 2], memoize=True)
+        self.assertEqual(values[2], Nothing())
+        values += [3]
+        self.assertIsInstance(values, MemoizedSomething)
+        self.assertEqual(values[2], 3)
+
+        number = maybe(1, memoize=True)
+        self.assertEqual(number.real, 1)
+        number += 1
+        self.assertEqual(number.real, 2)
+
+    def test_cacheIsBounded(self):
+        wrapper = MemoizedSomething(dict((i, i) for i in range(10)), maxsize=4)
+        for i in range(10):
+            wrapper[i]
+        self.assertEqual(wrapper.cached_count(), 4)
+        self.assertEqual(wrapper[9], 9)
+
+        with self.assertRaises(ValueError):
+            MemoizedSomething({}, maxsize=0)
+        with self.assertRaises(ValueError):
+            maybe({}, memoize=True, maxsize=0)
+
+        wrapper = maybe(dict((i, i) for i in range(10)), memoize=True, maxsize=2)
+        for i in range(10):
+            wrapper[i]
+        self.assertEqual(wrapper.cached_count(), 2)
+        self.assertEqual(wrapper[1].cached_count(), 0)
+
+    def test_inPlaceOperatorsLeaveOtherSubclassesAlone(self):
+        class Rows(list):
+            invalidated = False
+
+            def invalidate(self):
+                self.invalidated = True
+
+        class Custom(Something):
+            pass
+
+        rows = maybe(Rows([1]))
+        custom = Custom(Rows([1]))
+        rows += [2]
+        custom += [2]
+        self.assertEqual(custom, Something([1, 2]))
+        self.assertFalse(rows.get().invalidated)
+        self.assertFalse(custom.get().invalidated)
+
+    def test_copyAndPickleKeepMemoizing(self):
+        wrapper = MemoizedSomething({'a': [1]}, maxsize=8)
+        wrapper['a']
+        for clone in (copy.copy(wrapper), copy.deepcopy(wrapper),
+                      pickle.loads(pickle.dumps(wrapper, pickle.HIGHEST_PROTOCOL))):
+            self.assertIsInstance(clone, MemoizedSomething)
+            self.assertEqual(clone, wrapper)
+            self.assertEqual(clone.cached_count(), 0)
+        self.assertIsNot(copy.deepcopy(wrapper).get()['a'], wrapper.get()['a'])
+
+
+if __name__ == '__main__':
+    unittest.main()
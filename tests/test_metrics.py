@@ -0,0 +1,98 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+test_metrics
+----------------------------------
+
+Tests for `pymaybe.metrics` module.
+"""
+
+import sys
+import threading
+import unittest
+
+from pymaybe import maybe, maybe_path, MetricsRegistry, enable_metrics, disable_metrics, metrics_context
+from pymaybe import metrics
+
+
+class Broken(object):
+    @property
+    def value(self):
+        raise ValueError('broken')
+
+
+class TestMetrics(unittest.TestCase):
+
+    def tearDown(self):
+        disable_metrics()
+
+    def test_disabled_recordsNothing(self):
+        self.assertFalse(metrics.active)
+        registry = MetricsRegistry()
+        maybe_path('a.b')({'a': {}})
+        self.assertEqual(registry.snapshot(), {'paths': {}, 'swallowed_exceptions': {}})
+
+    def test_enableMetrics_recordsHitsMissesAndDepth(self):
+        registry = enable_metrics()
+        get_b = maybe_path('a.b.c')
+        get_b({'a': {'b': {'c': 1}}})
+        get_b({'a': {'b': {}}})
+        get_b({'a': {}})
+        get_b({'a': None})
+        get_b(None)
+
+        stats = registry.snapshot()['paths']['a.b.c']
+        self.assertEqual(stats['hits'], 1)
+        self.assertEqual(stats['misses'], 4)
+        self.assertEqual(stats['miss_depths'], {0: 2, 1: 1, 2: 1})
+        self.assertEqual(stats['latency']['count'], 5)
+        self.assertEqual(stats['latency']['buckets'][float('inf')], 5)
+
+    def test_swallowedExceptions_areCounted(self):
+        registry = enable_metrics()
+        maybe(Broken()).value
+        maybe([1])['x']
+        self.assertEqual(registry.snapshot()['swallowed_exceptions'],
+                         {'getattr:ValueError': 1, 'getitem:TypeError': 1})
+
+    @unittest.skipIf(sys.version_info < (3, 7), 'metrics_context requires contextvars (Python 3.7+)')
+    def test_metricsContext_isScopedToContext(self):
+        with metrics_context() as registry:
+            self.assertTrue(metrics.active)
+            maybe_path('x')({'x': 1})
+
+            other = []
+            thread = threading.Thread(target=lambda: other.append(metrics.current_registry()))
+            thread.start()
+            thread.join()
+            self.assertEqual(other, [None])
+
+        self.assertFalse(metrics.active)
+        self.assertEqual(registry.snapshot()['paths']['x']['hits'], 1)
+
+    def test_instrument_recordsNamedFunctions(self):
+        @metrics.instrument('lookup')
+        def lookup(d):
+            return maybe(d)['key']
+
+        registry = enable_metrics()
+        lookup({'key': 1})
+        lookup({})
+        stats = registry.snapshot()['paths']['lookup']
+        self.assertEqual((stats['hits'], stats['misses']), (1, 1))
+
+    def test_toPrometheus(self):
+        registry = enable_metrics()
+        maybe_path('a["q\\"uote"]')({'a': {}})
+        maybe(Broken()).value
+        text = registry.to_prometheus()
+        self.assertIn('# TYPE pymaybe_path_latency_seconds histogram', text)
+        self.assertIn('pymaybe_path_hits_total{path="a[\\"q\\\\\\"uote\\"]"} 0', text)
+        self.assertIn('pymaybe_path_misses_total{path="a[\\"q\\\\\\"uote\\"]",depth="1"} 1', text)
+        self.assertIn('le="+Inf"} 1', text)
+        self.assertIn('pymaybe_swallowed_exceptions_total{operation="getattr",exception="ValueError"} 1', text)
+
+
+if __name__ == '__main__':
+    unittest.main()
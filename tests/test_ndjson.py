@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+test_ndjson
+----------------------------------
+
+Tests for `pymaybe.ndjson` module.
+"""
+
+import doctest
+import io
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+from pymaybe import maybe, extract_ndjson
+
+
+def load_tests(loader, tests, ignore):
+    import pymaybe.ndjson
+    tests.addTests(doctest.DocTestSuite(pymaybe.ndjson))
+    return tests
+
+
+RECORDS = [
+    {'user': {'id': 1, 'name': 'eran'}, 'items': [{'price': 10}]},
+    {'user': {'id': 2}, 'items': []},
+    {'user': None, 'items': 'not a list'},
+    {'user': [1, 2], 'items': [{'price': None}]},
+    {},
+]
+
+
+class TestExtractNdjson(unittest.TestCase):
+
+    def setUp(self):
+        self.payload = b'\n'.join(json.dumps(r).encode('utf-8') for r in RECORDS) + b'\n\n'
+        self.fields = [('user.id', -1), ('user.name', lambda: 'anonymous'), 'items[0].price']
+
+    def expected(self):
+        return [(maybe(r)['user']['id'].or_else(-1),
+                 maybe(r)['user']['name'].or_else(lambda: 'anonymous'),
+                 maybe(r)['items'][0]['price'].or_none())
+                for r in RECORDS]
+
+    def test_stream_matchesMaybeSemantics(self):
+        rows = list(extract_ndjson(io.BytesIO(self.payload), self.fields))
+        self.assertEqual(rows, self.expected())
+
+    def test_smallChunks_handleLinesAcrossBoundaries(self):
+        rows = list(extract_ndjson(io.BytesIO(self.payload), self.fields, chunk_size=7))
+        self.assertEqual(rows, self.expected())
+
+    def test_filePath_andMmap(self):
+        tmpdir = tempfile.mkdtemp()
+        try:
+            path = os.path.join(tmpdir, 'records.ndjson')
+            with open(path, 'wb') as f:
+                f.write(self.payload.rstrip(b'\n'))
+
+            self.assertEqual(list(extract_ndjson(path, self.fields)), self.expected())
+            self.assertEqual(list(extract_ndjson(path, self.fields, use_mmap=True)), self.expected())
+            if sys.version_info >= (3, 6):
+                import pathlib
+                self.assertEqual(list(extract_ndjson(pathlib.Path(path), self.fields)), self.expected())
+
+            open(path, 'wb').close()
+            self.assertEqual(list(extract_ndjson(path, self.fields, use_mmap=True)), [])
+        finally:
+            shutil.rmtree(tmpdir)
+
+    def test_linesSpanningManyChunks(self):
+        record = {'user': {'id': 9, 'name': 'x' * 1000}}
+        payload = json.dumps(record).encode('utf-8') + b'\n{"user": {"id": 10}}'
+        rows = list(extract_ndjson(io.BytesIO(payload), ['user.id', 'user.name'], chunk_size=16))
+        self.assertEqual(rows, [(9, 'x' * 1000), (10, None)])
+
+    def test_fieldsAsDictAndKeyTuples(self):
+        rows = list(extract_ndjson(io.BytesIO(self.payload), {('user', 'id'): 0}))
+        self.assertEqual(rows, [(1,), (2,), (0,), (0,), (0,)])
+
+    def test_isLazy(self):
+        rows = extract_ndjson(io.BytesIO(b'{"a": 1}\nnot json\n'), ['a'])
+        self.assertEqual(next(rows), (1,))
+        self.assertRaises(ValueError, next, rows)
+
+
+if __name__ == '__main__':
+    unittest.main()
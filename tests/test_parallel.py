@@ -0,0 +1,76 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+test_parallel
+----------------------------------
+
+Tests for `pymaybe.parallel` module.
+"""
+
+import doctest
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from pymaybe import maybe_map, Something, Nothing
+
+
+def load_tests(loader, tests, ignore):
+    import pymaybe.parallel
+    tests.addTests(doctest.DocTestSuite(pymaybe.parallel))
+    return tests
+
+
+def invert(x):
+    if x == 3:
+        return None
+    return 1.0 / x
+
+
+class TestMaybeMap(unittest.TestCase):
+
+    def expected(self, items):
+        return [Nothing() if x in (0, 3) else Something(1.0 / x) for x in items]
+
+    def test_threads_preserveOrderAndMapFailuresToNothing(self):
+        items = list(range(20))
+        for chunksize in (1, 3, 50):
+            results = list(maybe_map(invert, items, chunksize=chunksize, max_workers=4))
+            self.assertEqual(results, self.expected(items))
+            self.assertEqual([type(r) for r in results], [type(r) for r in self.expected(items)])
+
+    def test_processes(self):
+        items = list(range(10))
+        results = list(maybe_map(invert, items, executor='process', chunksize=4, max_workers=2))
+        self.assertEqual(results, self.expected(items))
+
+    def test_unordered_yieldsEveryResult(self):
+        items = list(range(20))
+        results = list(maybe_map(invert, items, chunksize=2, max_workers=4, ordered=False))
+        self.assertEqual(sorted(r.or_else(-1) for r in results), sorted(r.or_else(-1) for r in self.expected(items)))
+
+    def test_externalExecutor_isNotShutDown(self):
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            self.assertEqual(list(maybe_map(invert, [1, 2], executor=executor)), [1.0, 0.5])
+            self.assertEqual(executor.submit(invert, 4).result(), 0.25)
+
+    def test_boundsInFlightWork(self):
+        consumed = []
+        lock = threading.Lock()
+
+        def source():
+            for i in range(1, 100):
+                with lock:
+                    consumed.append(i)
+                yield i
+
+        results = maybe_map(lambda x: time.sleep(0.001) or x, source(), max_workers=2, max_in_flight=3)
+        self.assertEqual(next(results), 1)
+        self.assertTrue(len(consumed) <= 4)
+        results.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
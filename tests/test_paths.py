@@ -0,0 +1,79 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+test_paths
+----------------------------------
+
+Tests for `pymaybe.paths` module.
+"""
+
+import doctest
+import unittest
+
+from pymaybe import maybe, maybe_path, MaybePath, Something, Nothing
+from pymaybe.paths import parse_path
+
+
+def load_tests(loader, tests, ignore):
+    import pymaybe.paths
+    tests.addTests(doctest.DocTestSuite(pymaybe.paths))
+    return tests
+
+
+class Person(object):
+    def __init__(self, name):
+        self.name = name
+
+
+class TestMaybePath(unittest.TestCase):
+
+    def setUp(self):
+        self.doc = {
+            'account': {
+                'user_profile': {'first_name': 'Eran', 'nickname': None},
+                'owner': Person('eran'),
+            },
+            'items': [{'price': 10}, {'price': 20}],
+        }
+
+    def test_parsePath_mixedSegments(self):
+        self.assertEqual(parse_path('a.b[0]["c d"].e'), ((0, 'a'), (0, 'b'), (1, 0), (1, 'c d'), (0, 'e')))
+
+    def test_parsePath_invalid_raisesValueError(self):
+        for path in ('.a', 'a..b', 'a[', 'a[b]', 'a]'):
+            self.assertRaises(ValueError, parse_path, path)
+
+    def test_maybePath_isCached(self):
+        self.assertTrue(maybe_path('account.user_profile') is maybe_path('account.user_profile'))
+        self.assertIsInstance(maybe_path('account'), MaybePath)
+
+    def test_maybePath_hit_returnsSomething(self):
+        result = maybe_path('account.user_profile.first_name')(self.doc)
+        self.assertIsInstance(result, Something)
+        self.assertEqual(result, 'Eran')
+        self.assertEqual(maybe_path('items[1].price')(self.doc), 20)
+        self.assertEqual(maybe_path('items[-1]["price"]')(self.doc), 20)
+        self.assertEqual(maybe_path('account.owner.name')(self.doc), 'eran')
+
+    def test_maybePath_miss_returnsNothing(self):
+        for path in ('account.billing.zip', 'items[5].price', 'items.price',
+                     'account.user_profile.nickname', 'account.owner.phone',
+                     'account.user_profile.first_name[10]'):
+            self.assertIsInstance(maybe_path(path)(self.doc), Nothing)
+
+    def test_maybePath_matchesChainedLookups(self):
+        chained = maybe(self.doc)['items'][0]['price']
+        self.assertEqual(maybe_path('items[0].price')(self.doc), chained)
+
+    def test_maybePath_acceptsMaybeValues(self):
+        self.assertEqual(maybe_path('items[0].price')(maybe(self.doc)), 10)
+        self.assertIsInstance(maybe_path('items')(maybe(None)), Nothing)
+        self.assertEqual(maybe_path('a.b')({'a': maybe({'b': 1})}), 1)
+
+    def test_maybePath_unhashableKey_returnsNothing(self):
+        self.assertIsInstance(maybe_path('a')([1, 2]), Nothing)
+
+
+if __name__ == '__main__':
+    unittest.main()
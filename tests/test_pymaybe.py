@@ -12,7 +12,7 @@ import sys
 import unittest
 import doctest
 
-from pymaybe import maybe, Something, Nothing
+from pymaybe import maybe, Something, Nothing, NOTHING
 
 PY2 = sys.version_info[0] == 2
 PY3 = sys.version_info[0] == 3
@@ -47,6 +47,32 @@ class TestPyMaybe(unittest.TestCase):
         result = maybe(None)
         self.assertIsInstance(result, Nothing)
 
+    # region Nothing - Singleton
+
+    def test_nothing_isSingleton(self):
+        self.assertTrue(Nothing() is NOTHING)
+        self.assertTrue(maybe(None) is NOTHING)
+        self.assertTrue(maybe(None).a['b'].c() is NOTHING)
+        self.assertTrue(maybe({})['missing'] is NOTHING)
+
+    def test_nothing_pickleAndCopy_returnSameInstance(self):
+        import copy
+        import pickle
+
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            self.assertTrue(pickle.loads(pickle.dumps(NOTHING, protocol)) is NOTHING)
+        self.assertTrue(copy.copy(NOTHING) is NOTHING)
+        self.assertTrue(copy.deepcopy([NOTHING])[0] is NOTHING)
+
+    def test_nothing_dunderAttributes_raiseAttributeError(self):
+        self.assertFalse(hasattr(NOTHING, '__wrapped__'))
+        self.assertTrue(NOTHING.wrapped is NOTHING)
+        if sys.version_info >= (3, 4):
+            import inspect
+            self.assertTrue(inspect.unwrap(NOTHING) is NOTHING)
+
+    # endregion
+
     # region Nothing - Comparison
 
     def test_comparisons(self):
@@ -301,6 +327,61 @@ class TestPyMaybe(unittest.TestCase):
         self.assertTrue(isinstance(s[10], Nothing))
         self.assertTrue(s[10].is_none())
 
+    def test_something_sequence_getItem_resolvesMissesWithoutRaising(self):
+        for value in ([1, 2, 3], (1, 2, 3), 'abc', b'abc'):
+            s = maybe(value)
+            self.assertEqual(s[-1].get(), value[-1])
+            self.assertEqual(s[0].get(), value[0])
+            self.assertTrue(s[3].is_none())
+            self.assertTrue(s[-4].is_none())
+            self.assertEqual(s[1:].get(), value[1:])
+            self.assertTrue(s['key'].is_none())
+
+        self.assertEqual(maybe([1, 2])[True].get(), 2)
+
+    def test_something_dict_getItem_handlesUnhashableKeys(self):
+        self.assertTrue(maybe({'a': 1})[['a']].is_none())
+        self.assertTrue(maybe({'a': None})['a'].is_none())
+
+    def test_something_getAttr_swallowsPropertyErrors(self):
+        class Foo(object):
+            @property
+            def broken(self):
+                raise ValueError('broken')
+
+        self.assertTrue(maybe(Foo()).broken.is_none())
+        self.assertTrue(maybe(Foo()).missing.is_none())
+
+    def test_something_getAttr_followsClassMutations(self):
+        class Foo(object):
+            __slots__ = ('slot',)
+
+            def method(self):
+                return 'method'
+
+        obj = Foo()
+        obj.slot = 'slot'
+        s = maybe(obj)
+        self.assertEqual(s.slot, 'slot')
+        self.assertEqual(s.method(), 'method')
+        self.assertTrue(s.extra.is_none())
+
+        Foo.method = lambda self: 'patched'
+        Foo.extra = property(lambda self: 'extra')
+        self.assertEqual(s.method(), 'patched')
+        self.assertEqual(s.extra, 'extra')
+
+        del Foo.extra
+        self.assertTrue(s.extra.is_none())
+
+    def test_something_getAttr_returnsWrappedMaybeAttributes(self):
+        class Foo(object):
+            pass
+
+        obj = Foo()
+        obj.inner = maybe(None)
+        self.assertTrue(maybe(obj).inner is maybe(None))
+
     def test_something_setItem_doestNothing(self):
         s = maybe(dict(test='value'))
         s['test'] = 'yeah'
@@ -355,6 +436,127 @@ class TestPyMaybe(unittest.TestCase):
         self.assertEqual(hex(16), hex(Something(16)))
         self.assertEqual(math.trunc(math.pi), math.trunc(maybe(math.pi)))
 
+    def test_something_hasNoInstanceDict(self):
+        self.assertFalse(any('__dict__' in vars(klass) for klass in Something.__mro__))
+        self.assertFalse(any('__dict__' in vars(klass) for klass in Nothing.__mro__))
+
+    def test_something_setAttr_forwardsToValue(self):
+        class Foo(object):
+            pass
+
+        obj = Foo()
+        s = maybe(obj)
+        s.name = 'foo'
+        self.assertEqual(obj.name, 'foo')
+
+    def test_something_augmentedAssignment_keepsInPlaceSemantics(self):
+        value = [1]
+        s = maybe(value)
+        s += [2]
+        self.assertEqual(value, [1, 2])
+        self.assertEqual(s, [1, 2])
+
+        n = maybe(1)
+        n += 2
+        self.assertEqual(n, 3)
+
+    def test_something_pickleRoundTrip(self):
+        import pickle
+
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            self.assertEqual(pickle.loads(pickle.dumps(Something({'a': 1}), protocol)), {'a': 1})
+
+    def test_something_hashMatchesValue(self):
+        self.assertEqual(hash(Something('a')), hash('a'))
+        self.assertEqual(hash(Something((1, 2))), hash((1, 2)))
+        self.assertEqual(len(set([maybe(1), maybe(1), 1, maybe(2)])), 2)
+        self.assertEqual({maybe('k'): 1}['k'], 1)
+
+    def test_something_hashIsCachedAndReset(self):
+        class Counted(object):
+            calls = 0
+
+            def __hash__(self):
+                Counted.calls += 1
+                return 7
+
+        s = Something(Counted())
+        self.assertEqual(hash(s), 7)
+        self.assertEqual(hash(s), 7)
+        self.assertEqual(Counted.calls, 1)
+
+        n = Something(1)
+        hash(n)
+        n += 1
+        self.assertEqual(hash(n), hash(2))
+
+    def test_something_unhashableValue(self):
+        with self.assertRaises(TypeError):
+            hash(Something([1]))
+
+    def test_nothing_hashMatchesNone(self):
+        self.assertEqual(hash(Nothing()), hash(None))
+        self.assertEqual(len(set([Nothing(), maybe(None), None])), 1)
+
+    def test_something_copy(self):
+        import copy
+
+        value = {'a': [1]}
+        shallow = copy.copy(Something(value))
+        deep = copy.deepcopy(Something(value))
+
+        self.assertTrue(isinstance(shallow, Something) and shallow.get() is value)
+        self.assertTrue(isinstance(deep, Something))
+        self.assertEqual(deep.get(), value)
+        self.assertFalse(deep.get()['a'] is value['a'])
+
+    def test_something_deepcopy_keepsSharedReferences(self):
+        import copy
+
+        value = [1]
+        first, second = copy.deepcopy([Something(value), value])
+        self.assertTrue(first.get() is second)
+
+    def test_something_pickleBytesLike(self):
+        import pickle
+
+        for value in (b'payload', bytearray(b'payload')):
+            for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+                result = pickle.loads(pickle.dumps(Something(value), protocol))
+                self.assertEqual(result.get(), value)
+                self.assertTrue(result.get().__class__ is value.__class__)
+
+    @unittest.skipIf(sys.version_info < (3, 8), 'pickle protocol 5 requires Python 3.8+')
+    def test_something_pickleOutOfBandBuffers(self):
+        import pickle
+
+        data = bytearray(b'x' * 1024)
+        view = memoryview(data).cast('i', (16, 16))
+        for value in (bytes(data), data, view):
+            buffers = []
+            payload = pickle.dumps(Something(value), 5, buffer_callback=buffers.append)
+            self.assertEqual(len(buffers), 1)
+            self.assertTrue(len(payload) < 200)
+
+            result = pickle.loads(payload, buffers=buffers).get()
+            self.assertTrue(result.__class__ is value.__class__)
+            self.assertEqual(result, value)
+
+        # A memoryview is rebuilt on top of the out-of-band buffer without copying.
+        buffers = []
+        payload = pickle.dumps(Something(view), 5, buffer_callback=buffers.append)
+        result = pickle.loads(payload, buffers=buffers).get()
+        result[0, 0] = 7
+        self.assertEqual(view[0, 0], 7)
+        self.assertEqual(result.shape, (16, 16))
+
+    @unittest.skipIf(sys.version_info < (3, 8), 'pickle protocol 5 requires Python 3.8+')
+    def test_something_pickleMemoryviewInBand(self):
+        import pickle
+
+        result = pickle.loads(pickle.dumps(Something(memoryview(b'abcd')), 5))
+        self.assertEqual(result.get().tobytes(), b'abcd')
+
     # region method call forwarding
 
     def test_something_forwardsMethodCalls(self):
@@ -0,0 +1,136 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+test_schema
+----------------------------------
+
+Tests for `pymaybe.schema` module.
+"""
+
+import doctest
+import unittest
+
+from pymaybe import maybe, compile_schema, Nothing
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+
+def load_tests(loader, tests, ignore):
+    import pymaybe.schema
+    tests.addTests(doctest.DocTestSuite(pymaybe.schema))
+    return tests
+
+
+FIELDS = [
+    ('id', 'payload.user.id'),
+    ('name', 'payload.user.name', 'anonymous'),
+    ('age', ('payload', 'user', 'age'), 0, int),
+    ('first_tag', 'payload.tags[0]', ''),
+    ('count', 'payload.count', list),
+]
+
+RECORDS = [
+    {'payload': {'user': {'id': 1, 'name': 'Eran', 'age': '42'}, 'tags': ['a', 'b'], 'count': 3}},
+    {'payload': {'user': {'id': 2}, 'tags': []}},
+    {'payload': {'user': None, 'tags': 'xyz'}},
+    {'payload': None},
+    {'other': 1},
+    {},
+    [],
+    None,
+]
+
+
+def chain_row(record):
+    """The same row built from one maybe() chain per field."""
+    payload = maybe(record)['payload']
+    user = payload['user']
+    age = user['age']
+    return (
+        user['id'].or_none(),
+        user['name'].or_else('anonymous'),
+        int(age.get()) if age else 0,
+        payload['tags'][0].or_else(''),
+        payload['count'].or_else(list),
+    )
+
+
+class TestCompileSchema(unittest.TestCase):
+
+    def test_matchesMaybeChains(self):
+        extract = compile_schema(FIELDS)
+        for record in RECORDS:
+            self.assertEqual(extract(record), chain_row(record))
+
+    def test_unwrapsMaybeRecords(self):
+        extract = compile_schema(FIELDS)
+        self.assertEqual(extract(maybe(RECORDS[0])), chain_row(RECORDS[0]))
+        self.assertEqual(extract(Nothing()), chain_row(None))
+
+    def test_dictOutput(self):
+        extract = compile_schema(FIELDS, output='dict')
+        self.assertEqual(extract(RECORDS[1]),
+                         {'id': 2, 'name': 'anonymous', 'age': 0, 'first_tag': '', 'count': []})
+
+    def test_dictFields(self):
+        extract = compile_schema({'id': 'payload.user.id', 'tag': ('payload', 'tags', 1)})
+        self.assertEqual(extract(RECORDS[0]), (1, 'b'))
+        self.assertEqual(extract(RECORDS[3]), (None, None))
+
+    def test_callableDefaultIsCalledPerRow(self):
+        extract = compile_schema([('count', 'payload.count', list)])
+        first, = extract({})
+        second, = extract({})
+        self.assertEqual(first, [])
+        self.assertIsNot(first, second)
+
+    def test_converterIsSkippedForMissingValues(self):
+        extract = compile_schema([('age', 'user.age', -1, int)])
+        self.assertEqual(extract({'user': {'age': '7'}}), (7,))
+        self.assertEqual(extract({'user': {}}), (-1,))
+
+    def test_falsyValuesAreKept(self):
+        extract = compile_schema([('a', 'a', 'default'), ('b', 'b', 'default')])
+        self.assertEqual(extract({'a': 0, 'b': ''}), (0, ''))
+
+    def test_customMappingsAndSequences(self):
+        from collections import OrderedDict
+        extract = compile_schema([('x', ('a', 1, 'b'))])
+        self.assertEqual(extract(OrderedDict(a=(None, {'b': 5}))), (5,))
+        self.assertEqual(extract(OrderedDict(a=(None,))), (None,))
+
+    def test_compiledFunctionsAreCached(self):
+        self.assertIs(compile_schema(FIELDS), compile_schema(list(FIELDS)))
+        self.assertIsNot(compile_schema(FIELDS), compile_schema(FIELDS, output='dict'))
+
+    def test_equalDefaultsAndKeysOfOtherTypesAreNotShared(self):
+        for default in (0, False, 0.0):
+            result = compile_schema([('x', 'a.b', default)])({})
+            self.assertIs(result[0].__class__, default.__class__)
+
+        extract = compile_schema([('int', ('a', 1)), ('bool', ('a', True)), ('float', ('a', 1.0))])
+        self.assertEqual(extract({'a': [10, 20]}), (20, 20, None))
+
+    def test_unhashableDefaultsAreNotCached(self):
+        extract = compile_schema([('tags', 'tags', [])])
+        self.assertEqual(extract({}), ([],))
+
+    def test_invalidOutput(self):
+        with self.assertRaises(ValueError):
+            compile_schema(FIELDS, output='list')
+
+    @unittest.skipIf(np is None, 'numpy is not installed')
+    def test_numpyOutput(self):
+        extract = compile_schema([('id', 'user.id', 0), ('score', 'user.score', 0.5)],
+                                 output='numpy', dtype=[('id', 'i8'), ('score', 'f8')])
+        row = extract({'user': {'id': 3}})
+        self.assertEqual(row['id'], 3)
+        self.assertEqual(row['score'], 0.5)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+test_sorting
+----------------------------------
+
+Tests for `pymaybe.sorting` module.
+"""
+
+import bisect
+import doctest
+import heapq
+import random
+import unittest
+
+from pymaybe import maybe, maybe_sort_key, sort_maybes, Something, Nothing
+
+
+def load_tests(loader, tests, ignore):
+    import pymaybe.sorting
+    tests.addTests(doctest.DocTestSuite(pymaybe.sorting))
+    return tests
+
+
+def values(items):
+    return [item.or_none() for item in items]
+
+
+class TestMaybeSortKey(unittest.TestCase):
+
+    def setUp(self):
+        rnd = random.Random(0)
+        self.items = [maybe(rnd.randrange(50) if rnd.random() > 0.3 else None) for _ in range(500)]
+
+    def test_nothingFirstMatchesComparisonOperators(self):
+        self.assertEqual(values(sorted(self.items, key=maybe_sort_key())), values(sorted(self.items)))
+        self.assertEqual(values(sort_maybes(self.items)), values(sorted(self.items)))
+
+    def test_nothingLast(self):
+        result = values(sort_maybes(self.items, nothing='last'))
+        count = sum(1 for item in self.items if item.is_none())
+        self.assertEqual(result[len(result) - count:], [None] * count)
+        self.assertEqual(result[:len(result) - count], sorted(v for v in result if v is not None))
+
+    def test_reverseKeepsNothingPlacement(self):
+        for nothing in ('first', 'last'):
+            result = values(sort_maybes(self.items, nothing=nothing, reverse=True))
+            present = [v for v in result if v is not None]
+            self.assertEqual(present, sorted(present, reverse=True))
+            self.assertEqual(result[0] is None, nothing == 'first')
+            self.assertEqual(result[-1] is None, nothing == 'last')
+
+    def test_sortIsStable(self):
+        items = [Something(1), Nothing(), Something(1.0), Something(True)]
+        result = sort_maybes(items)
+        self.assertIs(result[0], items[1])
+        self.assertEqual([type(item.get()) for item in result[1:]], [int, float, bool])
+
+    def test_acceptsPlainValues(self):
+        key = maybe_sort_key(nothing='last')
+        self.assertEqual(sorted([3, None, 1, Something(2), Nothing()], key=key), [1, Something(2), 3, None, Nothing()])
+
+    def test_minMaxHeapqBisect(self):
+        key = maybe_sort_key()
+        self.assertEqual(min(self.items, key=key), Nothing())
+        self.assertEqual(max(self.items, key=key), max(self.items))
+        self.assertEqual(values(heapq.nsmallest(5, self.items, key=key)), values(sorted(self.items)[:5]))
+
+        keys = [key(item) for item in sort_maybes(self.items)]
+        position = bisect.bisect_left(keys, key(maybe(25)))
+        self.assertEqual(position, sum(1 for item in self.items if item < 25))
+
+    def test_invalidPlacement(self):
+        with self.assertRaises(ValueError):
+            maybe_sort_key(nothing='middle')
+        with self.assertRaises(ValueError):
+            sort_maybes([], nothing='middle', reverse=True)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,128 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+test_stream
+----------------------------------
+
+Tests for `pymaybe.stream` module.
+"""
+
+import doctest
+import itertools
+import unittest
+
+from pymaybe import maybe, MaybeStream, Something, Nothing
+
+
+def load_tests(loader, tests, ignore):
+    import pymaybe.stream
+    tests.addTests(doctest.DocTestSuite(pymaybe.stream))
+    return tests
+
+
+def half(x):
+    return x // 2 if x % 2 == 0 else None
+
+
+class TestMaybeStream(unittest.TestCase):
+
+    def test_matchesMaybeChains(self):
+        items = [0, 1, 2, None, 4, 5, Something(6), Nothing()]
+
+        def chain(x):
+            value = maybe(x)
+            return maybe(half(value.get())) if value.is_some() else value
+
+        for chunk_size in (1, 3, 256):
+            stream = MaybeStream(items, chunk_size=chunk_size).map(half)
+            self.assertEqual(stream.collect(), [chain(x) for x in items])
+            self.assertEqual(list(stream.or_else(-1)), [chain(x).or_else(-1) for x in items])
+
+    def test_isLazy(self):
+        pulled = []
+
+        def source():
+            for i in itertools.count():
+                pulled.append(i)
+                yield i
+
+        stream = MaybeStream(source(), chunk_size=10).map(lambda x: x + 1)
+        self.assertEqual(pulled, [])
+        self.assertEqual(list(stream.take(3).or_else()), [1, 2, 3])
+        self.assertEqual(pulled, [0, 1, 2])
+
+    def test_mapNeverRunsPastTake(self):
+        seen = []
+
+        def record(x):
+            seen.append(x)
+            return x
+
+        stream = MaybeStream(range(100), chunk_size=10)
+        self.assertEqual(list(stream.map(record).or_else().take(3)), [0, 1, 2])
+        self.assertEqual(seen, [0, 1, 2])
+
+        del seen[:]
+        odd = stream.filter_some(lambda x: x % 2).map(record).take(4).map(record).take(2)
+        self.assertEqual(list(odd.or_else()), [1, 3])
+        self.assertEqual(seen, [1, 3, 1, 3])
+
+        del seen[:]
+        self.assertEqual(len(stream.map(record).take(25).collect()), 25)
+        self.assertEqual(seen, list(range(25)))
+
+    def test_take(self):
+        stream = MaybeStream(range(100), chunk_size=7)
+        self.assertEqual(list(stream.take(10).or_else()), list(range(10)))
+        self.assertEqual(stream.take(0).collect(), [])
+        self.assertEqual(len(stream.take(1000).collect()), 100)
+        self.assertEqual(list(stream.filter_some(lambda x: x > 50).take(2).or_else()), [51, 52])
+        self.assertEqual(list(stream.take(5).take(3).or_else()), [0, 1, 2])
+
+    def test_filterSome(self):
+        stream = MaybeStream([1, None, 2, Nothing(), 3])
+        self.assertEqual(stream.filter_some().collect(), [1, 2, 3])
+        self.assertEqual(stream.filter_some(lambda x: x != 2).collect(), [1, 3])
+
+    def test_flatMap(self):
+        stream = MaybeStream([[1, None], None, 'ab', 5], chunk_size=2)
+        self.assertEqual(stream.flat_map(lambda x: x).collect(),
+                         [Something(1), Nothing(), Nothing(), 'a', 'b', 5])
+        self.assertEqual(stream.flat_map(lambda x: None).collect(), [Nothing()])
+
+    def test_orElse(self):
+        stream = MaybeStream([1, None, 3])
+        self.assertEqual(list(stream.or_else(0)), [1, 0, 3])
+        self.assertEqual(list(stream.or_else(list)), [1, [], 3])
+        self.assertEqual(list(stream.or_else()), [1, None, 3])
+
+    def test_stagesAfterOrElseRewrap(self):
+        stream = MaybeStream([1, None, 3]).or_else().map(lambda x: x * 2)
+        self.assertEqual(stream.collect(), [Something(2), Nothing(), Something(6)])
+        self.assertEqual(list(MaybeStream([1, None]).or_else().or_else(0)), [1, 0])
+
+    def test_batch(self):
+        stream = MaybeStream(range(10), chunk_size=3).or_else()
+        self.assertEqual(list(stream.batch(4)), [[0, 1, 2, 3], [4, 5, 6, 7], [8, 9]])
+        self.assertEqual(list(MaybeStream([]).batch(4)), [])
+        with self.assertRaises(ValueError):
+            list(stream.batch(0))
+
+    def test_chunks(self):
+        chunks = list(MaybeStream(range(7), chunk_size=3).or_else().chunks())
+        self.assertEqual(chunks, [[0, 1, 2], [3, 4, 5], [6]])
+
+    def test_immutable(self):
+        base = MaybeStream([1, 2, 3])
+        doubled = base.map(lambda x: x * 2)
+        self.assertEqual(list(base.or_else()), [1, 2, 3])
+        self.assertEqual(list(doubled.or_else()), [2, 4, 6])
+
+    def test_invalidChunkSize(self):
+        with self.assertRaises(ValueError):
+            MaybeStream([], chunk_size=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
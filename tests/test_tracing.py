@@ -0,0 +1,103 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+test_tracing
+----------------------------------
+
+Tests for `pymaybe.tracing` module.
+"""
+
+import doctest
+import gc
+import pickle
+import unittest
+import weakref
+
+from pymaybe import maybe, maybe_path, Nothing, NOTHING, Something
+from pymaybe import enable_provenance, disable_provenance, provenance
+
+
+def load_tests(loader, tests, ignore):
+    import pymaybe.tracing
+    tests.addTests(doctest.DocTestSuite(pymaybe.tracing))
+    return tests
+
+
+class Broken(object):
+    @property
+    def value(self):
+        raise ValueError('broken')
+
+
+class TestProvenance(unittest.TestCase):
+
+    def setUp(self):
+        enable_provenance()
+
+    def tearDown(self):
+        disable_provenance()
+
+    def test_disabled_returnsSharedNothing(self):
+        disable_provenance()
+        self.assertTrue(maybe({})['a'] is NOTHING)
+        self.assertTrue(maybe(object()).missing is NOTHING)
+        self.assertTrue(provenance(maybe({})['a']) is None)
+
+    def test_getItem_recordsKeyAndErrorType(self):
+        doc = maybe({'a': [1], 'n': None})
+        self.assertEqual(provenance(doc['b']), ('getitem', 'b', KeyError, None))
+        self.assertEqual(provenance(doc['n']), ('getitem', 'n', None, None))
+        self.assertEqual(provenance(doc['a'][3]), ('getitem', 3, IndexError, None))
+        self.assertEqual(provenance(doc['a']['x']), ('getitem', 'x', TypeError, None))
+
+    def test_getAttr_recordsNameAndErrorType(self):
+        self.assertEqual(provenance(maybe(Broken()).value), ('getattr', 'value', ValueError, None))
+        self.assertEqual(provenance(maybe(Broken()).other), ('getattr', 'other', None, None))
+
+    def test_firstFailureIsKeptAlongTheChain(self):
+        result = maybe({'a': {}})['a']['b']['c'].d.e()
+        self.assertEqual(provenance(result).key, 'b')
+        self.assertEqual(result.or_else('default'), 'default')
+
+    def test_maybePath_recordsHop(self):
+        result = maybe_path('a.b.c')({'a': {'b': {}}})
+        self.assertEqual(provenance(result), ('path', 'c', None, 2))
+
+    def test_tracedNothing_behavesLikeNothing(self):
+        traced = maybe({})['a']
+        self.assertIsInstance(traced, Nothing)
+        self.assertTrue(traced.is_none())
+        self.assertEqual(traced, NOTHING)
+        self.assertEqual(NOTHING, traced)
+        self.assertEqual(traced, None)
+        self.assertTrue(traced < Something(1))
+        self.assertFalse(Something(1) < traced)
+        self.assertEqual(repr(traced), 'Nothing')
+        self.assertTrue(pickle.loads(pickle.dumps(traced)) is NOTHING)
+
+    def test_doesNotRetainExceptionsOrFrames(self):
+        class Marker(object):
+            pass
+
+        class Holder(object):
+            def __init__(self):
+                self.marker = Marker()
+
+            @property
+            def value(self):
+                local = self.marker  # noqa: F841
+                raise ValueError('broken')
+
+        # Only the frame of the failed lookup could keep the marker alive.
+        holder = Holder()
+        ref = weakref.ref(holder.marker)
+        result = maybe(holder).value
+        del holder
+        gc.collect()
+        self.assertTrue(ref() is None)
+        self.assertEqual(provenance(result).exception, ValueError)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,139 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+test_vectorized
+----------------------------------
+
+Tests for `pymaybe.vectorized` module.
+"""
+
+import doctest
+import unittest
+
+from pymaybe import maybe, MaybeArray, Something, Nothing, NothingValueError
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def load_tests(loader, tests, ignore):
+    if np is not None:
+        import pymaybe.vectorized
+        tests.addTests(doctest.DocTestSuite(pymaybe.vectorized))
+    return tests
+
+
+@unittest.skipIf(np is None, 'numpy is not installed')
+class TestMaybeArray(unittest.TestCase):
+
+    def setUp(self):
+        self.a = MaybeArray([1, None, 3, maybe(None), maybe(5)])
+        self.b = MaybeArray([2, 2, None, 2, 2])
+
+    def test_construction_buildsMask(self):
+        self.assertEqual(self.a.mask.tolist(), [True, False, True, False, True])
+        self.assertEqual(self.a.values.tolist(), [1, 0, 3, 0, 5])
+        self.assertTrue(MaybeArray(np.arange(3)).mask.all())
+
+    def test_getItem_returnsMaybes(self):
+        self.assertIsInstance(self.a[0], Something)
+        self.assertEqual(self.a[0], 1)
+        self.assertIsInstance(self.a[1], Nothing)
+        self.assertIsInstance(self.a[1:3], MaybeArray)
+        self.assertEqual(list(self.a), [1, Nothing(), 3, Nothing(), 5])
+
+    def test_arithmetic_matchesSomething(self):
+        for op in (lambda x, y: x + y, lambda x, y: x - y, lambda x, y: x * y,
+                   lambda x, y: x // y, lambda x, y: x % y, lambda x, y: x ** y,
+                   lambda x, y: x << y, lambda x, y: x & y, lambda x, y: x | y,
+                   lambda x, y: x ^ y):
+            result = op(self.a, 2)
+            self.assertEqual(result.mask.tolist(), self.a.mask.tolist())
+            self.assertEqual([r for r, m in zip(result.values.tolist(), result.mask) if m],
+                             [op(maybe(v), 2).get() for v in (1, 3, 5)])
+
+            reflected = op(2, self.a)
+            self.assertEqual([r for r, m in zip(reflected.values.tolist(), reflected.mask) if m],
+                             [op(2, maybe(v)).get() for v in (1, 3, 5)])
+
+    def test_arithmetic_absentPropagates(self):
+        result = self.a + self.b
+        self.assertEqual(result.mask.tolist(), [True, False, False, False, True])
+        self.assertEqual(result.or_else(-1).tolist(), [3, -1, -1, -1, 7])
+        self.assertFalse((self.a + Nothing()).mask.any())
+        self.assertEqual((self.a * Something(2)).or_else(0).tolist(), [2, 0, 6, 0, 10])
+
+    def test_divisionByZero_raisesLikeSomething(self):
+        self.assertRaises(ZeroDivisionError, lambda: maybe(5) // 0)
+        self.assertRaises(ZeroDivisionError, lambda: maybe(5) % 0)
+        for op in (lambda x, y: x // y, lambda x, y: x / y, lambda x, y: x % y):
+            self.assertRaises(ZeroDivisionError, op, self.a, 0)
+            self.assertRaises(ZeroDivisionError, op, 1, MaybeArray([0, None]))
+            self.assertRaises(ZeroDivisionError, op, self.a, MaybeArray([0, 1, 1, 1, 1]))
+
+            # Zero divisors in absent positions are fine.
+            result = op(self.a, MaybeArray([1, 0, 1, None, 1]))
+            self.assertEqual(result.mask.tolist(), [True, False, True, False, True])
+            self.assertEqual(op(2, self.a).mask.tolist(), self.a.mask.tolist())
+
+    def test_fill_followsDtype(self):
+        self.assertEqual(MaybeArray(['x', None]).values.tolist(), ['x', ''])
+        self.assertEqual(MaybeArray(['x', None]).or_none().tolist(), ['x', None])
+        self.assertEqual(MaybeArray([1.5, None]).values.dtype, np.float64)
+        self.assertEqual(MaybeArray([True, None]).values.dtype, np.bool_)
+        self.assertEqual(MaybeArray([1, None], dtype='f4').values.dtype, np.float32)
+        self.assertEqual(MaybeArray([1, None], fill=-1).values.tolist(), [1, -1])
+
+    def test_comparisons_matchScalarSemantics(self):
+        left = [maybe(1), Nothing(), maybe(3), Nothing(), maybe(5)]
+        right = [maybe(2), maybe(2), Nothing(), maybe(2), maybe(2)]
+        for name in ('__eq__', '__ne__', '__lt__', '__gt__', '__le__', '__ge__'):
+            expected = [getattr(x, name)(y) for x, y in zip(left, right)]
+            self.assertEqual(getattr(self.a, name)(self.b).tolist(), expected, name)
+
+            expected = [getattr(x, name)(2) for x in left]
+            self.assertEqual(getattr(self.a, name)(2).tolist(), expected, name)
+
+    def test_nothingOperand_onStrings(self):
+        words = MaybeArray(['x', None, 'z'])
+        left = [maybe('x'), Nothing(), maybe('z')]
+        for name in ('__eq__', '__ne__', '__lt__', '__gt__', '__le__', '__ge__'):
+            expected = [getattr(x, name)(Nothing()) for x in left]
+            self.assertEqual(getattr(words, name)(Nothing()).tolist(), expected, name)
+            self.assertEqual(getattr(words, name)(None).tolist(), expected, name)
+
+        self.assertFalse((words + Nothing()).mask.any())
+        self.assertFalse((Nothing() + words).mask.any())
+        self.assertEqual((words + None).or_none().tolist(), [None, None, None])
+
+    def test_orElse(self):
+        self.assertEqual(self.a.or_else(0).tolist(), [1, 0, 3, 0, 5])
+        self.assertEqual(self.a.or_else(lambda: 9).tolist(), [1, 9, 3, 9, 5])
+        self.assertEqual(self.a.or_none().tolist(), [1, None, 3, None, 5])
+
+    def test_get_raisesWhenAnyAbsent(self):
+        self.assertRaises(NothingValueError, self.a.get)
+        self.assertEqual(MaybeArray([1, 2]).get().tolist(), [1, 2])
+
+
+@unittest.skipIf(np is None, 'numpy is not installed')
+class TestPickleNumpy(unittest.TestCase):
+
+    def test_something_ndarray_outOfBand(self):
+        import pickle
+
+        values = np.arange(4096, dtype='f8')
+        buffers = []
+        payload = pickle.dumps(Something(values), 5, buffer_callback=buffers.append)
+        self.assertEqual(len(buffers), 1)
+        self.assertLess(len(payload), 1024)
+
+        result = pickle.loads(payload, buffers=buffers).get()
+        self.assertTrue(np.shares_memory(result, values))
+
+
+if __name__ == '__main__':
+    unittest.main()